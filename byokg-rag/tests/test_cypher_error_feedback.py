@@ -1,6 +1,7 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
 
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 import pytest
@@ -39,49 +40,56 @@ class TestGraphQueryRetrieverErrorFeedback:
         assert "Error" not in context[0]
 
 
-class TestCypherRetryFeedback:
-    def _make_engine(self, retrieve_fn):
-        from graphrag_toolkit.byokg_rag.byokg_query_engine import ByoKGQueryEngine
+@pytest.fixture
+def cypher_engine():
+    """A ByoKGQueryEngine wired to plain SimpleNamespace fakes.
 
-        linker = MagicMock()
-        linker.task_prompts = ""
-        linker.is_cypher_linker.return_value = True
+    Tests assign ``executor.retrieve`` and the linker's ``generate_response`` /
+    ``parse_response`` per case; SimpleNamespace avoids the cost of building
+    MagicMocks for attributes the engine never touches.
+    """
+    from graphrag_toolkit.byokg_rag.byokg_query_engine import ByoKGQueryEngine
 
-        executor = MagicMock()
-        executor.retrieve.side_effect = retrieve_fn
+    linker = SimpleNamespace(
+        task_prompts="",
+        is_cypher_linker=lambda: True,
+        generate_response=None,
+        parse_response=None,
+    )
+    executor = SimpleNamespace(retrieve=None)
 
-        engine = object.__new__(ByoKGQueryEngine)
-        engine.cypher_kg_linker = linker
-        engine.kg_linker = None
-        engine.graph_query_executor = executor
-        engine.schema = "(:Person)-[:KNOWS]->(:Person)"
-        engine.direct_query_linking = False
-        engine.entity_linker = None
-        engine.triplet_retriever = None
-        engine.path_retriever = None
-        return engine, linker
+    engine = object.__new__(ByoKGQueryEngine)
+    engine.cypher_kg_linker = linker
+    engine.kg_linker = None
+    engine.graph_query_executor = executor
+    engine.schema = "(:Person)-[:KNOWS]->(:Person)"
+    engine.direct_query_linking = False
+    engine.entity_linker = None
+    engine.triplet_retriever = None
+    engine.path_retriever = None
+    return engine, linker, executor
 
-    @pytest.mark.parametrize("tag", ["opencypher", "opencypher-linking"])
-    def test_error_gets_error_specific_feedback(self, tag):
-        def fake(query, return_answers=False):
-            return [f"Error executing query: {query}\nError: SyntaxError: bad"], []
 
-        engine, linker = self._make_engine(fake)
-        linker.generate_response.return_value = f"<{tag}>MATCH (n) RETURN m</{tag}>"
-        linker.parse_response.return_value = {tag: ["MATCH (n) RETURN m"]}
+class TestCypherRetryFeedback:
+    @pytest.mark.parametrize("tag", ["opencypher", "opencypher-linking"])
+    def test_error_gets_error_specific_feedback(self, cypher_engine, tag):
+        engine, linker, executor = cypher_engine
+        executor.retrieve = lambda query, return_answers=False: (
+            [f"Error executing query: {query}\nError: SyntaxError: bad"], []
+        )
+        linker.generate_response = lambda **kwargs: f"<{tag}>MATCH (n) RETURN m</{tag}>"
+        linker.parse_response = lambda response: {tag: ["MATCH (n) RETURN m"]}
 
         feedback = "\n".join(engine.query("test?", cypher_iterations=1))
         assert "review the error message" in feedback
 
-    def test_empty_results_gets_generic_feedback(self):
-        def fake(query, return_answers=False):
-            return [f"Graph Query: {query}\nExecution Result: []"], []
-
-        engine, linker = self._make_engine(fake)
-        linker.generate_response.return_value = (
-            "<opencypher>MATCH (n) RETURN n</opencypher>"
+    def test_empty_results_gets_generic_feedback(self, cypher_engine):
+        engine, linker, executor = cypher_engine
+        executor.retrieve = lambda query, return_answers=False: (
+            [f"Graph Query: {query}\nExecution Result: []"], []
         )
-        linker.parse_response.return_value = {"opencypher": ["MATCH (n) RETURN n"]}
+        linker.generate_response = lambda **kwargs: "<opencypher>MATCH (n) RETURN n</opencypher>"
+        linker.parse_response = lambda response: {"opencypher": ["MATCH (n) RETURN n"]}
 
         feedback = "\n".join(engine.query("test?", cypher_iterations=1))
         assert "focusing more on the given schema" in feedback
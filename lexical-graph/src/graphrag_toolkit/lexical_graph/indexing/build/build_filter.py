@@ -96,7 +96,7 @@ class BuildFilter():
         """
         result = self.topic_filter_fn(topic)
         if result:
-            logger.debug(f'Ignore topic: {topic}')
+            logger.debug('Ignore topic: %s', topic)
         return result
 
     def ignore_statement(self, statement: str) -> bool:
@@ -113,7 +113,7 @@ class BuildFilter():
         """
         result = self.statement_filter_fn(statement)
         if result:
-            logger.debug(f'Ignore statement: {statement}')
+            logger.debug('Ignore statement: %s', statement)
         return result
 
     def format_metadata(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
@@ -78,7 +78,7 @@ class BuildFilters(BaseModel):
         """
         result = self.topic_filter_fn(topic)
         if result:
-            logger.debug(f'Ignore topic: {topic}')
+            logger.debug('Ignore topic: %s', topic)
         return result
     
     def ignore_statement(self, statement:str) -> bool:
@@ -98,7 +98,7 @@ class BuildFilters(BaseModel):
         """
         result = self.statement_filter_fn(statement)
         if result:
-            logger.debug(f'Ignore statement: {statement}')
+            logger.debug('Ignore statement: %s', statement)
         return result
     
     def filter_source_metadata_dictionary(self, d:Dict[str, Any]) -> bool:
@@ -55,7 +55,7 @@ class ChunkGraphBuilder(GraphBuilder):
         
         if chunk_id:
 
-            logger.debug(f'Inserting chunk [chunk_id: {chunk_id}]')
+            logger.debug('Inserting chunk [chunk_id: %s]', chunk_id)
 
             statements_c = [
                 '// insert chunks',
@@ -2,14 +2,14 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import logging
-from typing import Any
+from typing import Any, Dict, List
 
-from graphrag_toolkit.lexical_graph.indexing.model import Fact, Entity
+from graphrag_toolkit.lexical_graph.indexing.model import Entity
 from graphrag_toolkit.lexical_graph.storage.graph import GraphStore
-from graphrag_toolkit.lexical_graph.storage.graph.graph_utils import search_string_from, label_from, new_query_var, escape_cypher_label
+from graphrag_toolkit.lexical_graph.storage.graph.graph_utils import search_string_from, label_from, escape_cypher_label
 from graphrag_toolkit.lexical_graph.indexing.build.graph_builder import GraphBuilder
 from graphrag_toolkit.lexical_graph.indexing.constants import DEFAULT_CLASSIFICATION, LOCAL_ENTITY_CLASSIFICATION
-from graphrag_toolkit.lexical_graph.indexing.utils.fact_utils import string_complement_to_entity
+from graphrag_toolkit.lexical_graph.indexing.utils.fact_utils import fact_from_node
 
 from llama_index.core.schema import BaseNode
 
@@ -48,14 +48,8 @@ class EntityGraphBuilder(GraphBuilder):
         """
         Processes a given node and builds the corresponding entities in the graph database.
 
-        This method extracts fact metadata from the provided node to construct nodes and
-        relationships in a graph database using Cypher queries. It validates the fact
-        metadata and leverages the graph_client to execute the queries. Properties for
-        the subject and object are set or updated based on whether they already exist in
-        the graph. Optionally, domain-specific labels can be included.
-
-        The function handles missing fact metadata by logging a warning message. It also
-        ensures reliability through query retries with controlled attempts and wait times.
+        Delegates to `build_batch` with a single-node batch, so the single-node and
+        batched code paths emit the same parameterised queries.
 
         Args:
             node (BaseNode): The node from which fact metadata is to be extracted.
@@ -63,77 +57,109 @@ class EntityGraphBuilder(GraphBuilder):
             **kwargs (Any): Additional options, such as `include_domain_labels`, which
                 determines whether domain-specific labels are added to the entities.
         """
-        fact_metadata = node.metadata.get('fact', {})
+        self.build_batch([node], graph_client, **kwargs)
+
+    def build_batch(self, nodes:List[BaseNode], graph_client: GraphStore, **kwargs:Any):
+        """
+        Processes a batch of fact nodes and builds the corresponding entities in the graph database.
+
+        All facts in the batch are validated up front, and their entities collected into a
+        single parameter list that is written with one `UNWIND $params` query. Domain labels
+        cannot be parameterised in Cypher, so label writes are bucketed by label and each
+        distinct label is written with one `UNWIND $params` query. A batch of N facts therefore
+        costs one round trip for the entities plus one per distinct label, rather than up to
+        four round trips per fact.
+
+        Labels are escaped with `escape_cypher_label` (`label_from` passes `__...__` values
+        through unescaped), and entity ids are always bound as parameters, never inlined.
+
+        Args:
+            nodes (List[BaseNode]): The nodes from which fact metadata is to be extracted.
+            graph_client (GraphStore): The graph database client to execute queries.
+            **kwargs (Any): Additional options, such as `include_domain_labels`, which
+                determines whether domain-specific labels are added to the entities.
+        """
         include_domain_labels = kwargs['include_domain_labels']
         include_local_entities = kwargs['include_local_entities']
 
-        if fact_metadata:
+        entity_params = []
+        label_params:Dict[str, List[Dict[str, Any]]] = {}
+
+        def add_entity(entity:Entity):
+            entity_params.append({
+                'e_id': entity.entityId,
+                'v': entity.value,
+                'e_search_str': search_string_from(entity.value),
+                'ec': entity.classification or DEFAULT_CLASSIFICATION
+            })
+
+        escaped_labels:Dict[str, str] = {}
+
+        def add_domain_label(entity:Entity):
+            if entity.classification and entity.classification == LOCAL_ENTITY_CLASSIFICATION:
+                return
+            classification = entity.classification or DEFAULT_CLASSIFICATION
+            e_label = escaped_labels.get(classification)
+            if e_label is None:
+                e_label = escape_cypher_label(label_from(classification))
+                escaped_labels[classification] = e_label
+            label_params.setdefault(e_label, []).append({'e_id': entity.entityId})
 
-            fact = Fact.model_validate(fact_metadata)
-            fact = string_complement_to_entity(fact)
+        for node in nodes:
+
+            fact_metadata = node.metadata.get('fact', {})
+
+            if not fact_metadata:
+                logger.warning(f'fact_id missing from fact node [node_id: {node.node_id}]')
+                continue
+
+            fact = fact_from_node(node, **kwargs)
 
             if fact.subject.classification == LOCAL_ENTITY_CLASSIFICATION:
                 if not include_local_entities:
-                    logger.debug(f'Ignoring local entities for fact [fact_id: {fact.factId}]')
-                    return
-        
-            logger.debug(f'Inserting entities for fact [fact_id: {fact.factId}]')
-
-            def insert_for_entity(entity:Entity):
-
-                statements = [
-                    '// insert entities',
-                    'UNWIND $params AS params',
-                    f'MERGE (entity:`__Entity__`{{{graph_client.node_id("entityId")}: params.e_id}})',
-                    'ON CREATE SET entity.value = params.v, entity.search_str = params.e_search_str, entity.class = params.ec',
-                    'ON MATCH SET entity.value = params.v, entity.search_str = params.e_search_str, entity.class = params.ec'
-                ]
-
-                properties = {
-                    'e_id': entity.entityId,
-                    'v': entity.value,
-                    'e_search_str': search_string_from(entity.value),
-                    'ec': entity.classification or DEFAULT_CLASSIFICATION
-                }
-
-                query = '\n'.join(statements)
-                
-                graph_client.execute_query_with_retry(query, self._to_params(properties), max_attempts=5, max_wait=7)
-
-            insert_for_entity(fact.subject)
-
-            if fact.object and fact.object.entityId != fact.subject.entityId:
-                insert_for_entity(fact.object)
-            elif include_local_entities and fact.complement and fact.complement.entityId != fact.subject.entityId:
-                insert_for_entity(fact.complement)
+                    logger.debug('Ignoring local entities for fact [fact_id: %s]', fact.factId)
+                    continue
+
+            logger.debug('Inserting entities for fact [fact_id: %s]', fact.factId)
+
+            s_id = fact.subject.entityId
+            obj = fact.object if fact.object and fact.object.entityId != s_id else None
+            complement = fact.complement if include_local_entities and fact.complement and fact.complement.entityId != s_id else None
+
+            add_entity(fact.subject)
+
+            other = obj or complement
+            if other:
+                add_entity(other)
 
             if include_domain_labels:
+                for entity in (fact.subject, obj, complement):
+                    if entity:
+                        add_domain_label(entity)
+
+        if entity_params:
+
+            statements = [
+                '// insert entities',
+                'UNWIND $params AS params',
+                f'MERGE (entity:`__Entity__`{{{graph_client.node_id("entityId")}: params.e_id}})',
+                'ON CREATE SET entity.value = params.v, entity.search_str = params.e_search_str, entity.class = params.ec',
+                'ON MATCH SET entity.value = params.v, entity.search_str = params.e_search_str, entity.class = params.ec'
+            ]
+
+            query = '\n'.join(statements)
+
+            graph_client.execute_query_with_retry(query, {'params': entity_params}, max_attempts=5, max_wait=7)
+
+        for e_label, params in label_params.items():
+
+            statements = [
+                '// insert entity domain labels',
+                'UNWIND $params AS params',
+                f'MERGE (entity:`__Entity__`{{{graph_client.node_id("entityId")}: params.e_id}})',
+                f'SET entity :`{e_label}`'
+            ]
+
+            query = '\n'.join(statements)
 
-                def insert_domain_entity(entity:Entity):
-                    """Add the entity's domain label to the `__Entity__` node.
-
-                    `label_from` passes `__...__` values through unescaped, so the
-                    label is escaped, the entity id is bound as a parameter (not
-                    inlined), and newlines are stripped from the `//` comment so a
-                    crafted label cannot terminate it and append further Cypher.
-                    """
-                    if entity.classification and entity.classification == LOCAL_ENTITY_CLASSIFICATION:
-                        return
-
-                    e_var = new_query_var()
-                    e_id = entity.entityId
-                    e_label = escape_cypher_label(label_from(entity.classification or DEFAULT_CLASSIFICATION))
-                    e_comment = f'// awsqid:{e_id}-{e_label}'.replace('\r', ' ').replace('\n', ' ')
-                    query_e = f"MERGE ({e_var}:`__Entity__`{{{graph_client.node_id('entityId')}: $entityId}}) SET {e_var} :`{e_label}` {e_comment}"
-                    graph_client.execute_query_with_retry(query_e, {'entityId': e_id}, max_attempts=5, max_wait=7)
-
-                insert_domain_entity(fact.subject)
-
-                if fact.object and fact.object.entityId != fact.subject.entityId:
-                    insert_domain_entity(fact.object)
-
-                if include_local_entities and fact.complement and fact.complement.entityId != fact.subject.entityId:
-                    insert_domain_entity(fact.complement)
-                    
-        else:
-            logger.warning(f'fact_id missing from fact node [node_id: {node.node_id}]')
\ No newline at end of file
+            graph_client.execute_query_with_retry(query, {'params': params}, max_attempts=5, max_wait=7)
@@ -4,11 +4,10 @@
 import logging
 from typing import Any
 
-from graphrag_toolkit.lexical_graph.indexing.model import Fact
 from graphrag_toolkit.lexical_graph.storage.graph import GraphStore
 from graphrag_toolkit.lexical_graph.storage.graph.graph_utils import relationship_name_from, new_query_var
 from graphrag_toolkit.lexical_graph.indexing.build.graph_builder import GraphBuilder
-from graphrag_toolkit.lexical_graph.indexing.utils.fact_utils import string_complement_to_entity
+from graphrag_toolkit.lexical_graph.indexing.utils.fact_utils import fact_from_node
 from graphrag_toolkit.lexical_graph.indexing.constants import LOCAL_ENTITY_CLASSIFICATION
 
 from llama_index.core.schema import BaseNode
@@ -58,17 +57,16 @@ class EntityRelationGraphBuilder(GraphBuilder):
 
         if fact_metadata:
 
-            fact = Fact.model_validate(fact_metadata)
-            fact = string_complement_to_entity(fact)
+            fact = fact_from_node(node, **kwargs)
 
             if fact.subject.classification and fact.subject.classification == LOCAL_ENTITY_CLASSIFICATION:
                 if not include_local_entities:
-                    logger.debug(f'Ignoring local entity relations for fact [fact_id: {fact.factId}]')
+                    logger.debug('Ignoring local entity relations for fact [fact_id: %s]', fact.factId)
                     return
 
             if fact.subject and fact.object:
         
-                logger.debug(f'Inserting entity SPO relations for fact [fact_id: {fact.factId}]')
+                logger.debug('Inserting entity SPO relations for fact [fact_id: %s]', fact.factId)
 
                 statements = [
                     '// insert entity SPO relations',
@@ -115,7 +113,7 @@ class EntityRelationGraphBuilder(GraphBuilder):
             
             elif include_local_entities and fact.subject and fact.complement:
         
-                logger.debug(f'Inserting entity SPC relations for fact [fact_id: {fact.factId}]')
+                logger.debug('Inserting entity SPC relations for fact [fact_id: %s]', fact.factId)
 
                 statements = [
                     '// insert entity SPC relations',
@@ -162,7 +160,7 @@ class EntityRelationGraphBuilder(GraphBuilder):
                 #     graph_client.execute_query_with_retry(query_r, {}, max_attempts=5, max_wait=7)
 
             else:
-                logger.debug(f'Neither an SPO nor SPC fact, so not creating relation [fact_id: {fact.factId}]')
+                logger.debug('Neither an SPO nor SPC fact, so not creating relation [fact_id: %s]', fact.factId)
            
 
         else:
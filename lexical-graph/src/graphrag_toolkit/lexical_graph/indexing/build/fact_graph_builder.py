@@ -4,11 +4,10 @@
 import logging
 from typing import Any, Optional
 
-from graphrag_toolkit.lexical_graph.indexing.model import Fact
 from graphrag_toolkit.lexical_graph.storage.graph import GraphStore, Query, QueryTree
 from graphrag_toolkit.lexical_graph.indexing.build.graph_builder import GraphBuilder
 from graphrag_toolkit.lexical_graph.indexing.constants import LOCAL_ENTITY_CLASSIFICATION
-from graphrag_toolkit.lexical_graph.indexing.utils.fact_utils import string_complement_to_entity
+from graphrag_toolkit.lexical_graph.indexing.utils.fact_utils import fact_from_node
 
 from llama_index.core.schema import BaseNode
 
@@ -67,10 +66,9 @@ class FactGraphBuilder(GraphBuilder):
         
         if fact_metadata:
 
-            fact = Fact.model_validate(fact_metadata)
-            fact = string_complement_to_entity(fact)
+            fact = fact_from_node(node, **kwargs)
         
-            logger.debug(f'Inserting fact [fact_id: {fact.factId}]')
+            logger.debug('Inserting fact [fact_id: %s]', fact.factId)
 
             statements = [
                 '// insert facts',
@@ -190,7 +190,7 @@ class GraphBatchClient():
             try:
                 self.graph_client.execute_query_with_retry(query, params, max_attempts=BATCH_MAX_ATTEMPTS, max_wait=BATCH_MAX_WAIT)
             except Exception as e:
-                logger.debug(f'Batch failed - queuing for retry: [query: {query}, params: {params}]')
+                logger.debug('Batch failed - queuing for retry: [query: %s, params: %s]', query, params)
                 retry_batches.append((query, params))
 
         failed_batches = []
@@ -199,7 +199,7 @@ class GraphBatchClient():
             try:
                 self.graph_client.execute_query_with_retry(query, params, max_attempts=BATCH_MAX_ATTEMPTS, max_wait=BATCH_MAX_WAIT)
             except Exception as e:
-                logger.debug(f'Retry batch failed - queuing for return: [query: {query}, params: {params}]')
+                logger.debug('Retry batch failed - queuing for return: [query: %s, params: %s]', query, params)
                 failed_batches.append((query, params))
 
         return failed_batches
@@ -212,7 +212,7 @@ class GraphBatchClient():
             try:
                 self.graph_client.execute_query_with_retry(query, params, max_attempts=BATCH_MAX_ATTEMPTS, max_wait=BATCH_MAX_WAIT)
             except Exception as e:
-                logger.debug(f'Retry failed batch failed - queuing for individual writes retry: [query: {query}, params: {params}]')
+                logger.debug('Retry failed batch failed - queuing for individual writes retry: [query: %s, params: %s]', query, params)
                 last_chance_batches.append((query, params))
 
         for (query, params) in last_chance_batches:
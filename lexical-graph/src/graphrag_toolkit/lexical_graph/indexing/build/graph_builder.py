@@ -2,7 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import abc
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 from graphrag_toolkit.lexical_graph.storage.graph import GraphStore
 
@@ -65,4 +65,23 @@ class GraphBuilder(BaseComponent):
             **kwargs: Arbitrary additional arguments that may be required for the
                 build operation specific to the implementation.
         """
-        pass
\ No newline at end of file
+        pass
+
+    def build_batch(self, nodes:List[BaseNode], graph_client: GraphStore, **kwargs:Any):
+        """
+        Builds a batch of nodes that share this builder's index key.
+
+        The default implementation calls `build` for each node in turn. Builders
+        that can amortize round trips across many nodes (for example, by emitting
+        a single `UNWIND $params` query for the whole batch) should override it.
+
+        Args:
+            nodes: The nodes, all of type BaseNode, on which the build operation
+                is performed.
+            graph_client: The graph storage client of type GraphStore responsible
+                for managing graph operations.
+            **kwargs: Arbitrary additional arguments that may be required for the
+                build operation specific to the implementation.
+        """
+        for node in nodes:
+            self.build(node, graph_client, **kwargs)
\ No newline at end of file
@@ -3,7 +3,7 @@
 
 import logging
 from tqdm import tqdm
-from typing import Any, List, Union
+from typing import Any, Dict, List, Optional, Union
 
 from graphrag_toolkit.lexical_graph.indexing.build.graph_builder import GraphBuilder
 from graphrag_toolkit.lexical_graph.indexing.node_handler import NodeHandler
@@ -11,6 +11,7 @@ from graphrag_toolkit.lexical_graph.indexing.build.graph_batch_client import Gra
 from graphrag_toolkit.lexical_graph.storage.graph import GraphStore
 from graphrag_toolkit.lexical_graph.storage.graph_store_factory import GraphStoreFactory
 from graphrag_toolkit.lexical_graph.storage.constants import INDEX_KEY 
+from graphrag_toolkit.lexical_graph.indexing.utils.fact_utils import facts_from_nodes
 from graphrag_toolkit.lexical_graph.indexing.build.source_graph_builder import SourceGraphBuilder
 from graphrag_toolkit.lexical_graph.indexing.build.chunk_graph_builder import ChunkGraphBuilder
 from graphrag_toolkit.lexical_graph.indexing.build.topic_graph_builder import TopicGraphBuilder
@@ -98,12 +99,55 @@ class GraphConstruction(NodeHandler):
         default_factory=default_builders
     )
 
+    def _build_run(self, index:Optional[str], nodes:List[BaseNode], builders_dict:Dict[str, List[GraphBuilder]], batch_client:GraphBatchClient, **kwargs:Any):
+        """
+        Builds a run of consecutive nodes that share the same index, passing the whole
+        run to each builder's `build_batch` so that builders can amortize round trips
+        across nodes, and then yields the nodes that are ready to be yielded. Fact
+        metadata is validated once per node and passed to the builders as `facts`.
+
+        Args:
+            index (Optional[str]): The index shared by the nodes in the run, or None if
+                the nodes have no index metadata.
+            nodes (List[BaseNode]): The run of nodes to build.
+            builders_dict (Dict[str, List[GraphBuilder]]): Builders keyed by index.
+            batch_client (GraphBatchClient): The batch client passed to the builders.
+            **kwargs: Keyword arguments passed to the builders.
+
+        Yields:
+            BaseNode: Nodes that have been processed and are not held back for batch writes.
+        """
+        if index is None:
+            for node in nodes:
+                logger.debug('Ignoring node [node_id: %s]', node.node_id)
+        else:
+            try:
+                builders = builders_dict.get(index, None)
+
+                if builders:
+                    # Validate each node's fact metadata once, rather than once per builder
+                    facts = facts_from_nodes(nodes)
+                    for builder in builders:
+                        builder.build_batch(nodes, batch_client, **{**kwargs, 'facts': facts})
+                else:
+                    logger.debug('No builders for node [index: %s]', index)
+
+            except Exception as e:
+                logger.exception('An error occurred while building the graph')
+                raise e
+
+        for node in nodes:
+            if batch_client.allow_yield(node):
+                yield node
+
     def accept(self, nodes: List[BaseNode], **kwargs: Any):
         """
         Processes a list of nodes to construct a graph by utilizing builders with the
         specified configurations, such as batch writes. Nodes can be processed with or
         without progress visualization, and operations are applied in batches as per
-        given configurations.
+        given configurations. Consecutive nodes that share the same index are passed
+        to each builder's `build_batch` together, in runs of at most `batch_write_size`
+        nodes.
 
         Args:
             nodes: A list of BaseNode objects to be processed and incorporated into the
@@ -135,39 +179,29 @@ class GraphConstruction(NodeHandler):
         batch_writes_enabled = kwargs.pop('batch_writes_enabled')
         batch_write_size = kwargs.pop('batch_write_size')
         
-        logger.debug(f'Batch config: [batch_writes_enabled: {batch_writes_enabled}, batch_write_size: {batch_write_size}]')
-        logger.debug(f'Graph construction kwargs: {kwargs}')
+        logger.debug('Batch config: [batch_writes_enabled: %s, batch_write_size: %s]', batch_writes_enabled, batch_write_size)
+        logger.debug('Graph construction kwargs: %s', kwargs)
 
         with GraphBatchClient(self.graph_client, batch_writes_enabled=batch_writes_enabled, batch_write_size=batch_write_size) as batch_client:
         
             node_iterable = nodes if not self.show_progress else tqdm(nodes, desc=f'Building graph [batch_writes_enabled: {batch_writes_enabled}, batch_write_size: {batch_write_size}]')
 
+            run_index = None
+            run_nodes:List[BaseNode] = []
+
             for node in node_iterable:
 
-                node_id = node.node_id
-                
-                if [key for key in [INDEX_KEY] if key in node.metadata]:
-                    
-                    try:
-                    
-                        index = node.metadata[INDEX_KEY]['index']
-                        builders = builders_dict.get(index, None)
-
-                        if builders:
-                            for builder in builders:
-                                builder.build(node, batch_client, **kwargs)
-                        else:
-                            logger.debug(f'No builders for node [index: {index}]')
-
-                    except Exception as e:
-                        logger.exception('An error occurred while building the graph')
-                        raise e
-                        
-                else:
-                    logger.debug(f'Ignoring node [node_id: {node_id}]')
-                    
-                if batch_client.allow_yield(node):
-                    yield node
+                index = node.metadata[INDEX_KEY]['index'] if INDEX_KEY in node.metadata else None
+
+                if run_nodes and (index != run_index or len(run_nodes) >= batch_write_size):
+                    yield from self._build_run(run_index, run_nodes, builders_dict, batch_client, **kwargs)
+                    run_nodes = []
+
+                run_index = index
+                run_nodes.append(node)
+
+            if run_nodes:
+                yield from self._build_run(run_index, run_nodes, builders_dict, batch_client, **kwargs)
 
             batch_nodes = batch_client.apply_batch_operations()
             for node in batch_nodes:
@@ -4,12 +4,11 @@
 import logging
 from typing import Any
 
-from graphrag_toolkit.lexical_graph.indexing.model import Fact
 from graphrag_toolkit.lexical_graph.storage.graph import GraphStore
 from graphrag_toolkit.lexical_graph.storage.graph.graph_utils import label_from, relationship_name_from
 from graphrag_toolkit.lexical_graph.indexing.build.graph_builder import GraphBuilder
 from graphrag_toolkit.lexical_graph.indexing.constants import DEFAULT_CLASSIFICATION, LOCAL_ENTITY_CLASSIFICATION
-from graphrag_toolkit.lexical_graph.indexing.utils.fact_utils import string_complement_to_entity
+from graphrag_toolkit.lexical_graph.indexing.utils.fact_utils import fact_from_node
 
 from llama_index.core.schema import BaseNode
 
@@ -64,12 +63,11 @@ class GraphSummaryBuilder(GraphBuilder):
         
         if fact_metadata:
 
-            fact = Fact.model_validate(fact_metadata)
-            fact = string_complement_to_entity(fact)
+            fact = fact_from_node(node, **kwargs)
 
             if fact.subject.classification and fact.subject.classification == LOCAL_ENTITY_CLASSIFICATION:
                 if not include_local_entities:
-                    logger.debug(f'Ignoring local entity relations for graph summary [fact_id: {fact.factId}]')
+                    logger.debug('Ignoring local entity relations for graph summary [fact_id: %s]', fact.factId)
                     return
 
             if fact.subject and fact.object:
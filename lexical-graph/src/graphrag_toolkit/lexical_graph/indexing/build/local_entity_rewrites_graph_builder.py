@@ -4,10 +4,9 @@
 import logging
 from typing import Any
 
-from graphrag_toolkit.lexical_graph.indexing.model import Fact
 from graphrag_toolkit.lexical_graph.storage.graph import GraphStore, Query, QueryTree
 from graphrag_toolkit.lexical_graph.indexing.build.graph_builder import GraphBuilder
-from graphrag_toolkit.lexical_graph.indexing.utils.fact_utils import string_complement_to_entity
+from graphrag_toolkit.lexical_graph.indexing.utils.fact_utils import fact_from_node
 from graphrag_toolkit.lexical_graph.indexing.constants import LOCAL_ENTITY_CLASSIFICATION
 
 from llama_index.core.schema import BaseNode
@@ -27,12 +26,11 @@ class LocalEntityRewritesGraphBuilder(GraphBuilder):
 
         if fact_metadata:
 
-            fact = Fact.model_validate(fact_metadata)
-            fact = string_complement_to_entity(fact)
+            fact = fact_from_node(node, **kwargs)
 
             if fact.subject.classification and fact.subject.classification == LOCAL_ENTITY_CLASSIFICATION:
                 if not include_local_entities:
-                    logger.debug(f'Ignoring local entity rewrites for fact [fact_id: {fact.factId}]')
+                    logger.debug('Ignoring local entity rewrites for fact [fact_id: %s]', fact.factId)
                     return
                 
             copy_complement_relationships_to_subject = Query(
@@ -38,7 +38,7 @@ class NullBuilder(NodeHandler):
         """
         for node in nodes:
             try:
-                logger.debug(f'Accepted node [node_id: {node.node_id}]')         
+                logger.debug('Accepted node [node_id: %s]', node.node_id)         
                 yield node
             except Exception as e:
                 logger.error(f'Error while accepting node: {str(e)}')
\ No newline at end of file
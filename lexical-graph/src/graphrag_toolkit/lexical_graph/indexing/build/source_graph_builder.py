@@ -70,7 +70,7 @@ class SourceGraphBuilder(GraphBuilder):
 
         if source_id:
 
-            logger.debug(f'Inserting source [source_id: {source_id}]')
+            logger.debug('Inserting source [source_id: %s]', source_id)
         
             statements = [
                 '// insert source',
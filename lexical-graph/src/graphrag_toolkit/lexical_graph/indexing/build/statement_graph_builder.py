@@ -58,7 +58,7 @@ class StatementGraphBuilder(GraphBuilder):
 
             statement = Statement.model_validate(statement_metadata)
 
-            logger.debug(f'Inserting statement [statement_id: {statement.statementId}]')
+            logger.debug('Inserting statement [statement_id: %s]', statement.statementId)
 
             prev_statement = None
             prev_info = node.relationships.get(NodeRelationship.PREVIOUS, None)
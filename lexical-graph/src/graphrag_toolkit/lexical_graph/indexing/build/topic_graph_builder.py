@@ -64,7 +64,7 @@ class TopicGraphBuilder(GraphBuilder):
 
             topic = Topic.model_validate(topic_metadata)
         
-            logger.debug(f'Inserting topic [topic_id: {topic.topicId}]')
+            logger.debug('Inserting topic [topic_id: %s]', topic.topicId)
 
             statements = [
                 '// insert topics',
@@ -85,7 +85,7 @@ class BatchLLMPropositionExtractorSync(BatchExtractorBase):
             else:
                 propositions = proposition_data.split('\n')
                 propositions_model = Propositions(propositions=[p for p in propositions if p])
-                node.metadata[PROPOSITIONS_KEY] = propositions_model.model_dump()['propositions']                
+                node.metadata[PROPOSITIONS_KEY] = list(propositions_model.propositions)                
         else:
             node.metadata[PROPOSITIONS_KEY] = []
         return node
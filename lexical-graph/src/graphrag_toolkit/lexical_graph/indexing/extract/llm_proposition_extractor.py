@@ -1,9 +1,9 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
 
-import logging
 import asyncio
-from typing import List, Optional, Sequence, Dict
+import logging
+from typing import List, Optional, Sequence, Dict, Tuple
 
 from graphrag_toolkit.lexical_graph.utils import LLMCache, LLMCacheType
 from graphrag_toolkit.lexical_graph.config import GraphRAGConfig
@@ -14,7 +14,7 @@ from graphrag_toolkit.lexical_graph.indexing.extract.progress import run_jobs_wi
 from graphrag_toolkit.lexical_graph.utils.arg_utils import coalesce
 
 from llama_index.core.schema import BaseNode
-from llama_index.core.bridge.pydantic import Field
+from llama_index.core.bridge.pydantic import Field, PrivateAttr
 from llama_index.core.extractors.interface import BaseExtractor
 from llama_index.core.prompts import PromptTemplate
 from llama_index.core.schema import NodeRelationship
@@ -52,6 +52,8 @@ class LLMPropositionExtractor(BaseExtractor):
         description='Metadata field from which to extract propositions'
     )
 
+    _inflight:Dict[Tuple[asyncio.AbstractEventLoop, str], asyncio.Future] = PrivateAttr(default_factory=dict)
+
     @classmethod
     def class_name(cls) -> str:
         """
@@ -175,18 +177,54 @@ propositions: {proposition_collection}
             logger.debug(s)
             
         return {
-            PROPOSITIONS_KEY: proposition_collection.model_dump()['propositions']
+            PROPOSITIONS_KEY: list(proposition_collection.propositions)
         }
             
     async def _extract_propositions(self, text, source_info):
+        """
+        Extracts unique propositions from the given text asynchronously, sharing one
+        extraction between concurrent requests for the same text.
+
+        Nodes with identical text (for example, the same chunk in several source
+        documents) join the extraction already in flight for that text rather than
+        making their own LLM call, whether or not the LLM cache is enabled. As with
+        the cache, `source_info` is not part of the key. Extractions are only shared
+        between requests on the same event loop.
+
+        Args:
+            text: The input string for which propositions need to be extracted.
+            source_info: Source metadata included in the prompt.
+
+        Returns:
+            Propositions: An object containing a list of unique propositions extracted
+            from the text.
+        """
+        key = (asyncio.get_running_loop(), text)
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._extract_unique_propositions(text, source_info))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            logger.debug('Awaiting in-flight proposition extraction')
+
+        return await asyncio.shield(task)
+
+    async def _extract_unique_propositions(self, text, source_info):
         """
         Extracts unique propositions from the given text asynchronously.
 
         This method interacts with a large language model (LLM) to extract a list of
-        unique propositions based on a provided text input. The process involves
-        executing a blocking LLM call in an asynchronous-friendly manner through the
-        use of asyncio's to_thread. The resulting LLM response is then split into
-        lines, and duplicate propositions are filtered out to ensure uniqueness.
+        unique propositions based on a provided text input. The LLM is called through
+        its native async interface; concurrency across nodes is bounded by the
+        `num_workers` semaphore in `run_jobs`, so no worker thread is needed per
+        call. Duplicate propositions are filtered out to ensure uniqueness.
+
+        When the LLM cache is disabled, the response is streamed and de-duplicated
+        line by line as tokens arrive, so only the current partial line is buffered.
+        When the cache is enabled, the full response is needed for the cache entry,
+        so it is fetched with a single call and then split into lines.
 
         Args:
             text: The input string for which propositions need to be extracted.
@@ -195,21 +233,26 @@ propositions: {proposition_collection}
             Propositions: An object containing a list of unique propositions extracted
             from the text.
         """
-        def blocking_llm_call():
-            return self.llm.predict(
-                PromptTemplate(template=self.prompt_template),
+        prompt = PromptTemplate(template=self.prompt_template)
+
+        if self.llm.enable_cache:
+            raw_response = await self.llm.apredict(
+                prompt,
                 text=text,
                 source_info=source_info,
                 exclude_cache_keys=['source_info']
             )
-        
-        coro = asyncio.to_thread(blocking_llm_call)
-        
-        raw_response = await coro
-
-        propositions = raw_response.split('\n')
+            unique_propositions = dict.fromkeys(raw_response.split('\n'))
+        else:
+            unique_propositions = {}
+            partial_line = ''
+            async for token in await self.llm.astream(prompt, text=text, source_info=source_info):
+                partial_line += token
+                if '\n' in token:
+                    *lines, partial_line = partial_line.split('\n')
+                    unique_propositions.update(dict.fromkeys(lines))
+            unique_propositions[partial_line] = None
 
-        unique_propositions = {p : None for p in propositions if p}
+        unique_propositions.pop('', None)
 
-        return Propositions(propositions=list(unique_propositions.keys()))
-    
\ No newline at end of file
+        return Propositions(propositions=list(unique_propositions))
\ No newline at end of file
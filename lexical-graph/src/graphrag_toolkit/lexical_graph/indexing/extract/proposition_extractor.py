@@ -196,7 +196,7 @@ propositions: {proposition_collection}
             logger.debug(s)
             
         return {
-            PROPOSITIONS_KEY: proposition_collection.model_dump()['propositions']
+            PROPOSITIONS_KEY: list(proposition_collection.propositions)
         }
             
     async def _extract_propositions(self, text):
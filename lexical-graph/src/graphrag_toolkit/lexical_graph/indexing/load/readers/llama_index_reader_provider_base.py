@@ -2,7 +2,12 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
-from typing import Any, List
+import atexit
+import concurrent.futures
+import multiprocessing
+import threading
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List
 from graphrag_toolkit.lexical_graph.logging import logging
 from llama_index.core.schema import Document
 from graphrag_toolkit.lexical_graph.indexing.load.readers.reader_provider_base import ReaderProvider
@@ -11,15 +16,65 @@ from graphrag_toolkit.lexical_graph.indexing.load.readers.reader_provider_config
 
 logger = logging.getLogger(__name__)
 
+# Process pools shared by reader providers, keyed by worker count
+_worker_pools:Dict[int, concurrent.futures.ProcessPoolExecutor] = {}
+_worker_pools_lock = threading.Lock()
+
+def _get_worker_pool(max_workers:int) -> concurrent.futures.ProcessPoolExecutor:
+    with _worker_pools_lock:
+        pool = _worker_pools.get(max_workers)
+        if pool is None:
+            # Use "spawn": readers are called from read_many's threads, and a forked
+            # worker can inherit a lock held by one of them and deadlock
+            pool = _worker_pools[max_workers] = concurrent.futures.ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context('spawn'),
+            )
+        return pool
+
+def shutdown_worker_pools():
+    """Shut down the process pools started by map_in_worker_processes()."""
+    with _worker_pools_lock:
+        pools = list(_worker_pools.values())
+        _worker_pools.clear()
+    for pool in pools:
+        pool.shutdown()
+
+atexit.register(shutdown_worker_pools)
+
+def map_in_worker_processes(fn:Callable, *iterables, max_workers:int) -> List[Any]:
+    """
+    Map a module-level function over the given iterables in a process pool shared
+    by all reader providers that ask for the same number of workers, preserving
+    input order.
+
+    The pool is created on first use and reused thereafter. Spawned workers re-import
+    the `__main__` module, so the calling script needs an `if __name__ == '__main__':`
+    guard. If the pool cannot run the work (for example, because that guard is
+    missing), the pool is discarded and the work is done in the calling process.
+    """
+    pool = _get_worker_pool(max_workers)
+    try:
+        return list(pool.map(fn, *iterables))
+    except BrokenProcessPool as e:
+        with _worker_pools_lock:
+            if _worker_pools.get(max_workers) is pool:
+                del _worker_pools[max_workers]
+        logger.warning(f"Worker process pool failed, parsing in-process instead: {e}")
+        return [fn(*args) for args in zip(*iterables)]
+
 class LlamaIndexReaderProviderBase(ReaderProvider):
     """
     Base class for LlamaIndex reader providers.
     Provides a simple wrapper around LlamaIndex readers.
     """
 
+    # Set to True by subclasses whose read() accepts a list of sources in a single call
+    accepts_source_list: bool = False
+
     def __init__(self, config: ReaderProviderConfig, reader_cls, **reader_kwargs):
         self.config = config
-        logger.debug(f"Instantiating reader: {reader_cls.__name__} with args: {reader_kwargs}")
+        logger.debug("Instantiating reader: %s with args: %s", reader_cls.__name__, reader_kwargs)
         self._reader = reader_cls(**reader_kwargs)
 
     def read(self, input_source: Any) -> List[Document]:
@@ -28,8 +83,8 @@ class LlamaIndexReaderProviderBase(ReaderProvider):
         Subclasses should override this method to handle specific reader requirements.
         """
         logger.debug("Starting read()")
-        logger.debug(f"Reader class: {self._reader.__class__.__name__}")
-        logger.debug(f"Input source: {input_source} (type={type(input_source)})")
+        logger.debug("Reader class: %s", self._reader.__class__.__name__)
+        logger.debug("Input source: %s (type=%s)", input_source, type(input_source))
 
         try:
             # Default implementation - subclasses should override for specific readers
@@ -38,4 +93,31 @@ class LlamaIndexReaderProviderBase(ReaderProvider):
             logger.exception("Error during read()")
             raise RuntimeError(
                 f"Failed to read using {self._reader.__class__.__name__}: {e}"
-            ) from e
\ No newline at end of file
+            ) from e
+
+    def read_many(self, sources: List[Any], max_workers: int = 16) -> List[Document]:
+        """
+        Read documents from many input sources, preserving source order.
+
+        Providers whose read() accepts a list of sources are called once with the
+        whole list. Otherwise each source is read on a thread pool so that file and
+        network I/O for different sources can overlap.
+
+        Args:
+            sources: The input sources to read.
+            max_workers: Maximum number of concurrent reads.
+
+        Returns:
+            List[Document]: The documents from all sources, in source order.
+        """
+        sources = list(sources)
+        if not sources:
+            return []
+
+        if self.accepts_source_list:
+            return self.read(sources)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(max_workers, len(sources))) as executor:
+            results = list(executor.map(self.read, sources))
+
+        return [doc for docs in results for doc in docs]
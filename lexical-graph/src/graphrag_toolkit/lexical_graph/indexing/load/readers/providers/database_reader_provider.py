@@ -2,8 +2,11 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
+import copy
+import threading
+import time
+from collections import OrderedDict
 from typing import List
-from sqlalchemy import create_engine
 from graphrag_toolkit.lexical_graph.indexing.load.readers.llama_index_reader_provider_base import LlamaIndexReaderProviderBase
 from graphrag_toolkit.lexical_graph.indexing.load.readers.reader_provider_config import DatabaseReaderConfig
 from graphrag_toolkit.lexical_graph.logging import logging
@@ -16,7 +19,7 @@ class DatabaseReaderProvider(LlamaIndexReaderProviderBase):
 
     def __init__(self, config: DatabaseReaderConfig):
         try:
-            
+            from sqlalchemy import create_engine
             from llama_index.readers.database.base import DatabaseReader, SQLDatabase
         except ImportError as e:
             logger.error("Failed to import DatabaseReader: missing dependencies")
@@ -40,8 +43,43 @@ class DatabaseReaderProvider(LlamaIndexReaderProviderBase):
 
         self.database_config = config
         self.metadata_fn = config.metadata_fn
+        self._result_cache = OrderedDict()
+        self._result_cache_lock = threading.Lock()
         logger.debug("Initialized DatabaseReaderProvider")
 
+    def _load_query(self, query: str) -> List[Document]:
+        """
+        Run query, reusing a recent result for the same SQL when caching is enabled.
+
+        Results are held in a bounded LRU of (expiry, documents) keyed on the query
+        text, and callers always receive deep copies so cached documents are never
+        mutated downstream.
+        """
+        cache_size = self.database_config.cache_size
+        if cache_size <= 0:
+            return self._reader.load_data(query=query)
+
+        now = time.monotonic()
+        with self._result_cache_lock:
+            cached = self._result_cache.get(query)
+            if cached is not None:
+                expires_at, documents = cached
+                if expires_at > now:
+                    self._result_cache.move_to_end(query)
+                    logger.debug("Serving cached result for database query")
+                    return copy.deepcopy(documents)
+                del self._result_cache[query]
+
+        documents = self._reader.load_data(query=query)
+
+        with self._result_cache_lock:
+            self._result_cache[query] = (now + self.database_config.cache_ttl, documents)
+            self._result_cache.move_to_end(query)
+            while len(self._result_cache) > cache_size:
+                self._result_cache.popitem(last=False)
+
+        return copy.deepcopy(documents)
+
     def read(self, input_source) -> List[Document]:
         query = input_source or self.database_config.query
         if not query:
@@ -51,12 +89,13 @@ class DatabaseReaderProvider(LlamaIndexReaderProviderBase):
         logger.info(f"Executing database query: {query[:100]}...")
         
         try:
-            documents = self._reader.load_data(query=query)
+            documents = self._load_query(query)
             logger.info(f"Successfully read {len(documents)} document(s) from database")
 
             if self.metadata_fn:
+                additional_metadata = self.metadata_fn(query)
                 for doc in documents:
-                    doc.metadata.update(self.metadata_fn(query))
+                    doc.metadata.update(additional_metadata)
 
             return documents
         except Exception as e:
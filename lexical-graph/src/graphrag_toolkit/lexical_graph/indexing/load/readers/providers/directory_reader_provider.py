@@ -2,7 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
-from typing import List
+from typing import Iterator, List
 from graphrag_toolkit.lexical_graph.indexing.load.readers.llama_index_reader_provider_base import LlamaIndexReaderProviderBase
 from graphrag_toolkit.lexical_graph.indexing.load.readers.reader_provider_config import DirectoryReaderConfig
 from graphrag_toolkit.lexical_graph.logging import logging
@@ -37,21 +37,33 @@ class DirectoryReaderProvider(LlamaIndexReaderProviderBase):
         self.metadata_fn = config.metadata_fn
         logger.debug(f"Initialized DirectoryReaderProvider for: {config.input_dir}")
 
+    def iread(self, input_source=None) -> Iterator[Document]:
+        """
+        Lazily read directory documents, one file at a time.
+
+        Only the documents for the file currently being read are held in memory,
+        so large directories can be streamed into a pipeline without first
+        materialising every document.
+        """
+        source_path = input_source or self.directory_config.input_dir
+        additional_metadata = None
+        
+        for documents in self._reader.iter_data():
+            for doc in documents:
+                if self.metadata_fn:
+                    if additional_metadata is None:
+                        additional_metadata = self.metadata_fn(source_path)
+                    doc.metadata.update(additional_metadata)
+                yield doc
+
     def read(self, input_source) -> List[Document]:
         """Read directory documents with metadata handling."""
         logger.info(f"Reading directory: {self.directory_config.input_dir}")
         
         try:
-            documents = self._reader.load_data()
+            documents = list(self.iread(input_source))
             logger.info(f"Successfully read {len(documents)} document(s) from directory")
-            
-            if self.metadata_fn:
-                source_path = input_source or self.directory_config.input_dir
-                for doc in documents:
-                    additional_metadata = self.metadata_fn(source_path)
-                    doc.metadata.update(additional_metadata)
-            
             return documents
         except Exception as e:
             logger.error(f"Failed to read directory {self.directory_config.input_dir}: {e}", exc_info=True)
-            raise RuntimeError(f"Failed to read directory: {e}") from e
\ No newline at end of file
+            raise RuntimeError(f"Failed to read directory: {e}") from e
@@ -2,8 +2,9 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
+from functools import lru_cache
 from typing import List
-from graphrag_toolkit.lexical_graph.indexing.load.readers.llama_index_reader_provider_base import LlamaIndexReaderProviderBase
+from graphrag_toolkit.lexical_graph.indexing.load.readers.llama_index_reader_provider_base import LlamaIndexReaderProviderBase, map_in_worker_processes
 from graphrag_toolkit.lexical_graph.indexing.load.readers.reader_provider_config import DocxReaderConfig
 from graphrag_toolkit.lexical_graph.indexing.load.readers.s3_file_mixin import S3FileMixin
 from graphrag_toolkit.lexical_graph.logging import logging
@@ -11,9 +12,21 @@ from llama_index.core.schema import Document
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=None)
+def _docx_reader():
+    """One DocxReader per worker process, reused for every file the worker parses."""
+    from llama_index.readers.file.docs import DocxReader
+    return DocxReader()
+
+def _load_docx(file_path: str) -> List[Document]:
+    """Load a single DOCX file. Module-level so that it can run in a worker process."""
+    return _docx_reader().load_data(file=file_path)
+
 class DocxReaderProvider(LlamaIndexReaderProviderBase, S3FileMixin):
     """Reader provider for DOCX files with S3 support using LlamaIndex's DocxReader."""
 
+    accepts_source_list = True
+
     def __init__(self, config: DocxReaderConfig):
         """Initialize with DocxReaderConfig."""
         try:
@@ -26,6 +39,7 @@ class DocxReaderProvider(LlamaIndexReaderProviderBase, S3FileMixin):
 
         super().__init__(config=config, reader_cls=DocxReader)
         self.metadata_fn = config.metadata_fn
+        self.num_workers = config.num_workers
         logger.debug("Initialized DocxReaderProvider")
 
     def read(self, input_source) -> List[Document]:
@@ -38,15 +52,23 @@ class DocxReaderProvider(LlamaIndexReaderProviderBase, S3FileMixin):
         processed_paths, temp_files, original_paths = self._process_file_paths(input_source)
         
         try:
-            documents = self._reader.load_data(file=processed_paths[0])
-            logger.info(f"Successfully read {len(documents)} document(s) from DOCX")
+            if self.num_workers > 1 and len(processed_paths) > 1:
+                # Parsing is CPU-bound and holds the GIL, so spread multiple files across processes
+                results = map_in_worker_processes(_load_docx, processed_paths, max_workers=self.num_workers)
+            else:
+                results = [self._reader.load_data(file=path) for path in processed_paths]
             
-            if self.metadata_fn:
-                for doc in documents:
-                    additional_metadata = self.metadata_fn(original_paths[0])
-                    doc.metadata.update(additional_metadata)
-                    doc.metadata['source'] = self._get_file_source_type(original_paths[0])
+            documents = []
+            for file_documents, original_path in zip(results, original_paths):
+                if self.metadata_fn:
+                    additional_metadata = self.metadata_fn(original_path)
+                    source_type = self._get_file_source_type(original_path)
+                    for doc in file_documents:
+                        doc.metadata.update(additional_metadata)
+                        doc.metadata['source'] = source_type
+                documents.extend(file_documents)
             
+            logger.info(f"Successfully read {len(documents)} document(s) from {len(processed_paths)} DOCX file(s)")
             return documents
         except Exception as e:
             logger.error(f"Failed to read DOCX from {input_source}: {e}", exc_info=True)
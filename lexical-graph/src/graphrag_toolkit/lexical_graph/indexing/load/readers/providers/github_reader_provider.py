@@ -2,30 +2,105 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
-from typing import List
+import asyncio
+import functools
+import os
+import pickle
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional
+from urllib.parse import quote
 from graphrag_toolkit.lexical_graph.indexing.load.readers.reader_provider_config import GitHubReaderConfig
 from graphrag_toolkit.lexical_graph.logging import logging
 from llama_index.core.schema import Document
 
 logger = logging.getLogger(__name__)
 
+@functools.lru_cache(maxsize=None)
+def _load_github_reader():
+    """Import and return (GithubRepositoryReader, GithubClient) once per process."""
+    try:
+        from llama_index.readers.github import GithubRepositoryReader, GithubClient
+    except ImportError as e:
+        logger.error("Failed to import GithubRepositoryReader: missing PyGithub")
+        raise ImportError(
+            "PyGithub package not found, install with 'pip install PyGithub'"
+        ) from e
+    return GithubRepositoryReader, GithubClient
+
+class _RequestThrottle:
+    """Hands out request start times at least min_interval_ms apart, across event loops and threads."""
+
+    def __init__(self, min_interval_ms: int):
+        self.min_interval_ms = min_interval_ms
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    async def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + max(self.min_interval_ms, 0) / 1000.0
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+def _throttle_requests(github_client, min_interval_ms: int):
+    """
+    Space out a GithubClient's API requests by at least min_interval_ms.
+
+    Every GithubClient call (branch, tree and blob lookups) goes through its async
+    request method, so gating that one method keeps bursts of concurrent blob
+    fetches under GitHub's secondary rate limits. The throttle is kept on the
+    client as `_request_throttle`, so its interval can be raised later.
+    """
+    throttle = _RequestThrottle(min_interval_ms)
+    request = github_client.request
+
+    async def throttled_request(*args, **kwargs):
+        await throttle.wait()
+        return await request(*args, **kwargs)
+
+    github_client.request = throttled_request
+    github_client._request_throttle = throttle
+    return github_client
+
+# One throttled GithubClient per token, shared by every provider and read
+_github_clients = {}
+_github_clients_lock = threading.Lock()
+
+def _shared_github_client(client_cls, github_token: str, verbose: bool, min_interval_ms: int):
+    """
+    Return the throttled GithubClient for a token, shared by every provider and read.
+
+    GitHub's secondary rate limits apply per token, so every provider using a token
+    shares one client and one request throttle, whatever its other settings. The
+    throttle uses the largest min_interval_ms requested for the token; the client
+    keeps the verbose setting of the first provider to use the token.
+    """
+    with _github_clients_lock:
+        github_client = _github_clients.get(github_token)
+        if github_client is None:
+            github_client = _github_clients[github_token] = _throttle_requests(
+                client_cls(github_token=github_token, verbose=verbose),
+                min_interval_ms
+            )
+        else:
+            throttle = github_client._request_throttle
+            throttle.min_interval_ms = max(throttle.min_interval_ms, min_interval_ms)
+        return github_client
+
 class GitHubReaderProvider:
     """Reader provider for GitHub repositories using LlamaIndex's GithubRepositoryReader."""
 
     def __init__(self, config: GitHubReaderConfig):
         """Initialize with GitHubReaderConfig."""
 
-        try:
-            from llama_index.readers.github import GithubRepositoryReader, GithubClient
-        except ImportError as e:
-            logger.error("Failed to import GithubRepositoryReader: missing PyGithub")
-            raise ImportError(
-                "PyGithub package not found, install with 'pip install PyGithub'"
-            ) from e
-        
-
+        self._github_reader_cls, self._github_client_cls = _load_github_reader()
         self.github_config = config
         self.metadata_fn = config.metadata_fn
+        self.cache_dir = Path(config.cache_dir).expanduser() if config.cache_dir else None
         logger.debug(f"Initialized GitHubReaderProvider with verbose={config.verbose}")
 
     def read(self, input_source) -> List[Document]:
@@ -54,27 +129,90 @@ class GitHubReaderProvider:
         logger.info(f"Reading GitHub repository: {owner}/{repo} (branch: {branch})")
 
         try:
-            github_client = GithubClient(
-                github_token=self.github_config.github_token,
-                verbose=self.github_config.verbose
+            github_client = _shared_github_client(
+                self._github_client_cls,
+                self.github_config.github_token,
+                self.github_config.verbose,
+                self.github_config.min_interval_ms
             )
 
-            reader = GithubRepositoryReader(
+            reader = self._github_reader_cls(
                 owner=owner,
                 repo=repo,
                 github_client=github_client,
-                verbose=self.github_config.verbose
+                verbose=self.github_config.verbose,
+                concurrent_requests=self.github_config.max_concurrency
             )
 
-            documents = reader.load_data(branch=branch)
+            if self.cache_dir:
+                documents = self._load_with_cache(reader, github_client, owner, repo, branch)
+            else:
+                documents = reader.load_data(branch=branch)
             logger.info(f"Successfully read {len(documents)} document(s) from GitHub repository")
 
             if self.metadata_fn:
+                additional_metadata = self.metadata_fn(repo_id)
                 for doc in documents:
-                    doc.metadata.update(self.metadata_fn(repo_id))
+                    doc.metadata.update(additional_metadata)
 
             return documents
         except Exception as e:
             logger.error(f"Failed to read GitHub repository {repo_id}: {e}", exc_info=True)
             raise RuntimeError(f"Failed to read GitHub repository: {e}") from e
 
+    def _cache_prefix(self, owner: str, repo: str, branch: str) -> str:
+        # quote() always escapes '+', so it cannot appear inside an encoded part
+        return '+'.join(quote(part, safe='') for part in (owner, repo, branch))
+
+    def _latest_cache_file(self, prefix: str) -> Optional[Path]:
+        cache_files = list(self.cache_dir.glob(f'{prefix}+*.pkl'))
+        return max(cache_files, key=lambda f: f.stat().st_mtime) if cache_files else None
+
+    def _load_with_cache(self, reader, github_client, owner: str, repo: str, branch: str) -> List[Document]:
+        """
+        Load documents for a branch, reusing a local copy while the branch's tree is unchanged.
+
+        Cached documents are keyed by the branch's tree SHA, so a single branch lookup
+        is enough to tell whether the repository content has changed. If the lookup
+        fails, the most recent cached copy for the branch is served instead.
+        """
+        from llama_index.core.async_utils import asyncio_run
+
+        prefix = self._cache_prefix(owner, repo, branch)
+
+        try:
+            branch_data = asyncio_run(github_client.get_branch(owner=owner, repo=repo, branch=branch))
+            tree_sha = branch_data.commit.commit.tree.sha
+        except Exception as e:
+            stale_file = self._latest_cache_file(prefix)
+            if stale_file is None:
+                raise
+            logger.warning(f"Failed to resolve branch {owner}/{repo}@{branch}, serving cached documents from {stale_file}: {e}")
+            with open(stale_file, 'rb') as f:
+                return pickle.load(f)
+
+        cache_file = self.cache_dir / f'{prefix}+{tree_sha}.pkl'
+
+        if cache_file.exists():
+            logger.debug(f"Cached GitHub documents {cache_file}")
+            with open(cache_file, 'rb') as f:
+                return pickle.load(f)
+
+        documents = reader.load_data(branch=branch)
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(documents, f)
+            os.replace(tmp_path, cache_file)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+
+        # Only the latest tree for a branch is kept
+        for old_file in self.cache_dir.glob(f'{prefix}+*.pkl'):
+            if old_file != cache_file:
+                old_file.unlink(missing_ok=True)
+
+        return documents
@@ -54,10 +54,11 @@ class JSONReaderProvider(LlamaIndexReaderProviderBase, S3FileMixin):
             logger.info(f"Successfully read {len(documents)} document(s) from JSON")
             
             if self.metadata_fn:
+                additional_metadata = self.metadata_fn(original_paths[0])
+                source_type = self._get_file_source_type(original_paths[0])
                 for doc in documents:
-                    additional_metadata = self.metadata_fn(original_paths[0])
                     doc.metadata.update(additional_metadata)
-                    doc.metadata['source'] = self._get_file_source_type(original_paths[0])
+                    doc.metadata['source'] = source_type
             
             return documents
         except Exception as e:
@@ -2,8 +2,9 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
+from functools import lru_cache
 from typing import List
-from graphrag_toolkit.lexical_graph.indexing.load.readers.llama_index_reader_provider_base import LlamaIndexReaderProviderBase
+from graphrag_toolkit.lexical_graph.indexing.load.readers.llama_index_reader_provider_base import LlamaIndexReaderProviderBase, map_in_worker_processes
 from graphrag_toolkit.lexical_graph.indexing.load.readers.reader_provider_config import PDFReaderConfig
 from graphrag_toolkit.lexical_graph.indexing.load.readers.s3_file_mixin import S3FileMixin
 from graphrag_toolkit.lexical_graph.logging import logging
@@ -11,9 +12,23 @@ from llama_index.core.schema import Document
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=None)
+def _pdf_reader():
+    """One PyMuPDFReader per worker process, reused for every file the worker parses."""
+    from llama_index.readers.file.pymu_pdf import PyMuPDFReader
+    return PyMuPDFReader()
+
+def _load_pdf(file_path: str, return_full_document: bool = False) -> List[Document]:
+    """Load a single PDF file. Module-level so that it can run in a worker process."""
+    if return_full_document:
+        return _pdf_reader().load_data(file_path=file_path, return_full_document=True)
+    return _pdf_reader().load_data(file_path=file_path)
+
 class PDFReaderProvider(LlamaIndexReaderProviderBase, S3FileMixin):
     """Reader provider for PDF files with S3 support using LlamaIndex's PyMuPDFReader."""
 
+    accepts_source_list = True
+
     def __init__(self, config: PDFReaderConfig):
         """Initialize with PDFReaderConfig."""
         try:
@@ -27,6 +42,7 @@ class PDFReaderProvider(LlamaIndexReaderProviderBase, S3FileMixin):
         super().__init__(config=config, reader_cls=PyMuPDFReader)
         self.return_full_document = config.return_full_document
         self.metadata_fn = config.metadata_fn
+        self.num_workers = config.num_workers
         logger.debug(f"Initialized PDFReaderProvider with return_full_document={config.return_full_document}")
 
     def read(self, input_source) -> List[Document]:
@@ -39,20 +55,34 @@ class PDFReaderProvider(LlamaIndexReaderProviderBase, S3FileMixin):
         processed_paths, temp_files, original_paths = self._process_file_paths(input_source)
         
         try:
-            logger.debug(f"Processing PDF file: {processed_paths[0]}")
-            if self.return_full_document:
-                documents = self._reader.load_data(file_path=processed_paths[0], return_full_document=True)
+            if self.num_workers > 1 and len(processed_paths) > 1:
+                # PyMuPDF is not thread-safe, so multiple files are spread across processes
+                results = map_in_worker_processes(
+                    _load_pdf,
+                    processed_paths,
+                    [self.return_full_document] * len(processed_paths),
+                    max_workers=self.num_workers
+                )
             else:
-                documents = self._reader.load_data(file_path=processed_paths[0])
-            
-            logger.info(f"Successfully read {len(documents)} document(s) from PDF")
+                results = []
+                for path in processed_paths:
+                    logger.debug("Processing PDF file: %s", path)
+                    if self.return_full_document:
+                        results.append(self._reader.load_data(file_path=path, return_full_document=True))
+                    else:
+                        results.append(self._reader.load_data(file_path=path))
             
-            if self.metadata_fn:
-                for doc in documents:
-                    additional_metadata = self.metadata_fn(original_paths[0])
-                    doc.metadata.update(additional_metadata)
-                    doc.metadata['source'] = self._get_file_source_type(original_paths[0])
+            documents = []
+            for file_documents, original_path in zip(results, original_paths):
+                if self.metadata_fn:
+                    additional_metadata = self.metadata_fn(original_path)
+                    source_type = self._get_file_source_type(original_path)
+                    for doc in file_documents:
+                        doc.metadata.update(additional_metadata)
+                        doc.metadata['source'] = source_type
+                documents.extend(file_documents)
             
+            logger.info(f"Successfully read {len(documents)} document(s) from {len(processed_paths)} PDF file(s)")
             return documents
         except Exception as e:
             logger.error(f"Failed to read PDF from {input_source}: {e}", exc_info=True)
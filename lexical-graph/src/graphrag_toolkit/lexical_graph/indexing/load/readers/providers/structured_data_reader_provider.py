@@ -93,27 +93,30 @@ class StructuredDataReaderProvider(BaseReaderProvider, S3FileMixin):
                         df_text = df[self.config.col_index]
 
                     if isinstance(df_text, pd.DataFrame):
-                        text_list = df_text.apply(
-                            lambda row: self.config.col_joiner.join(row.astype(str).tolist()), axis=1
-                        ).tolist()
+                        # Convert column-wise once, then join plain tuples; apply(axis=1)
+                        # builds a Series per row and upcasts mixed int/float rows
+                        text_list = [
+                            self.config.col_joiner.join(row)
+                            for row in df_text.astype(str).itertuples(index=False, name=None)
+                        ]
                     elif isinstance(df_text, pd.Series):
                         text_list = df_text.astype(str).tolist()
 
                     docs = [Document(text=text) for text in text_list]
 
+                    metadata = {
+                        'file_path': original_path,
+                        'file_type': file_type,
+                        'source': self._get_file_source_type(original_path),
+                        'document_type': 'structured_data',
+                        'content_category': 'tabular_data'
+                    }
+                    
+                    if self.metadata_fn:
+                        custom_metadata = self.metadata_fn(original_path)
+                        metadata.update(custom_metadata)
+
                     for doc in docs:
-                        metadata = {
-                            'file_path': original_path,
-                            'file_type': file_type,
-                            'source': self._get_file_source_type(original_path),
-                            'document_type': 'structured_data',
-                            'content_category': 'tabular_data'
-                        }
-                        
-                        if self.metadata_fn:
-                            custom_metadata = self.metadata_fn(original_path)
-                            metadata.update(custom_metadata)
-                        
                         doc.metadata.update(metadata)
                     
                     documents.extend(docs)
@@ -4,29 +4,13 @@
 
 from typing import List, Optional, Dict, Any, Union
 from graphrag_toolkit.lexical_graph.indexing.load.readers.llama_index_reader_provider_base import LlamaIndexReaderProviderBase
-from graphrag_toolkit.lexical_graph.indexing.load.readers.reader_provider_config_base import ReaderProviderConfig
+from graphrag_toolkit.lexical_graph.indexing.load.readers.reader_provider_config import UniversalDirectoryReaderConfig
 from graphrag_toolkit.lexical_graph.logging import logging
 from llama_index.core.schema import Document
 
 logger = logging.getLogger(__name__)
 
 
-class UniversalDirectoryReaderConfig(ReaderProviderConfig):
-    """Config for UniversalDirectoryReaderProvider."""
-    input_dir: Optional[str] = None
-    input_files: Optional[List[str]] = None
-    exclude_hidden: bool = True
-    recursive: bool = False
-    required_exts: Optional[List[str]] = None
-    file_extractor: Optional[Dict[str, Any]] = None
-    metadata_fn: Optional[callable] = None
-    # S3BasedDocs params
-    region: Optional[str] = None
-    bucket_name: Optional[str] = None
-    key_prefix: Optional[str] = None
-    collection_id: Optional[str] = None
-
-
 class UniversalDirectoryReaderProvider(LlamaIndexReaderProviderBase):
     """SimpleDirectoryReader for local, S3BasedDocs for S3."""
     
@@ -80,8 +64,8 @@ class UniversalDirectoryReaderProvider(LlamaIndexReaderProviderBase):
             logger.info(f"Successfully read {len(documents)} document(s) from local")
             
             if self.metadata_fn:
+                additional_metadata = self.metadata_fn(input_dir or self.config.input_files)
                 for doc in documents:
-                    additional_metadata = self.metadata_fn(input_dir or self.config.input_files)
                     doc.metadata.update(additional_metadata)
             
             return documents
@@ -117,12 +101,13 @@ class UniversalDirectoryReaderProvider(LlamaIndexReaderProviderBase):
                 collection_id=collection_id
             )
             
+            additional_metadata = self.metadata_fn(f"s3://{bucket_name}/{key_prefix}/{collection_id}") if self.metadata_fn else None
+
             documents = []
             for source_doc in s3_docs:
                 for node in source_doc.nodes:
                     doc = Document(text=node.text, metadata=node.metadata)
-                    if self.metadata_fn:
-                        additional_metadata = self.metadata_fn(f"s3://{bucket_name}/{key_prefix}/{collection_id}")
+                    if additional_metadata:
                         doc.metadata.update(additional_metadata)
                     documents.append(doc)
             
@@ -13,6 +13,8 @@ logger = logging.getLogger(__name__)
 class WebReaderProvider(LlamaIndexReaderProviderBase):
     """Reader provider for web pages using LlamaIndex's SimpleWebPageReader."""
 
+    accepts_source_list = True
+
     def __init__(self, config: WebReaderConfig):
         """Initialize with WebReaderConfig."""
         try:
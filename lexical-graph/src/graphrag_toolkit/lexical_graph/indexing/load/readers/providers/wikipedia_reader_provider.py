@@ -2,7 +2,8 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
-from typing import List, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Union
 from llama_index.core.schema import Document
 from graphrag_toolkit.lexical_graph.indexing.load.readers.reader_provider_config import WikipediaReaderConfig
 from graphrag_toolkit.lexical_graph.logging import logging
@@ -35,6 +36,23 @@ class WikipediaReaderProvider:
             
             self._reader = self._reader_cls()
 
+    def _resolve_page(self, wikipedia, page: str) -> Optional[str]:
+        """Return the Wikipedia title for page, falling back to the top search hit, or None."""
+        try:
+            wikipedia.page(page)
+            logger.debug(f"Validated Wikipedia page: {page}")
+            return page
+        except wikipedia.exceptions.PageError:
+            try:
+                if search_results := wikipedia.search(page, results=1):
+                    wikipedia.page(search_results[0])
+                    logger.info(f"Corrected page title: '{page}' -> '{search_results[0]}'")
+                    return search_results[0]
+                logger.warning(f"No Wikipedia page found for '{page}'")
+            except (wikipedia.exceptions.PageError, wikipedia.exceptions.DisambiguationError) as e:
+                logger.warning(f"Could not resolve Wikipedia page for '{page}': {e}")
+        return None
+
     def read(self, input_source: Union[str, List[str]]) -> List[Document]:
         """Read Wikipedia documents with metadata handling and title correction."""
         if not input_source:
@@ -53,39 +71,36 @@ class WikipediaReaderProvider:
 
         pages = [input_source] if isinstance(input_source, str) else input_source
         logger.info(f"Reading {len(pages)} Wikipedia page(s)")
-        validated_pages = []
-        
-        for page in pages:
-            try:
-                wikipedia.set_lang(self.lang)
-                wikipedia.page(page)
-                validated_pages.append(page)
-                logger.debug(f"Validated Wikipedia page: {page}")
-            except wikipedia.exceptions.PageError:
-                try:
-                    if search_results := wikipedia.search(page, results=1):
-                        wikipedia.page(search_results[0])
-                        validated_pages.append(search_results[0])
-                        logger.info(f"Corrected page title: '{page}' -> '{search_results[0]}'")
-                    else:
-                        logger.warning(f"No Wikipedia page found for '{page}'")
-                except (wikipedia.exceptions.PageError, wikipedia.exceptions.DisambiguationError) as e:
-                    logger.warning(f"Could not resolve Wikipedia page for '{page}': {e}")
+
+        # Each lookup and fetch is an HTTPS round trip to the Wikipedia API, so
+        # pages are resolved and loaded concurrently; map() preserves input order.
+        wikipedia.set_lang(self.lang)
+        max_workers = max(1, min(self.config.max_concurrency, len(pages)))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            validated_pages = [
+                page for page in executor.map(lambda p: self._resolve_page(wikipedia, p), pages)
+                if page is not None
+            ]
 
         if not validated_pages:
             logger.error(f"No valid Wikipedia pages found for: {pages}")
             raise ValueError(f"No valid Wikipedia pages found for: {pages}")
 
         try:
-            documents = self._reader.load_data(pages=validated_pages)
-            logger.info(f"Successfully read {len(documents)} document(s) from Wikipedia")
+            max_workers = max(1, min(self.config.max_concurrency, len(validated_pages)))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(lambda p: self._reader.load_data(pages=[p]), validated_pages))
 
-            if self.metadata_fn:
-                for doc in documents:
-                    page_context = validated_pages[0] if validated_pages else str(input_source)
-                    additional_metadata = self.metadata_fn(page_context)
-                    doc.metadata.update(additional_metadata)
+            documents = []
+            for page, page_docs in zip(validated_pages, results):
+                if self.metadata_fn:
+                    additional_metadata = self.metadata_fn(page)
+                    for doc in page_docs:
+                        doc.metadata.update(additional_metadata)
+                documents.extend(page_docs)
 
+            logger.info(f"Successfully read {len(documents)} document(s) from Wikipedia")
             return documents
         except Exception as e:
             logger.error(f"Failed to read Wikipedia pages {validated_pages}: {e}", exc_info=True)
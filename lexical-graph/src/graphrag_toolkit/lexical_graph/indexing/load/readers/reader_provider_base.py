@@ -3,7 +3,7 @@
 
 
 from abc import ABC, abstractmethod
-from typing import Any, List
+from typing import Any, Iterator, List
 from llama_index.core.schema import Document
 
 class ReaderProvider(ABC):
@@ -23,4 +23,20 @@ class ReaderProvider(ABC):
         Returns:
             List[Document]: The list of extracted Document objects.
         """
-        pass
\ No newline at end of file
+        pass
+
+    def iread(self, input_source: Any) -> Iterator[Document]:
+        """
+        Iterate over the Documents extracted from the input source.
+
+        The default implementation yields the result of `read`. Providers that can
+        produce documents incrementally override it, so callers can start
+        processing before the whole source has been read.
+
+        Args:
+            input_source: The source from which to read documents
+
+        Returns:
+            Iterator[Document]: An iterator over the extracted Document objects.
+        """
+        yield from self.read(input_source)
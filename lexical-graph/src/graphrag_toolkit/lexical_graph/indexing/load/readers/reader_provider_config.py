@@ -12,14 +12,17 @@ class PDFReaderConfig(ReaderProviderConfig):
     return_full_document: bool = False
     extract_tables: bool = True  # AdvancedPDFReaderProvider only: parse tables to markdown
     metadata_fn: Optional[Callable[[str], Dict[str, Any]]] = None
+    num_workers: int = 1  # PDFReaderProvider only: > 1 parses multiple files in that many worker processes
 
 @dataclass
 class DocxReaderConfig(ReaderProviderConfig):
     metadata_fn: Optional[Callable[[str], Dict[str, Any]]] = None
+    num_workers: int = 1  # > 1 parses multiple files in that many worker processes
 
 @dataclass
 class PPTXReaderConfig(ReaderProviderConfig):
     metadata_fn: Optional[Callable[[str], Dict[str, Any]]] = None
+    num_workers: int = 1  # > 1 parses multiple files in that many worker processes
 
 @dataclass
 class MarkdownReaderConfig(ReaderProviderConfig):
@@ -77,6 +80,8 @@ class DatabaseReaderConfig(ReaderProviderConfig):
     connection_string: str = ""
     query: str = ""
     metadata_fn: Optional[Callable[[str], Dict[str, Any]]] = None
+    cache_size: int = 0  # Max cached query results; 0 disables result caching
+    cache_ttl: float = 300.0  # Seconds a cached query result stays valid
 
 @dataclass
 class MongoReaderConfig(ReaderProviderConfig):
@@ -127,6 +132,7 @@ class TwitterReaderConfig(ReaderProviderConfig):
 class WikipediaReaderConfig(ReaderProviderConfig):
     lang: str = "en"
     metadata_fn: Optional[Callable[[str], Dict[str, Any]]] = None
+    max_concurrency: int = 8  # Max pages resolved and fetched in parallel
 
 @dataclass
 class YouTubeReaderConfig(ReaderProviderConfig):
@@ -152,6 +158,9 @@ class GitHubReaderConfig(ReaderProviderConfig):
     github_token: Optional[str] = None
     verbose: bool = False
     metadata_fn: Optional[Callable[[str], Dict[str, Any]]] = None
+    cache_dir: Optional[str] = None  # e.g. '~/.cache/graphrag_toolkit/github'; caching disabled if None
+    max_concurrency: int = 5  # Max concurrent blob requests per repository read
+    min_interval_ms: int = 100  # Min spacing between GitHub API requests; 0 disables throttling
 
 @dataclass
 class DirectoryReaderConfig(ReaderProviderConfig):
@@ -3,8 +3,8 @@
 
 
 from abc import ABC
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Any, Optional
 
 @dataclass
 class ReaderProviderConfig(ABC):
@@ -17,10 +17,20 @@ class AWSReaderConfigBase(ReaderProviderConfig):
     aws_profile: Optional[str] = None
     aws_region: Optional[str] = None
     
+    _boto3_session: Optional[Any] = field(default=None, init=False, repr=False, compare=False)
+
     def get_boto3_session(self):
-        """Get boto3 session with configured profile/region."""
-        from boto3.session import Session as Boto3Session
-        return (
-            Boto3Session(profile_name=self.aws_profile, region_name=self.aws_region)
-            if self.aws_profile else Boto3Session(region_name=self.aws_region)
-        )
+        """
+        Get boto3 session with configured profile/region.
+
+        The session is created on first use and cached on this config, so repeated
+        calls resolve credentials once instead of walking the provider chain each time.
+        Sessions are not shared between configs, as boto3 sessions are not thread-safe.
+        """
+        if self._boto3_session is None:
+            from boto3.session import Session as Boto3Session
+            self._boto3_session = (
+                Boto3Session(profile_name=self.aws_profile, region_name=self.aws_region)
+                if self.aws_profile else Boto3Session(region_name=self.aws_region)
+            )
+        return self._boto3_session
@@ -7,22 +7,42 @@ S3 file handling mixin for reader providers that process file paths.
 Provides universal S3 support for any reader that accepts file paths.
 """
 
+import concurrent.futures
 import tempfile
 import os
-from typing import Union, List
+from typing import Union, List, Dict
+from boto3.s3.transfer import TransferConfig
 from graphrag_toolkit.lexical_graph.logging import logging
 
 logger = logging.getLogger(__name__)
 
+MB = 1024 * 1024
+
+# Objects above the threshold are fetched as concurrent ranged GETs. Per-object
+# concurrency is kept low because _download_s3_files() already downloads several
+# objects at once, and the two multiply. Response bodies are read in 1 MB chunks
+# (boto3 defaults to 256 KB) to cut the number of read/write calls per object.
+S3_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * MB,
+    multipart_chunksize=8 * MB,
+    max_concurrency=4,
+    io_chunksize=1 * MB,
+    use_threads=True
+)
+
 class S3FileMixin:
     """Mixin to add S3 file support to any path-based reader provider."""
+
+    # Maximum number of S3 objects downloaded concurrently by _process_file_paths();
+    # matches botocore's default connection pool size for the shared S3 client
+    max_s3_download_workers: int = 10
     
     def _is_s3_path(self, path: str) -> bool:
         """Check if path is an S3 URL."""
         return path.startswith('s3://')
     
-    def _download_s3_file(self, s3_path: str) -> str:
-        """Download S3 file to a temporary location using GraphRAGConfig session."""
+    def _download_s3_file(self, s3_path: str, s3_client=None) -> str:
+        """Download S3 file to a temporary location using the shared GraphRAGConfig S3 client."""
         try:
             from graphrag_toolkit.lexical_graph.config import GraphRAGConfig
         except ImportError as e:
@@ -38,14 +58,14 @@ class S3FileMixin:
             bucket, key = s3_path_clean.split('/', 1)
             logger.info(f"Downloading S3 file: s3://{bucket}/{key}")
             
-            aws_session = GraphRAGConfig.session
-            s3_client = aws_session.client('s3')
+            if s3_client is None:
+                s3_client = GraphRAGConfig.s3
             
             temp_file = tempfile.NamedTemporaryFile(
                 delete=False, 
                 suffix=os.path.splitext(key)[1]
             )
-            s3_client.download_file(bucket, key, temp_file.name)
+            s3_client.download_file(bucket, key, temp_file.name, Config=S3_TRANSFER_CONFIG)
             temp_file.close()
             
             logger.debug(f"Downloaded to temporary file: {temp_file.name}")
@@ -54,6 +74,43 @@ class S3FileMixin:
             logger.error(f"Failed to download S3 file {s3_path}: {e}", exc_info=True)
             raise RuntimeError(f"Failed to download S3 file: {e}") from e
     
+    def _download_s3_files(self, s3_paths: List[str]) -> Dict[str, str]:
+        """
+        Download S3 files concurrently to temporary locations.
+        Returns a mapping of S3 path to temporary file path. If any download fails,
+        files that were downloaded are cleaned up before the error is raised.
+        """
+        if not s3_paths:
+            return {}
+
+        from graphrag_toolkit.lexical_graph.config import GraphRAGConfig
+
+        # boto3 clients are thread-safe; sessions are not, so resolve the client up front
+        s3_client = GraphRAGConfig.s3
+        max_workers = min(self.max_s3_download_workers, len(s3_paths))
+
+        downloaded = {}
+        errors = []
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._download_s3_file, s3_path, s3_client): s3_path
+                for s3_path in s3_paths
+            }
+            for future in concurrent.futures.as_completed(futures):
+                s3_path = futures[future]
+                try:
+                    downloaded[s3_path] = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to process S3 path {s3_path}: {e}")
+                    errors.append(e)
+
+        if errors:
+            self._cleanup_temp_files(list(downloaded.values()))
+            raise errors[0]
+
+        return downloaded
+
     def _process_file_paths(self, paths: Union[str, List[str]]) -> tuple:
         """
         Process file paths, downloading S3 files to temp locations.
@@ -62,27 +119,18 @@ class S3FileMixin:
         if isinstance(paths, str):
             paths = [paths]
         
-        processed_paths = []
-        temp_files = []
-        original_paths = []
+        original_paths = list(paths)
         
-        for path in paths:
-            original_paths.append(path)
-            if self._is_s3_path(path):
-                try:
-                    temp_path = self._download_s3_file(path)
-                    processed_paths.append(temp_path)
-                    temp_files.append(temp_path)
-                except Exception as e:
-                    logger.error(f"Failed to process S3 path {path}: {e}")
-                    self._cleanup_temp_files(temp_files)
-                    raise
-            else:
-                if not os.path.exists(path):
-                    logger.error(f"Local file not found: {path}")
-                    self._cleanup_temp_files(temp_files)
-                    raise FileNotFoundError(f"File not found: {path}")
-                processed_paths.append(path)
+        for path in original_paths:
+            if not self._is_s3_path(path) and not os.path.exists(path):
+                logger.error(f"Local file not found: {path}")
+                raise FileNotFoundError(f"File not found: {path}")
+        
+        s3_paths = list(dict.fromkeys(path for path in original_paths if self._is_s3_path(path)))
+        downloaded = self._download_s3_files(s3_paths)
+        
+        processed_paths = [downloaded.get(path, path) for path in original_paths]
+        temp_files = list(downloaded.values())
         
         return processed_paths, temp_files, original_paths
     
@@ -112,10 +160,7 @@ class S3FileMixin:
             s3_path_clean = s3_path.replace('s3://', '')
             bucket, key = s3_path_clean.split('/', 1)
             
-            aws_session = GraphRAGConfig.session
-            s3_client = aws_session.client('s3')
-            
-            response = s3_client.head_object(Bucket=bucket, Key=key)
+            response = GraphRAGConfig.s3.head_object(Bucket=bucket, Key=key)
             return response['ContentLength']
         except Exception as e:
             logger.error(f"Failed to get S3 file size for {s3_path}: {e}")
@@ -133,10 +178,7 @@ class S3FileMixin:
             s3_path_clean = s3_path.replace('s3://', '')
             bucket, key = s3_path_clean.split('/', 1)
             
-            aws_session = GraphRAGConfig.session
-            s3_client = aws_session.client('s3')
-            
-            url = s3_client.generate_presigned_url(
+            url = GraphRAGConfig.s3.generate_presigned_url(
                 'get_object',
                 Params={'Bucket': bucket, 'Key': key},
                 ExpiresIn=3600
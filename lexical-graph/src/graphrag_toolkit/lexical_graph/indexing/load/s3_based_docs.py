@@ -34,6 +34,30 @@ def to_batches(xs, n):
     n = max(1, n)
     return [xs[i:i+n] for i in range(0, len(xs), n)]
 
+def list_keys_by_prefix(s3_client, bucket_name:str, collection_path:str) -> Dict[str, List[str]]:
+    """
+    Lists every object under a collection in a single paginated pass and groups the
+    keys by their first-level prefix (one prefix per source document).
+
+    This replaces a delimited listing of the prefixes followed by a further listing
+    per prefix, so a collection costs one ListObjectsV2 call per 1000 objects rather
+    than at least one per source document. Objects directly under the collection path
+    are ignored, as they were by the delimited listing.
+    """
+    paginator = s3_client.get_paginator('list_objects_v2')
+    pages = paginator.paginate(Bucket=bucket_name, Prefix=collection_path)
+
+    keys_by_prefix = {}
+
+    for page in pages:
+        for obj in page.get('Contents', []):
+            key = obj['Key']
+            child, sep, _ = key[len(collection_path):].partition('/')
+            if sep:
+                keys_by_prefix.setdefault(f'{collection_path}{child}/', []).append(key)
+
+    return keys_by_prefix
+
 class S3DocDownloader(BaseComponent):
 
     key_prefix:str
@@ -41,17 +65,7 @@ class S3DocDownloader(BaseComponent):
     bucket_name:str
     fn:Callable[[TextNode], TextNode]
 
-    def _download_doc(self, doc_key, s3_client):
-
-        paginator = s3_client.get_paginator('list_objects_v2')
-
-        node_pages = paginator.paginate(Bucket=self.bucket_name, Prefix=doc_key)
-                
-        node_keys = [
-            node_obj['Key']
-            for node_page in node_pages
-            for node_obj in node_page['Contents'] 
-        ]
+    def _download_doc(self, node_keys, s3_client):
 
         nodes = []
 
@@ -73,14 +87,9 @@ class S3DocDownloader(BaseComponent):
 
         collection_path = join(self.key_prefix,  self.collection_id, '')
 
-        paginator = s3_client.get_paginator('list_objects_v2')
-        source_doc_pages = paginator.paginate(Bucket=self.bucket_name, Prefix=collection_path, Delimiter='/')
+        keys_by_prefix = list_keys_by_prefix(s3_client, self.bucket_name, collection_path)
 
-        source_doc_prefixes = [ 
-            source_doc_obj['Prefix'] 
-            for source_doc_page in source_doc_pages 
-            for source_doc_obj in source_doc_page.get('CommonPrefixes', [])           
-        ]
+        source_doc_prefixes = list(keys_by_prefix.keys())
 
         source_doc_prefixes_batches = to_batches(source_doc_prefixes, BATCH_SIZE)
 
@@ -92,14 +101,14 @@ class S3DocDownloader(BaseComponent):
 
                 docs = []
 
-                keys = [
-                    source_doc_prefix
+                node_keys = [
+                    keys_by_prefix[source_doc_prefix]
                     for source_doc_prefix in source_doc_prefixes_batch
                 ]
                 
                 docs.extend(list(executor.map(
                     self._download_doc,
-                    keys,
+                    node_keys,
                     repeat(s3_client)
                 )))
 
@@ -281,29 +290,13 @@ class S3ChunkDownloader(BaseComponent):
 
         collection_path = join(self.key_prefix,  self.collection_id, '')
 
-        paginator = s3_client.get_paginator('list_objects_v2')
-        source_doc_pages = paginator.paginate(Bucket=self.bucket_name, Prefix=collection_path, Delimiter='/')
+        keys_by_prefix = list_keys_by_prefix(s3_client, self.bucket_name, collection_path)
 
-        source_doc_prefixes = [ 
-            source_doc_obj['Prefix'] 
-            for source_doc_page in source_doc_pages 
-            for source_doc_obj in source_doc_page.get('CommonPrefixes', [])
-             
-        ]
-
-        logger.debug(f'Started getting source documents from S3 [bucket: {self.bucket_name}, collection_path: {collection_path}, num_prefixes: {len(source_doc_prefixes)}]')
+        logger.debug(f'Started getting source documents from S3 [bucket: {self.bucket_name}, collection_path: {collection_path}, num_prefixes: {len(keys_by_prefix)}]')
 
         with concurrent.futures.ThreadPoolExecutor(max_workers=GraphRAGConfig.extraction_num_threads_per_worker) as executor:
 
-            for source_doc_prefix in source_doc_prefixes:
-                
-                chunk_pages = paginator.paginate(Bucket=self.bucket_name, Prefix=source_doc_prefix)
-                
-                chunk_keys = [
-                    chunk_obj['Key']
-                    for chunk_page in chunk_pages
-                    for chunk_obj in chunk_page['Contents'] 
-                ]
+            for source_doc_prefix, chunk_keys in keys_by_prefix.items():
 
                 nodes = list(executor.map(
                     self._download_chunk,
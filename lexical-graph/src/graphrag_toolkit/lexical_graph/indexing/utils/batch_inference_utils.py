@@ -18,7 +18,6 @@ from graphrag_toolkit.lexical_graph.utils import LLMCache
 from graphrag_toolkit.lexical_graph.indexing.extract.batch_config import BatchConfig
 
 from llama_index.llms.bedrock_converse import BedrockConverse
-from llama_index.llms.anthropic.utils import messages_to_anthropic_messages
 from llama_index.llms.bedrock_converse.utils import messages_to_converse_messages
 from llama_index.core.schema import TextNode
 from llama_index.core.prompts import PromptTemplate
@@ -30,6 +29,13 @@ logger = logging.getLogger(__name__)
 BEDROCK_MIN_BATCH_SIZE = 100
 BEDROCK_MAX_BATCH_SIZE = 50000
 
+def messages_to_anthropic_messages(messages):
+    # llama_index.llms.anthropic loads the anthropic SDK, which dominates the
+    # import time of the whole package; only pay for it when a Claude batch
+    # request is actually built
+    from llama_index.llms.anthropic.utils import messages_to_anthropic_messages as to_anthropic_messages
+    return to_anthropic_messages(messages)
+
 def get_file_size_mb(filepath):
     file_stats = stat(filepath)
     return round(file_stats.st_size / (1024 * 1024), 2)
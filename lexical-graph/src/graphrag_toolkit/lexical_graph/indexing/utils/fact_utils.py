@@ -1,11 +1,42 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
 
+from typing import Any, Dict, List
+
 from graphrag_toolkit.lexical_graph.indexing.constants import LOCAL_ENTITY_CLASSIFICATION
 from graphrag_toolkit.lexical_graph.indexing.model import Fact, Entity
 
+from llama_index.core.schema import BaseNode
+
 def string_complement_to_entity(fact:Fact) -> Fact:
     if isinstance(fact.complement, str):
         value = fact.complement
         fact.complement = Entity(value=value, classification=LOCAL_ENTITY_CLASSIFICATION)
-    return fact
\ No newline at end of file
+    return fact
+
+def fact_from_metadata(fact_metadata:Dict[str, Any]) -> Fact:
+    """
+    Validates fact metadata into a Fact, with any string complement converted to an Entity.
+    """
+    return string_complement_to_entity(Fact.model_validate(fact_metadata))
+
+def facts_from_nodes(nodes:List[BaseNode]) -> Dict[str, Fact]:
+    """
+    Validates the fact metadata of each node that has any, keyed by node id, so that
+    the several builders registered for the 'fact' index can share one Fact per node.
+    The Facts are shared, and callers must treat them as read-only.
+    """
+    return {
+        node.node_id: fact_from_metadata(node.metadata['fact'])
+        for node in nodes
+        if node.metadata.get('fact')
+    }
+
+def fact_from_node(node:BaseNode, **kwargs:Any) -> Fact:
+    """
+    Returns the Fact for a fact node: the one in the `facts` keyword argument, if
+    GraphConstruction has already validated the node's batch, else one validated
+    from the node's metadata.
+    """
+    fact = kwargs.get('facts', {}).get(node.node_id)
+    return fact if fact is not None else fact_from_metadata(node.metadata['fact'])
@@ -2,7 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import logging
-from typing import List, Optional, Union, Any, Dict, overload
+from typing import Iterable, List, Optional, Union, Any, Dict, overload
 from pipe import Pipe
 
 from graphrag_toolkit.lexical_graph import GraphRAGConfig
@@ -38,7 +38,7 @@ from graphrag_toolkit.lexical_graph.utils.llm_cache import LLMCache
 from graphrag_toolkit.lexical_graph.indexing.progress_monitor import ProgressMonitor
 
 from llama_index.core.node_parser import SentenceSplitter, NodeParser
-from llama_index.core.schema import BaseNode
+from llama_index.core.schema import BaseNode, TransformComponent
 from llama_index.core.llms import LLM
 
 logger = logging.getLogger(__name__)
@@ -191,9 +191,10 @@ class IndexingConfig():
                 operations. If None, batch inference is not used.
         """
         if chunking is not None:
-            if isinstance(chunking, NodeParser):
-                chunking = [chunking]
-            if isinstance(chunking, list) and  len(chunking) == 0:
+            # Copy rather than append in place: the default list is shared by every
+            # call, and a caller's list should not be modified behind their back
+            chunking = [chunking] if isinstance(chunking, NodeParser) else list(chunking)
+            if len(chunking) == 0:
                 chunking.append(SentenceSplitter(chunk_size=256, chunk_overlap=25))
 
         self.chunking = chunking  # None = no chunking
@@ -300,6 +301,7 @@ class LexicalGraphIndex():
 
         self.extraction_pre_processors = pre_processors
         self.extraction_components = components
+        self._build_components = {}
 
         # Backend bootstrap (for example index creation) is part of object lifecycle; fail fast if unavailable.
         self.graph_store.init()
@@ -425,7 +427,7 @@ class LexicalGraphIndex():
 
     def extract(
             self,
-            nodes: List[BaseNode] = [],
+            nodes: Iterable[BaseNode] = (),
             handler: Optional[NodeHandler] = None,
             checkpoint: Optional[Checkpoint] = None,
             show_progress: Optional[bool] = False,
@@ -439,7 +441,9 @@ class LexicalGraphIndex():
         custom processing is also supported.
 
         Args:
-            nodes (List[BaseNode], optional): A list of nodes to be processed during the extraction.
+            nodes (Iterable[BaseNode], optional): The nodes to be processed during the extraction. Any
+                iterable is accepted and consumed lazily, batch by batch, so a generator can be
+                used to stream inputs that do not fit in memory.
             handler (Optional[NodeHandler], optional): A handler to process nodes after extraction.
             checkpoint (Optional[Checkpoint], optional): A checkpoint to manage pipeline state and
                 progress during extraction and build stages.
@@ -506,7 +510,7 @@ class LexicalGraphIndex():
 
     def build(
             self,
-            nodes: List[BaseNode] = [],
+            nodes: Iterable[BaseNode] = (),
             handler: Optional[NodeHandler] = None,
             checkpoint: Optional[Checkpoint] = None,
             show_progress: Optional[bool] = False,
@@ -519,7 +523,8 @@ class LexicalGraphIndex():
         on configuration settings and the provided nodes are processed through the pipeline.
 
         Args:
-            nodes (List[BaseNode]): A list of nodes to be processed in the build pipeline.
+            nodes (Iterable[BaseNode]): The nodes to be processed in the build pipeline. Any
+                iterable is accepted and consumed lazily, batch by batch.
             handler (Optional[NodeHandler]): A handler function or object for post-processing
                 nodes after indexing. Defaults to None.
             checkpoint (Optional[Checkpoint]): A checkpoint object for saving or resuming the
@@ -543,18 +548,8 @@ class LexicalGraphIndex():
 
         enable_versioning =  coalesce(kwargs.get('enable_versioning', None), build_config.enable_versioning, GraphRAGConfig.enable_versioning)
 
-        components = []
-
-        if enable_versioning:
-            components.append(VersionManager.for_graph_and_vector_store(self.graph_store, self.vector_store))
-
-        components.extend([
-            GraphConstruction.for_graph_store(self.graph_store),
-            VectorIndexing.for_vector_store(self.vector_store)
-        ])
-
         build_pipeline = BuildPipeline.create(
-            components=components,
+            components=self._get_build_components(enable_versioning),
             show_progress=show_progress,
             checkpoint=checkpoint,
             build_filters=build_config.build_filters,
@@ -571,7 +566,7 @@ class LexicalGraphIndex():
 
     def extract_and_build(
             self,
-            nodes: List[BaseNode] = [],
+            nodes: Iterable[BaseNode] = (),
             handler: Optional[NodeHandler] = None,
             checkpoint: Optional[Checkpoint] = None,
             show_progress: Optional[bool] = False,
@@ -585,7 +580,8 @@ class LexicalGraphIndex():
         progress visualization.
 
         Args:
-            nodes (List[BaseNode], optional): A list of nodes to process. Defaults to an empty list.
+            nodes (Iterable[BaseNode], optional): The nodes to process. Any iterable is accepted and
+                consumed lazily, batch by batch. Defaults to an empty tuple.
             handler (Optional[NodeHandler]): A handler object to manage processed nodes. Defaults to None.
             checkpoint (Optional[Checkpoint]): A checkpoint object for resuming pipelines. Defaults to None.
             show_progress (Optional[bool]): Boolean flag to display pipeline progress. Defaults to False.
@@ -613,18 +609,8 @@ class LexicalGraphIndex():
 
         enable_versioning =  coalesce(kwargs.get('enable_versioning', None), build_config.enable_versioning, GraphRAGConfig.enable_versioning)
 
-        build_components = []
-
-        if enable_versioning:
-            build_components.append(VersionManager.for_graph_and_vector_store(self.graph_store, self.vector_store))
-
-        build_components.extend([
-            GraphConstruction.for_graph_store(self.graph_store),
-            VectorIndexing.for_vector_store(self.vector_store)
-        ])
-        
         build_pipeline = BuildPipeline.create(
-            components=build_components,
+            components=self._get_build_components(enable_versioning),
             show_progress=show_progress,
             checkpoint=checkpoint,
             build_filters=build_config.build_filters,
@@ -643,6 +629,32 @@ class LexicalGraphIndex():
         else:
             nodes | extraction_pipeline | build_pipeline | sink_fn
 
+    def _get_build_components(self, enable_versioning: bool) -> List[TransformComponent]:
+        """
+        Returns the graph and vector build components for this index, creating them on first use.
+
+        The components depend only on the index's graph and vector stores, so they are
+        created once per versioning mode and reused by subsequent `build()` and
+        `extract_and_build()` calls. A new list is returned each time because
+        `BuildPipeline` may replace its last component with a checkpoint writer.
+
+        Args:
+            enable_versioning (bool): Whether a `VersionManager` precedes the build components.
+
+        Returns:
+            List[TransformComponent]: The build components, in pipeline order.
+        """
+        if enable_versioning not in self._build_components:
+            components = []
+            if enable_versioning:
+                components.append(VersionManager.for_graph_and_vector_store(self.graph_store, self.vector_store))
+            components.extend([
+                GraphConstruction.for_graph_store(self.graph_store),
+                VectorIndexing.for_vector_store(self.vector_store)
+            ])
+            self._build_components[enable_versioning] = components
+        return list(self._build_components[enable_versioning])
+
     @staticmethod
     def _create_extraction_monitor_pipe(progress_monitor: ProgressMonitor) -> Pipe:
         def _monitor_extraction(source_documents):
@@ -1,6 +1,8 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
 
+import copy
+import functools
 import logging
 import logging.config
 import warnings
@@ -41,12 +43,14 @@ class CompactFormatter(logging.Formatter):
         return result
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def _shorten_record_name(name: str) -> str:
         """
         Shortens a fully qualified record name by reducing all parts except the last one to their initials.
 
         This method takes a dot-separated name and abbreviates each part except the last one,
-        keeping the first character of each intermediate part.
+        keeping the first character of each intermediate part. Logger names come from a
+        small, fixed set, so results are cached.
 
         Args:
             name (str): The fully qualified record name to be shortened.
@@ -108,6 +112,31 @@ class ModuleFilter(logging.Filter):
             l: v if isinstance(v, list) else [v] for l, v in (excluded_messages or {}).items()
         }
 
+        # filter() runs for every log record, so the rules are compiled once here:
+        # prefix lists become tuples (a single C-level str.startswith call per
+        # check) and wildcard rules become level sets.
+        self._excluded_message_prefixes = self._to_prefixes(self._excluded_messages)
+        self._included_message_prefixes = self._to_prefixes(self._included_messages)
+        self._excluded_module_prefixes = self._to_prefixes(self._excluded_modules)
+        self._included_module_prefixes = self._to_prefixes(self._included_modules)
+        self._included_message_wildcards = self._to_wildcards(self._included_messages)
+        self._excluded_module_wildcards = self._to_wildcards(self._excluded_modules)
+        self._included_module_wildcards = self._to_wildcards(self._included_modules)
+        self._message_rule_levels = {
+            l for l, v in (*self._excluded_messages.items(), *self._included_messages.items()) if v
+        }
+        # Module verdicts depend only on (level, logger name); logger names are a
+        # small, fixed set (the logging module itself keeps every logger forever)
+        self._module_verdicts: dict[tuple[LoggingLevel, str], bool] = {}
+
+    @staticmethod
+    def _to_prefixes(rules: dict[LoggingLevel, list[str]]) -> dict[LoggingLevel, tuple[str, ...]]:
+        return {l: tuple(v) for l, v in rules.items()}
+
+    @staticmethod
+    def _to_wildcards(rules: dict[LoggingLevel, list[str]]) -> set[LoggingLevel]:
+        return {l for l, v in rules.items() if '*' in v}
+
     def filter(self, record: logging.LogRecord) -> bool:
         """
         Filters log records based on message and module inclusion or exclusion rules. This method
@@ -122,24 +151,30 @@ class ModuleFilter(logging.Filter):
             bool: True if the log record passes the filtering criteria and should be retained;
                 False otherwise.
         """
-        record_message = record.getMessage()
+        levelno = record.levelno
 
-        excluded_messages = self._excluded_messages.get(record.levelno, [])
-        if any(record_message.startswith(x) for x in excluded_messages):
-            return False
+        # Formatting the message interpolates its args, so only do it when this
+        # level has message rules to check
+        if levelno in self._message_rule_levels:
+            record_message = record.getMessage()
 
-        included_messages = self._included_messages.get(record.levelno, [])
-        if any(record_message.startswith(x) for x in included_messages) or '*' in included_messages:
-            return True
+            if record_message.startswith(self._excluded_message_prefixes.get(levelno, ())):
+                return False
+
+            if levelno in self._included_message_wildcards or record_message.startswith(self._included_message_prefixes.get(levelno, ())):
+                return True
 
-        record_module = record.name
+        key = (levelno, record.name)
+        verdict = self._module_verdicts.get(key)
+        if verdict is None:
+            verdict = self._module_verdicts[key] = self._filter_module(levelno, record.name)
+        return verdict
 
-        excluded_modules = self._excluded_modules.get(record.levelno, [])
-        if any(record_module.startswith(x) for x in excluded_modules) or '*' in excluded_modules:
+    def _filter_module(self, levelno: LoggingLevel, record_module: str) -> bool:
+        if levelno in self._excluded_module_wildcards or record_module.startswith(self._excluded_module_prefixes.get(levelno, ())):
             return False
 
-        included_modules = self._included_modules.get(record.levelno, [])
-        if any(record_module.startswith(x) for x in included_modules) or '*' in included_modules:
+        if levelno in self._included_module_wildcards or record_module.startswith(self._included_module_prefixes.get(levelno, ())):
             return True
 
         return False
@@ -194,6 +229,21 @@ BASE_LOGGING_CONFIG = {
     'loggers': {'': {'handlers': ['stdout'], 'level': logging.INFO}},
 }
 
+# The last config applied by set_advanced_logging_config, and the logging state it produced
+_last_logging_config = None
+_last_logging_state = None
+
+
+def _logging_state() -> tuple:
+    """Captures the parts of the logging state that applying the config (re)establishes."""
+    root = logging.getLogger()
+    return (
+        root.level,
+        list(root.filters),
+        [(h, h.level, list(h.filters), h.formatter) for h in root.handlers],
+        [l for l in logging.Logger.manager.loggerDict.values() if isinstance(l, logging.Logger) and l.disabled],
+    )
+
 
 def set_logging_config(
         logging_level: Union[str, LoggingLevel],
@@ -271,7 +321,8 @@ def set_advanced_logging_config(
     if isinstance(logging_level, int):
         logging_level = logging.getLevelName(logging_level)
 
-    config = BASE_LOGGING_CONFIG.copy()
+    # Deep copy, so per-call filters and handlers never leak into the shared defaults
+    config = copy.deepcopy(BASE_LOGGING_CONFIG)
     config['loggers']['']['level'] = logging_level.upper()
     config['filters']['moduleFilter']['included_modules'].update(included_modules or dict())
     config['filters']['moduleFilter']['excluded_modules'].update(excluded_modules or dict())
@@ -284,9 +335,19 @@ def set_advanced_logging_config(
             filename = os.path.join(GraphRAGConfig.log_output_dir, filename)
         config['handlers']['file_handler']['filename'] = filename
         config['loggers']['']['handlers'].append('file_handler')
-    
+
+    # dictConfig tears down and rebuilds every handler and filter; skip it only if the
+    # same config is already in place and nothing has since changed the root level,
+    # its handlers or filters, or disabled any loggers
+    global _last_logging_config, _last_logging_state
+    if config == _last_logging_config and _logging_state() == _last_logging_state:
+        return
+
     logging.config.dictConfig(config)
 
+    _last_logging_config = config
+    _last_logging_state = _logging_state()
+
 
 def _is_valid_logging_level(level: Union[str, LoggingLevel]) -> bool:
     """
@@ -1,13 +1,15 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
 
-import concurrent.futures
+import asyncio
+import functools
 import re
 import logging
 
 from pydantic import Field
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
+from llama_index.core.async_utils import asyncio_run
 from llama_index.core.postprocessor.types import BaseNodePostprocessor
 from llama_index.core.schema import NodeWithScore, QueryBundle, TextNode
 from llama_index.core.prompts import ChatPromptTemplate
@@ -19,6 +21,17 @@ from graphrag_toolkit.lexical_graph.retrieval.prompts import ENHANCE_STATEMENT_S
 
 logger = logging.getLogger(__name__)
 
+MODIFIED_STATEMENT_PATTERN = re.compile(r'<modified_statement>(.*?)</modified_statement>', re.DOTALL)
+
+@functools.lru_cache(maxsize=16)
+def _enhance_template(system_prompt:str, user_prompt:str) -> ChatPromptTemplate:
+    # Templates are only ever formatted, never mutated, so post-processors created
+    # per request with the same prompts can share one
+    return ChatPromptTemplate(message_templates=[
+        ChatMessage(role=MessageRole.SYSTEM, content=system_prompt),
+        ChatMessage(role=MessageRole.USER, content=user_prompt),
+    ])
+
 class StatementEnhancementPostProcessor(BaseNodePostprocessor):
     """
     Post-processes nodes to enhance their statements using provided language model and templates.
@@ -76,10 +89,7 @@ class StatementEnhancementPostProcessor(BaseNodePostprocessor):
         self.system_prompt = system_prompt
         self.user_prompt = user_prompt
         
-        self.enhance_template = ChatPromptTemplate(message_templates=[
-            ChatMessage(role=MessageRole.SYSTEM, content=system_prompt),
-            ChatMessage(role=MessageRole.USER, content=user_prompt),
-        ])
+        self.enhance_template = _enhance_template(system_prompt, user_prompt)
 
     def enhance_statement(self, node: NodeWithScore) -> NodeWithScore:
         """
@@ -97,33 +107,36 @@ class StatementEnhancementPostProcessor(BaseNodePostprocessor):
                 successful, or the original node if the enhancement process fails.
         """
         try:
+            metadata = node.node.metadata
             response = self.llm.predict(
                 prompt=self.enhance_template,
-                statement=node.node.metadata['statement']['value'],
-                context=node.node.metadata['chunk']['value'],
+                statement=metadata['statement']['value'],
+                context=metadata['chunk']['value'],
             )
-            pattern = r'<modified_statement>(.*?)</modified_statement>'
-            match = re.search(pattern, response, re.DOTALL)
-            
-            if match:
-                enhanced_text = match.group(1).strip()
-                new_node = TextNode(
-                    text=enhanced_text,  
-                    metadata={
-                        'statement': node.node.metadata['statement'], 
-                        'chunk': node.node.metadata['chunk'],
-                        'source': node.node.metadata['source'],
-                        'search_type': node.node.metadata.get('search_type')
-                    }
-                )
-                return NodeWithScore(node=new_node, score=node.score)
-            
-            return node
-            
+            return self._to_enhanced_node(node, response)
         except Exception as e:
             logger.error(f"Error enhancing statement: {e}")
             return node
 
+    def _to_enhanced_node(self, node: NodeWithScore, response: str) -> NodeWithScore:
+        match = MODIFIED_STATEMENT_PATTERN.search(response)
+        
+        if match:
+            enhanced_text = match.group(1).strip()
+            metadata = node.node.metadata
+            new_node = TextNode(
+                text=enhanced_text,  
+                metadata={
+                    'statement': metadata['statement'], 
+                    'chunk': metadata['chunk'],
+                    'source': metadata['source'],
+                    'search_type': metadata.get('search_type')
+                }
+            )
+            return NodeWithScore(node=new_node, score=node.score)
+        
+        return node
+
     def _postprocess_nodes(
         self,
         nodes: List[NodeWithScore],
@@ -132,9 +145,8 @@ class StatementEnhancementPostProcessor(BaseNodePostprocessor):
         """
         Post-processes a list of nodes by applying enhancements concurrently.
 
-        This method takes a list of nodes, processes each node through the
-        `enhance_statement` method, and returns the processed nodes as a list. It uses
-        a thread pool to handle the parallel execution, improving performance.
+        This method runs `_apostprocess_nodes` to completion, so up to
+        `max_concurrent` LLM requests are in flight at once.
 
         Args:
             nodes: A list of `NodeWithScore` objects that need to be processed.
@@ -142,9 +154,53 @@ class StatementEnhancementPostProcessor(BaseNodePostprocessor):
                 context or criteria for processing nodes.
 
         Returns:
-            A list of `NodeWithScore` objects after being processed through the
-            `enhance_statement` method.
+            A list of enhanced `NodeWithScore` objects, in the same order as the
+            input nodes.
         """
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_concurrent) as executor:
-            return list(executor.map(self.enhance_statement, nodes))
-        
\ No newline at end of file
+        return asyncio_run(self._apostprocess_nodes(nodes, query_bundle))
+
+    async def _apostprocess_nodes(
+        self,
+        nodes: List[NodeWithScore],
+        query_bundle: Optional[QueryBundle] = None,
+    ) -> List[NodeWithScore]:
+        """
+        Asynchronously post-processes a list of nodes by applying enhancements concurrently.
+
+        Enhancements run on the event loop, with at most `max_concurrent` LLM requests
+        in flight at once. Nodes that share the same statement and chunk context share
+        a single LLM request. A node whose enhancement fails is returned unchanged.
+
+        Args:
+            nodes: A list of `NodeWithScore` objects that need to be processed.
+            query_bundle: Optional; A `QueryBundle` object providing additional
+                context or criteria for processing nodes.
+
+        Returns:
+            A list of enhanced `NodeWithScore` objects, in the same order as the
+            input nodes.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+        enhancements:Dict[Tuple[str, str], asyncio.Future] = {}
+
+        async def enhance(statement:str, context:str) -> str:
+            async with semaphore:
+                return await self.llm.apredict(
+                    prompt=self.enhance_template,
+                    statement=statement,
+                    context=context,
+                )
+
+        async def enhance_node(node: NodeWithScore) -> NodeWithScore:
+            try:
+                metadata = node.node.metadata
+                key = (metadata['statement']['value'], metadata['chunk']['value'])
+                enhancement = enhancements.get(key)
+                if enhancement is None:
+                    enhancement = enhancements[key] = asyncio.ensure_future(enhance(*key))
+                return self._to_enhanced_node(node, await enhancement)
+            except Exception as e:
+                logger.error(f"Error enhancing statement: {e}")
+                return node
+
+        return list(await asyncio.gather(*[enhance_node(node) for node in nodes]))
@@ -52,6 +52,10 @@ class ProcessorArgs():
         ecs_max_contexts (int): Limit on the number of entity contexts to handle.
         ecs_max_entities_per_context (int): Restriction on how many entities
             are considered per context.
+        ec_entity_cache_ttl (float): Seconds for which the graph entity provider
+            reuses the entities found for a keyword. 0 (the default) disables
+            caching; enable it only where the graph is not being updated under
+            the query engine, as cached entries are not invalidated on writes.
     """
     def __init__(self, **kwargs):
         
@@ -85,6 +89,7 @@ class ProcessorArgs():
         self.ec_min_score_factor = kwargs.get('ec_min_score_factor', 0.1)
         self.ec_max_contexts = kwargs.get('ec_max_contexts', 3)
         self.ec_max_depth = kwargs.get('ec_max_depth', 3)
+        self.ec_entity_cache_ttl = kwargs.get('ec_entity_cache_ttl', 0)
         self.chunk_cosine_top_k = kwargs.get('chunk_cosine_top_k', 50)
         self.chunk_beam_width = kwargs.get('chunk_beam_width', 10)
         self.chunk_beam_max_depth = kwargs.get('chunk_beam_max_depth', 3)
@@ -15,8 +15,9 @@ class UpdateChunkMetadata(ProcessorBase):
     def _process_results(self, search_results:SearchResultCollection, query:QueryBundle) -> SearchResultCollection:
         def update_chunks(topic:Topic):
             for chunk in topic.chunks:
-                value = chunk.metadata.pop('value', None)
-                chunk.metadata.pop('chunkId', None)
+                metadata = chunk.metadata
+                value = metadata.pop('value', None)
+                metadata.pop('chunkId', None)
                 if value:
                     chunk.value = value
             return topic
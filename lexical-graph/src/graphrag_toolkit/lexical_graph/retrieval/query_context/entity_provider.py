@@ -1,8 +1,13 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
-import concurrent.futures
+import heapq
 import logging
-from typing import List, Iterator, cast, Optional
+import operator
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional
 
 from graphrag_toolkit.lexical_graph.storage.graph import GraphStore
 from graphrag_toolkit.lexical_graph.metadata import FilterConfig
@@ -15,6 +20,14 @@ from llama_index.core.schema import QueryBundle
 
 logger = logging.getLogger(__name__)
 
+ENTITY_CACHE_MAX_SIZE = 4096
+
+# Shared across queries, since an EntityProvider is created per query. Keyed on
+# (id(graph_store), keyword); each entry holds a weak reference to its graph store
+# so that an id reused by a later store can never match.
+_entity_cache:OrderedDict = OrderedDict()
+_entity_cache_lock = threading.Lock()
+
 class EntityProvider(EntityProviderBase):
     
     def __init__(self, graph_store:GraphStore, args:ProcessorArgs, filter_config:Optional[FilterConfig]=None):
@@ -22,112 +35,129 @@ class EntityProvider(EntityProviderBase):
 
         
     def _get_entities_for_keyword(self, keyword:str) -> List[ScoredEntity]:
+        return self._get_entities_for_keywords([keyword])[0]
 
-        parts = keyword.split('|')
+    def _get_cached_entities(self, keyword:str) -> Optional[List[ScoredEntity]]:
 
-        if len(parts) > 1:
+        key = (id(self.graph_store), keyword)
 
-            cypher = f"""
-            // get entities for keywords
-            MATCH (entity:`__Entity__`)-[r:`__SUBJECT__`|`__OBJECT__`]->()
-            WHERE entity.search_str = $keyword and entity.class = $classification
-            WITH entity, count(r) AS score ORDER BY score DESC
-            RETURN {{
-                {node_result('entity', self.graph_store.node_id('entity.entityId'), properties=['value', 'class'])},
-                score: score
-            }} AS result"""
+        with _entity_cache_lock:
+            entry = _entity_cache.get(key)
+            if entry is None:
+                return None
+            (expires_at, graph_store_ref, entities) = entry
+            if expires_at < time.monotonic() or graph_store_ref() is not self.graph_store:
+                del _entity_cache[key]
+                return None
+            _entity_cache.move_to_end(key)
+
+        # Callers accumulate scores on the returned entities, so hand out copies
+        return [entity.model_copy() for entity in entities]
+    
+    def _cache_entities(self, keyword:str, entities:List[ScoredEntity]):
+
+        entry = (
+            time.monotonic() + self.args.ec_entity_cache_ttl,
+            weakref.ref(self.graph_store),
+            [entity.model_copy() for entity in entities]
+        )
+
+        with _entity_cache_lock:
+            _entity_cache[(id(self.graph_store), keyword)] = entry
+            _entity_cache.move_to_end((id(self.graph_store), keyword))
+            while len(_entity_cache) > ENTITY_CACHE_MAX_SIZE:
+                _entity_cache.popitem(last=False)
+
+    def _get_entities_for_keywords(self, keywords:List[str]) -> List[List[ScoredEntity]]:
+
+        if not self.args.ec_entity_cache_ttl:
+            return self._query_entities_for_keywords(keywords)
+
+        entities_for_keywords = [self._get_cached_entities(keyword) for keyword in keywords]
+
+        uncached_keywords = [keyword for keyword, entities in zip(keywords, entities_for_keywords) if entities is None]
+
+        if uncached_keywords:
+            queried_entities = iter(self._query_entities_for_keywords(uncached_keywords))
+            for index, keyword in enumerate(keywords):
+                if entities_for_keywords[index] is None:
+                    entities = next(queried_entities)
+                    self._cache_entities(keyword, entities)
+                    entities_for_keywords[index] = entities
+
+        return entities_for_keywords
 
-            params = {
+    def _query_entities_for_keywords(self, keywords:List[str]) -> List[List[ScoredEntity]]:
+
+        # One query per matching strategy for all keywords, rather than one or two
+        # round trips per keyword: exact matches first, then a STARTS WITH fallback
+        # for just those keywords with no exact match
+
+        params = []
+
+        for index, keyword in enumerate(keywords):
+            parts = keyword.split('|')
+            params.append({
+                'keywordIndex': index,
                 'keyword': search_string_from(parts[0]),
-                'classification': parts[1]
-            }
-        else:
+                'classification': parts[1] if len(parts) > 1 else None
+            })
+
+        entities_for_keywords:List[List[ScoredEntity]] = [[] for _ in keywords]
+
+        cypher = f"""
+        // get entities for keywords
+        UNWIND $keywords AS keyword
+        MATCH (entity:`__Entity__`)-[r:`__SUBJECT__`|`__OBJECT__`]->()
+        WHERE entity.search_str = keyword.keyword
+        AND ((keyword.classification IS NULL AND entity.class <> '__Local_Entity__') OR entity.class = keyword.classification)
+        WITH keyword.keywordIndex AS keywordIndex, entity, count(r) AS score ORDER BY keywordIndex, score DESC
+        RETURN {{
+            {node_result('entity', self.graph_store.node_id('entity.entityId'), properties=['value', 'class'])},
+            score: score
+        }} AS result, keywordIndex"""
+
+        self._add_entities(entities_for_keywords, cypher, params)
+
+        unmatched_params = [p for p in params if not entities_for_keywords[p['keywordIndex']]]
+
+        if unmatched_params:
+
             cypher = f"""
             // get entities for keywords
+            UNWIND $keywords AS keyword
             MATCH (entity:`__Entity__`)-[r:`__SUBJECT__`|`__OBJECT__`]->()
-            WHERE entity.search_str = $keyword
-            AND entity.class <> '__Local_Entity__'
-            WITH entity, count(r) AS score ORDER BY score DESC
+            WHERE entity.search_str STARTS WITH keyword.keyword
+            AND ((keyword.classification IS NULL AND entity.class <> '__Local_Entity__') OR entity.class STARTS WITH keyword.classification)
+            WITH keyword.keywordIndex AS keywordIndex, entity, count(r) AS score ORDER BY keywordIndex, score DESC
             RETURN {{
                 {node_result('entity', self.graph_store.node_id('entity.entityId'), properties=['value', 'class'])},
                 score: score
-            }} AS result"""
-
-            params = {
-                'keyword': search_string_from(parts[0])
-            }
-
-        results = self.graph_store.execute_query(cypher, params)
-
-        entities = [
-            ScoredEntity.model_validate(result['result'])
-            for result in results
-            if result['result']['score'] != 0
-        ]
-
-        if not entities:
-            if len(parts) > 1:
-
-                cypher = f"""
-                // get entities for keywords
-                MATCH (entity:`__Entity__`)-[r:`__SUBJECT__`|`__OBJECT__`]->()
-                WHERE entity.search_str STARTS WITH $keyword and entity.class STARTS WITH $classification
-                WITH entity, count(r) AS score ORDER BY score DESC
-                RETURN {{
-                    {node_result('entity', self.graph_store.node_id('entity.entityId'), properties=['value', 'class'])},
-                    score: score
-                }} AS result"""
-
-                params = {
-                    'keyword': search_string_from(parts[0]),
-                    'classification': parts[1]
-                }
-            else:
-                cypher = f"""
-                // get entities for keywords
-                MATCH (entity:`__Entity__`)-[r:`__SUBJECT__`|`__OBJECT__`]->()
-                WHERE entity.search_str STARTS WITH $keyword
-                AND entity.class <> '__Local_Entity__'
-                WITH entity, count(r) AS score ORDER BY score DESC
-                RETURN {{
-                    {node_result('entity', self.graph_store.node_id('entity.entityId'), properties=['value', 'class'])},
-                    score: score
-                }} AS result"""
-
-                params = {
-                    'keyword': search_string_from(parts[0])
-                }
-
-            results = self.graph_store.execute_query(cypher, params)
-
-            entities = [
-                ScoredEntity.model_validate(result['result'])
-                for result in results
-                if result['result']['score'] != 0
-            ]
-
-        return entities
+            }} AS result, keywordIndex"""
 
+            self._add_entities(entities_for_keywords, cypher, unmatched_params)
+
+        return entities_for_keywords
+    
+    def _add_entities(self, entities_for_keywords:List[List[ScoredEntity]], cypher:str, params:List[Dict[str, Any]]):
+
+        results = self.graph_store.execute_query(cypher, {'keywords': params})
+
+        for result in results:
+            if result['result']['score'] != 0:
+                entities_for_keywords[result['keywordIndex']].append(ScoredEntity.model_validate(result['result']))
                         
     def _get_entities(self, keywords:List[str], query_bundle:QueryBundle)  -> List[ScoredEntity]:
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.args.num_workers) as p:
-            scored_entity_batches:Iterator[List[ScoredEntity]] = p.map(self._get_entities_for_keyword, keywords)
-            scored_entities = sum(scored_entity_batches, start=cast(List[ScoredEntity], []))
-
         scored_entity_mappings = {}
         
-        for scored_entity in scored_entities:
-            entity_id = scored_entity.entity.entityId
-            if entity_id not in scored_entity_mappings:
-                scored_entity_mappings[entity_id] = scored_entity
-            else:
-                scored_entity_mappings[entity_id].score += scored_entity.score
-
-        scored_entities = list(scored_entity_mappings.values())
-
-        scored_entities.sort(key=lambda e:e.score, reverse=True)
-
-        return scored_entities
-
-        
\ No newline at end of file
+        for scored_entities in self._get_entities_for_keywords(keywords):
+            for scored_entity in scored_entities:
+                entity_id = scored_entity.entity.entityId
+                if entity_id not in scored_entity_mappings:
+                    scored_entity_mappings[entity_id] = scored_entity
+                else:
+                    scored_entity_mappings[entity_id].score += scored_entity.score
+
+        # get_entities() keeps only the top ec_max_entities, so there is no need to sort the rest
+        return heapq.nlargest(self.args.ec_max_entities, scored_entity_mappings.values(), key=operator.attrgetter('score'))
@@ -3,6 +3,7 @@
 
 import re
 import string
+from functools import lru_cache
 from typing import Any, List, Optional, Callable
 import uuid
 
@@ -16,13 +17,15 @@ SEARCH_STRING_PATTERN = re.compile(r'([^\s\w]|_)+')
 def new_query_var():
     return f'n{uuid.uuid4().hex}'
 
+@lru_cache(maxsize=4096)
 def search_string_from(value:str):
     """
     Removes specific patterns from a string, reduces extra spaces, and converts it to lowercase.
 
     This function receives a string, removes specific patterns defined by the global
     `SEARCH_STRING_PATTERN`, normalizes whitespace by replacing multiple spaces with
-    a single one, and converts the resulting string to lowercase.
+    a single one, and converts the resulting string to lowercase. Results are memoized,
+    since the same entity values recur across many facts during a build.
 
     Args:
         value (str): The input string to be processed.
@@ -36,13 +39,15 @@ def search_string_from(value:str):
         value = value.replace('  ', ' ')
     return value.lower().strip()
 
+@lru_cache(maxsize=4096)
 def label_from(value:str):
     """
     Converts a given string into a formatted label by removing specific patterns and capitalizing words.
 
     This function primarily works by searching for and replacing matches of a specified pattern
     in the input string, before converting the modified string into capitalized words. Spaces
-    are removed between the words to form a label-like output.
+    are removed between the words to form a label-like output. Results are memoized, since a
+    small number of classifications recur across every fact in a build.
 
     Args:
         value (str): The input string to transform into a formatted label.
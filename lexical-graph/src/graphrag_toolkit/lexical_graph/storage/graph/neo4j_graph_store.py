@@ -127,20 +127,20 @@ class Neo4jDatabaseClient(GraphStore):
 
         start = time.time()
 
-        with self.client.session() as session:
-            if self.database:
-                self.client.execute_query(
-                    cypher, 
-                    parameters,
-                    database_=self.database
-                )
-            else:
-                self.client.execute_query(
-                    cypher, 
-                    parameters
-                )
-            result = session.run(cypher, parameters)
-            results = [record.data() for record in result]
+        # driver.execute_query borrows a connection from the driver's pool for the
+        # duration of the call, so no per-query session needs to be opened
+        if self.database:
+            result = self.client.execute_query(
+                cypher, 
+                parameters,
+                database_=self.database
+            )
+        else:
+            result = self.client.execute_query(
+                cypher, 
+                parameters
+            )
+        results = [record.data() for record in result.records]
 
         end = time.time()
 
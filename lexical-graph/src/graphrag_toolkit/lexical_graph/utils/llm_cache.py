@@ -1,12 +1,13 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
 
+import asyncio
 import logging
 import os
 
 from botocore.config import Config
 from hashlib import sha256
-from typing import Optional, Any, Union
+from typing import Dict, Optional, Any, Tuple, Union
 
 from graphrag_toolkit.lexical_graph import ModelError
 from graphrag_toolkit.lexical_graph.utils.bedrock_utils import *
@@ -14,9 +15,9 @@ from graphrag_toolkit.lexical_graph.config import GraphRAGConfig
 
 from llama_index.core.llms.llm import LLM
 from llama_index.llms.bedrock_converse import BedrockConverse
-from llama_index.core.bridge.pydantic import BaseModel, Field
+from llama_index.core.bridge.pydantic import BaseModel, Field, PrivateAttr
 from llama_index.core.prompts import BasePromptTemplate
-from llama_index.core.types import TokenGen
+from llama_index.core.types import TokenAsyncGen, TokenGen
 
 
 logger = logging.getLogger(__name__) 
@@ -33,6 +34,42 @@ class LLMCache(BaseModel):
     verbose_prompt:Optional[bool] = Field(default=False)
     verbose_response:Optional[bool] = Field(default=False)
 
+    _inflight:Dict[Tuple[asyncio.AbstractEventLoop, str], asyncio.Future] = PrivateAttr(default_factory=dict)
+
+    def _init_client(self):
+        if isinstance(self.llm, BedrockConverse):
+            if not hasattr(self.llm, '_client'):
+                config = Config(
+                    retries={'max_attempts': MAX_ATTEMPTS, 'mode': 'standard'},
+                    connect_timeout=TIMEOUT,
+                    read_timeout=TIMEOUT,
+                )
+                
+                session = GraphRAGConfig.session
+                self.llm._client = session.client('bedrock-runtime', config=config, region_name=self.llm.region_name)
+
+    def _cache_key(self, prompt: BasePromptTemplate, **prompt_args: Any) -> str:
+        prompt_args_copy = prompt_args.copy()
+        for key in prompt_args.get('exclude_cache_keys', []):
+            del prompt_args_copy[key]
+
+        cache_key = f'{self.llm.to_json()},{prompt.format(**prompt_args_copy)}'
+        return sha256(cache_key.encode('utf-8')).hexdigest()
+
+    def _inflight_key(self, prompt: BasePromptTemplate, **prompt_args: Any) -> Tuple[asyncio.AbstractEventLoop, str]:
+        # Tasks belong to the loop that created them, and one LLMCache may be shared by
+        # several threads each running its own loop, so only join requests on this loop.
+        # Without the cache, exclude_cache_keys must not merge requests whose prompts
+        # differ, so key on the fully formatted prompt
+        if self.enable_cache:
+            key = self._cache_key(prompt, **prompt_args)
+        else:
+            key = sha256(f'{self.llm.to_json()},{prompt.format(**prompt_args)}'.encode('utf-8')).hexdigest()
+        return (asyncio.get_running_loop(), key)
+
+    def _cache_file(self, prompt: BasePromptTemplate, **prompt_args: Any) -> str:
+        return f'cache/llm/{self._cache_key(prompt, **prompt_args)}.txt'
+
     def stream(
          self,
         prompt: BasePromptTemplate,
@@ -44,22 +81,47 @@ class LLMCache(BaseModel):
             logger.info('%s%s%s', c_blue, prompt.format(**prompt_args), c_norm)
 
         try:
-            if isinstance(self.llm, BedrockConverse):
-                if not hasattr(self.llm, '_client'):
-                    config = Config(
-                        retries={'max_attempts': MAX_ATTEMPTS, 'mode': 'standard'},
-                        connect_timeout=TIMEOUT,
-                        read_timeout=TIMEOUT,
-                    )
-                    
-                    session = GraphRAGConfig.session
-                    self.llm._client = session.client('bedrock-runtime', config=config, region_name=self.llm.region_name)
+            self._init_client()
             response = self.llm.stream(prompt, **prompt_args)
         except Exception as e:
             raise ModelError(f'{e!s} [Model config: {self.llm.to_json()}]') from e
             
         return response
 
+    async def astream(
+        self,
+        prompt: BasePromptTemplate,
+        **prompt_args: Any
+    ) -> TokenAsyncGen:
+        response = None
+
+        if self.verbose_prompt:
+            logger.info('%s%s%s', c_blue, prompt.format(**prompt_args), c_norm)
+
+        try:
+            self._init_client()
+            response = await self.llm.astream(prompt, **prompt_args)
+        except Exception as e:
+            raise ModelError(f'{e!s} [Model config: {self.llm.to_json()}]') from e
+            
+        return self._astream_tokens(response)
+
+    async def _astream_tokens(self, response: TokenAsyncGen) -> TokenAsyncGen:
+        # Most model errors only surface while the stream is consumed, so wrap them
+        # here as predict does, and log the assembled response once it is complete
+        tokens = []
+
+        try:
+            async for token in response:
+                if self.verbose_response:
+                    tokens.append(token)
+                yield token
+        except Exception as e:
+            raise ModelError(f'{e!s} [Model config: {self.llm.to_json()}]') from e
+
+        if self.verbose_response:
+            logger.info('%s%s%s', c_green, ''.join(tokens), c_norm)
+
     def predict(
         self,
         prompt: BasePromptTemplate,
@@ -98,28 +160,13 @@ class LLMCache(BaseModel):
 
         if not self.enable_cache:
             try:
-                if isinstance(self.llm, BedrockConverse):
-                    if not hasattr(self.llm, '_client'):
-                        config = Config(
-                            retries={'max_attempts': MAX_ATTEMPTS, 'mode': 'standard'},
-                            connect_timeout=TIMEOUT,
-                            read_timeout=TIMEOUT,
-                        )
-                        
-                        session = GraphRAGConfig.session
-                        self.llm._client = session.client('bedrock-runtime', config=config, region_name=self.llm.region_name)
+                self._init_client()
                 response = self.llm.predict(prompt, **prompt_args)
             except Exception as e:
                 raise ModelError(f'{e!s} [Model config: {self.llm.to_json()}]') from e
         else:
 
-            prompt_args_copy = prompt_args.copy()
-            for key in prompt_args.get('exclude_cache_keys', []):
-                del prompt_args_copy[key]
-
-            cache_key = f'{self.llm.to_json()},{prompt.format(**prompt_args_copy)}'
-            cache_hex = sha256(cache_key.encode('utf-8')).hexdigest()
-            cache_file = f'cache/llm/{cache_hex}.txt'
+            cache_file = self._cache_file(prompt, **prompt_args)
 
             if os.path.exists(cache_file):
                 logger.debug('%sCached response %s%s', c_blue, cache_file, c_norm)
@@ -127,16 +174,7 @@ class LLMCache(BaseModel):
                     response = f.read()
             else:
                 try:
-                    if isinstance(self.llm, BedrockConverse):
-                        if not hasattr(self.llm, '_client'):
-                            config = Config(
-                                retries={'max_attempts': MAX_ATTEMPTS, 'mode': 'standard'},
-                                connect_timeout=TIMEOUT,
-                                read_timeout=TIMEOUT,
-                            )
-                            
-                            session = GraphRAGConfig.session
-                            self.llm._client = session.client('bedrock-runtime', config=config, region_name=self.llm.region_name)
+                    self._init_client()
                     response = self.llm.predict(prompt, **prompt_args)
                 except Exception as e:
                     raise ModelError(f'{e!s} Model config: {self.llm.to_json()}') from e
@@ -149,6 +187,87 @@ class LLMCache(BaseModel):
             
         return response
     
+    async def apredict(
+        self,
+        prompt: BasePromptTemplate,
+        **prompt_args: Any
+    ) -> str:
+        """
+        Asynchronous counterpart to `predict`.
+
+        Awaits the underlying LLM's native `apredict` rather than running the blocking
+        `predict` in a worker thread, so callers can keep many requests in flight
+        without a thread per request. Caching, verbose logging and error handling
+        behave exactly as in `predict`.
+
+        Concurrent calls with an identical prompt (for example, duplicated chunks
+        being processed in parallel) are collapsed into a single LLM request: the
+        first caller issues the request and later callers await its result.
+
+        Args:
+            prompt: A pre-formatted BasePromptTemplate instance containing the template definition
+                to generate the LLM response.
+            **prompt_args: Arbitrary keyword arguments that provide dynamic content to fill
+                in the placeholders of the given prompt template.
+
+        Returns:
+            str: The generated or cached response from the LLM.
+
+        Raises:
+            ModelError: If there is any exception while interacting with the LLM, detailed
+                configuration information is included to aid debugging.
+        """
+        key = self._inflight_key(prompt, **prompt_args)
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._apredict(prompt, **prompt_args))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            logger.debug('%sAwaiting in-flight response %s%s', c_blue, key[1], c_norm)
+
+        return await asyncio.shield(task)
+
+    async def _apredict(
+        self,
+        prompt: BasePromptTemplate,
+        **prompt_args: Any
+    ) -> str:
+        response = None
+
+        if self.verbose_prompt:
+            logger.info('%s%s%s', c_blue, prompt.format(**prompt_args), c_norm)
+
+        if not self.enable_cache:
+            try:
+                self._init_client()
+                response = await self.llm.apredict(prompt, **prompt_args)
+            except Exception as e:
+                raise ModelError(f'{e!s} [Model config: {self.llm.to_json()}]') from e
+        else:
+
+            cache_file = self._cache_file(prompt, **prompt_args)
+
+            if os.path.exists(cache_file):
+                logger.debug('%sCached response %s%s', c_blue, cache_file, c_norm)
+                with open(cache_file, 'r', encoding='utf-8') as f:
+                    response = f.read()
+            else:
+                try:
+                    self._init_client()
+                    response = await self.llm.apredict(prompt, **prompt_args)
+                except Exception as e:
+                    raise ModelError(f'{e!s} Model config: {self.llm.to_json()}') from e
+                os.makedirs(os.path.dirname(os.path.realpath(cache_file)), exist_ok=True)
+                with open(cache_file, 'w') as f:
+                    f.write(response)
+
+        if self.verbose_response:
+            logger.info('%s%s%s', c_green, response, c_norm)
+            
+        return response
+    
     @property
     def model(self):
         if not isinstance(self.llm, BedrockConverse):
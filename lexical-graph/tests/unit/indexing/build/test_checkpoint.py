@@ -96,6 +96,19 @@ class TestCheckpointWriter:
         writer.touch(target)
         assert os.path.exists(target)
 
+    def test_touch_leaves_existing_file_intact(self, tmp_path):
+        """Verify touching an existing checkpoint neither fails nor truncates it."""
+        from graphrag_toolkit.lexical_graph.indexing.node_handler import NodeHandler
+        writer = CheckpointWriter(
+            checkpoint_name='test',
+            checkpoint_dir=str(tmp_path),
+            inner=Mock(spec=NodeHandler),
+        )
+        target = tmp_path / 'existing'
+        target.write_text('x')
+        writer.touch(str(target))
+        assert target.read_text() == 'x'
+
     def test_accept_yields_from_inner(self, tmp_path):
         """Verify accept yields nodes from inner handler."""
         node = Mock()
@@ -70,8 +70,10 @@ class TestEntityGraphBuilding:
 
         builder.build(node, client, include_domain_labels=False, include_local_entities=False)
 
-        # Should have at least 2 calls: one for subject, one for object
-        assert client.execute_query_with_retry.call_count >= 2
+        # Subject and object are written by a single UNWIND query
+        assert client.execute_query_with_retry.call_count == 1
+        params = client.execute_query_with_retry.call_args.args[1]['params']
+        assert [p['e_id'] for p in params] == ['s1', 'o1']
 
     def test_build_skips_duplicate_object(self):
         """Verify build skips object when it has same entityId as subject."""
@@ -85,6 +87,88 @@ class TestEntityGraphBuilding:
         assert client.execute_query_with_retry.call_count == 1
 
 
+class TestEntityGraphBuilderBatch:
+    """Tests for batched entity graph building."""
+
+    def _make_fact_node(self, fact_id, subject_id, object_id, subject_class=None, object_class=None):
+        node = Mock()
+        node.node_id = fact_id
+        node.metadata = {
+            'fact': {
+                'factId': fact_id,
+                'subject': {'entityId': subject_id, 'value': subject_id, 'classification': subject_class},
+                'predicate': {'value': 'relates to'},
+                'object': {'entityId': object_id, 'value': object_id, 'classification': object_class},
+            }
+        }
+        return node
+
+    def _make_graph_client(self):
+        client = Mock()
+        client.node_id = Mock(side_effect=lambda field: field)
+        client.execute_query_with_retry = Mock()
+        return client
+
+    def test_build_batch_writes_all_entities_in_one_query(self):
+        """Verify entities from every fact in the batch are written with a single query."""
+        builder = EntityGraphBuilder()
+        nodes = [self._make_fact_node(f'f{i}', f's{i}', f'o{i}') for i in range(3)]
+        client = self._make_graph_client()
+
+        builder.build_batch(nodes, client, include_domain_labels=False, include_local_entities=False)
+
+        assert client.execute_query_with_retry.call_count == 1
+        query, params = client.execute_query_with_retry.call_args.args
+        assert 'UNWIND $params AS params' in query
+        assert [p['e_id'] for p in params['params']] == ['s0', 'o0', 's1', 'o1', 's2', 'o2']
+
+    def test_build_batch_buckets_domain_labels(self):
+        """Verify one label query is emitted per distinct label, binding entity ids as parameters."""
+        builder = EntityGraphBuilder()
+        nodes = [
+            self._make_fact_node('f1', 's1', 'o1', subject_class='Company', object_class='Person'),
+            self._make_fact_node('f2', 's2', 'o2', subject_class='Company', object_class='Company'),
+        ]
+        client = self._make_graph_client()
+
+        builder.build_batch(nodes, client, include_domain_labels=True, include_local_entities=False)
+
+        label_calls = [c.args for c in client.execute_query_with_retry.call_args_list if 'SET entity :' in c.args[0]]
+        assert len(label_calls) == 2
+        by_label = {q.split('SET entity :')[1]: [p['e_id'] for p in params['params']] for q, params in label_calls}
+        assert by_label == {'`Company`': ['s1', 's2', 'o2'], '`Person`': ['o1']}
+
+    def test_build_emits_identical_query_text_across_facts(self):
+        """Verify query text does not vary per fact, so graph stores can reuse cached query plans."""
+        builder = EntityGraphBuilder()
+        client = self._make_graph_client()
+
+        builder.build(self._make_fact_node('f1', 's1', 'o1', subject_class='Company', object_class='Company'), client,
+                      include_domain_labels=True, include_local_entities=False)
+        first = [c.args[0] for c in client.execute_query_with_retry.call_args_list]
+
+        client.execute_query_with_retry.reset_mock()
+        builder.build(self._make_fact_node('f2', 's2', 'o2', subject_class='Company', object_class='Company'), client,
+                      include_domain_labels=True, include_local_entities=False)
+        second = [c.args[0] for c in client.execute_query_with_retry.call_args_list]
+
+        assert first == second
+        assert not any('s1' in q or 's2' in q for q in first + second)
+
+    def test_build_batch_skips_nodes_without_fact(self):
+        """Verify nodes without fact metadata are skipped without affecting the rest of the batch."""
+        builder = EntityGraphBuilder()
+        empty = Mock()
+        empty.node_id = 'empty'
+        empty.metadata = {}
+        nodes = [empty, self._make_fact_node('f1', 's1', 'o1')]
+        client = self._make_graph_client()
+
+        builder.build_batch(nodes, client, include_domain_labels=False, include_local_entities=False)
+
+        assert client.execute_query_with_retry.call_count == 1
+
+
 class TestEntityGraphBuilderErrorHandling:
     """Tests for entity graph builder error handling."""
 
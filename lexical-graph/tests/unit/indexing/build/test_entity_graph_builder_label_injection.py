@@ -53,8 +53,8 @@ def _fact_node():
 
 
 def _domain_query(client):
-    """Return the captured domain-entity statement (the one carrying awsqid)."""
-    domain = [q for q, _ in client.queries if 'awsqid' in q]
+    """Return the captured domain-entity statement and its parameters."""
+    domain = [(q, p) for q, p in client.queries if 'domain labels' in q]
     assert domain, 'expected a domain-entity query to be emitted'
     return domain[0]
 
@@ -70,14 +70,15 @@ def test_domain_entity_query_is_escaped_and_parameterised():
         include_local_entities=False,
     )
 
-    query = _domain_query(client)
+    query, params = _domain_query(client)
 
     safe = escape_cypher_label(label_from(MALICIOUS_CLASSIFICATION))
     raw = label_from(MALICIOUS_CLASSIFICATION)
     assert f':`{safe}`' in query
     assert f':`{raw}`' not in query
-    assert '$entityId' in query
-    assert f"'{ENTITY_ID}'" not in query
+    assert 'params.e_id' in query
+    assert params == {'params': [{'e_id': ENTITY_ID}]}
+    assert ENTITY_ID not in query
 
 
 def test_label_from_passthrough_is_the_precondition():
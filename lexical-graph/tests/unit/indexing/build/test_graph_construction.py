@@ -69,7 +69,7 @@ class TestGraphConstructionAccept:
         from graphrag_toolkit.lexical_graph.indexing.build.graph_builder import GraphBuilder
         mock_builder = Mock(spec=GraphBuilder)
         mock_builder.index_key.return_value = 'chunk'
-        mock_builder.build = Mock()
+        mock_builder.build_batch = Mock()
 
         constructor = GraphConstruction(
             graph_client=mock_neptune_store,
@@ -86,4 +86,71 @@ class TestGraphConstructionAccept:
             batch_write_size=1,
         ))
 
-        mock_builder.build.assert_called_once()
+        mock_builder.build_batch.assert_called_once()
+        assert mock_builder.build_batch.call_args.args[0] == [mock_node]
+
+    def test_accept_groups_consecutive_nodes_with_same_index(self, mock_neptune_store):
+        """Verify consecutive nodes with the same index are built as one batch, bounded by batch_write_size."""
+        from graphrag_toolkit.lexical_graph.indexing.build.graph_builder import GraphBuilder
+        chunk_builder = Mock(spec=GraphBuilder)
+        chunk_builder.index_key.return_value = 'chunk'
+        fact_builder = Mock(spec=GraphBuilder)
+        fact_builder.index_key.return_value = 'fact'
+
+        constructor = GraphConstruction(
+            graph_client=mock_neptune_store,
+            builders=[chunk_builder, fact_builder],
+        )
+
+        def make_node(node_id, index):
+            node = Mock()
+            node.node_id = node_id
+            node.metadata = {INDEX_KEY: {'index': index, 'key': node_id}}
+            return node
+
+        nodes = [
+            make_node('c1', 'chunk'),
+            make_node('f1', 'fact'),
+            make_node('f2', 'fact'),
+            make_node('f3', 'fact'),
+            make_node('c2', 'chunk'),
+        ]
+
+        results = list(constructor.accept(
+            nodes,
+            batch_writes_enabled=False,
+            batch_write_size=2,
+        ))
+
+        assert results == nodes
+        assert [c.args[0] for c in chunk_builder.build_batch.call_args_list] == [[nodes[0]], [nodes[4]]]
+        assert [c.args[0] for c in fact_builder.build_batch.call_args_list] == [nodes[1:3], [nodes[3]]]
+
+    def test_accept_passes_facts_validated_once_to_builders(self, mock_neptune_store):
+        """Verify every builder for a fact run receives the same Fact for each node."""
+        from graphrag_toolkit.lexical_graph.indexing.build.graph_builder import GraphBuilder
+        from graphrag_toolkit.lexical_graph.indexing.model import Fact, Entity, Relation
+        builders = []
+        for _ in range(2):
+            builder = Mock(spec=GraphBuilder)
+            builder.index_key.return_value = 'fact'
+            builders.append(builder)
+
+        constructor = GraphConstruction(graph_client=mock_neptune_store, builders=builders)
+
+        node = Mock()
+        node.node_id = 'f1'
+        node.metadata = {
+            INDEX_KEY: {'index': 'fact', 'key': 'f1'},
+            'fact': Fact(
+                subject=Entity(value='Subject', classification='Person'),
+                predicate=Relation(value='works at'),
+                complement='Company'
+            ).model_dump()
+        }
+
+        list(constructor.accept([node], batch_writes_enabled=False, batch_write_size=10))
+
+        facts = [b.build_batch.call_args.kwargs['facts'] for b in builders]
+        assert list(facts[0]) == ['f1']
+        assert facts[0]['f1'] is facts[1]['f1']
@@ -5,6 +5,7 @@ import pytest
 from unittest.mock import Mock, patch, AsyncMock
 from llama_index.core.schema import TextNode
 from graphrag_toolkit.lexical_graph.indexing.extract.llm_proposition_extractor import LLMPropositionExtractor
+from graphrag_toolkit.lexical_graph.indexing.constants import PROPOSITIONS_KEY
 
 
 class TestLLMPropositionExtractorInitialization:
@@ -56,3 +57,71 @@ class TestLLMPropositionExtractorMocked:
         
         assert isinstance(result, list)
         assert len(result) == 0
+
+    @pytest.mark.asyncio
+    @patch('graphrag_toolkit.lexical_graph.indexing.extract.llm_proposition_extractor.GraphRAGConfig')
+    async def test_extract_propositions_streams_and_dedups(self, mock_config_class):
+        """Verify propositions are parsed from streamed tokens and de-duplicated in order."""
+        from llama_index.core.llms import MockLLM
+
+        mock_config_class.extraction_llm = MockLLM()
+        mock_config_class.enable_cache = False
+        mock_config_class.extraction_num_threads_per_worker = 1
+
+        extractor = LLMPropositionExtractor()
+
+        async def tokens():
+            for token in ['p', '1\n', '\np2\np', '1\np3']:
+                yield token
+
+        object.__setattr__(extractor.llm, 'astream', AsyncMock(return_value=tokens()))
+
+        result = await extractor._extract_propositions('some text', '')
+
+        assert result.propositions == ['p1', 'p2', 'p3']
+        extractor.llm.astream.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    @patch('graphrag_toolkit.lexical_graph.indexing.extract.llm_proposition_extractor.GraphRAGConfig')
+    async def test_extract_propositions_uses_apredict_when_cache_enabled(self, mock_config_class):
+        """Verify the full response is fetched (and so can be cached) when the LLM cache is enabled."""
+        from llama_index.core.llms import MockLLM
+
+        mock_config_class.extraction_llm = MockLLM()
+        mock_config_class.enable_cache = True
+        mock_config_class.extraction_num_threads_per_worker = 1
+
+        extractor = LLMPropositionExtractor()
+        object.__setattr__(extractor.llm, 'apredict', AsyncMock(return_value='p1\n\np2\np1\np3'))
+
+        result = await extractor._extract_propositions('some text', '')
+
+        assert result.propositions == ['p1', 'p2', 'p3']
+        extractor.llm.apredict.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    @patch('graphrag_toolkit.lexical_graph.indexing.extract.llm_proposition_extractor.GraphRAGConfig')
+    async def test_concurrent_identical_texts_share_one_llm_call(self, mock_config_class):
+        """Verify concurrent extractions for the same text make one LLM call with the cache disabled."""
+        import asyncio
+        from llama_index.core.llms import MockLLM
+
+        mock_config_class.extraction_llm = MockLLM()
+        mock_config_class.enable_cache = False
+        mock_config_class.extraction_num_threads_per_worker = 2
+
+        extractor = LLMPropositionExtractor()
+
+        async def tokens():
+            await asyncio.sleep(0.01)
+            for token in ['p1\n', 'p2']:
+                yield token
+
+        object.__setattr__(extractor.llm, 'astream', AsyncMock(side_effect=lambda *args, **kwargs: tokens()))
+
+        nodes = [TextNode(text='same text', id_='n1'), TextNode(text='same text', id_='n2')]
+        results = await extractor._extract_propositions_for_nodes(nodes)
+
+        assert extractor.llm.astream.await_count == 1
+        assert [r[PROPOSITIONS_KEY] for r in results] == [['p1', 'p2'], ['p1', 'p2']]
+        assert extractor._inflight == {}
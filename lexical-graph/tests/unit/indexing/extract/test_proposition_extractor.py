@@ -5,6 +5,7 @@ import pytest
 from unittest.mock import Mock, patch, AsyncMock
 from llama_index.core.schema import TextNode
 from graphrag_toolkit.lexical_graph.indexing.extract.proposition_extractor import PropositionExtractor
+from graphrag_toolkit.lexical_graph.indexing.model import Propositions
 
 
 class TestPropositionExtractorInitialization:
@@ -55,13 +56,13 @@ class TestPropositionExtractorMocked:
         extractor = PropositionExtractor(source_metadata_field=None)
         
         # Mock the proposition extraction
-        extractor._extract_propositions = AsyncMock(return_value=Mock(model_dump=Mock(return_value={'propositions': ["prop1", "prop2"]})))
+        extractor._extract_propositions = AsyncMock(return_value=Propositions(propositions=["prop1", "prop2"]))
         
         node = TextNode(text="Test content", id_="node1")
         result = await extractor._extract_propositions_for_node(node)
         
         assert result is not None
-        assert 'aws::graph::propositions' in result
+        assert result['aws::graph::propositions'] == ["prop1", "prop2"]
     
     @pytest.mark.asyncio
     async def test_extract_propositions_for_nodes_multiple(self):
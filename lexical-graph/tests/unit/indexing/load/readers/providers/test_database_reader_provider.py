@@ -10,4 +10,64 @@ def test_raises_exception_if_dependencies_not_installed():
     with pytest.raises(ImportError) as exc_info:  
          reader = DatabaseReaderProvider(DatabaseReaderConfig())
  
-    assert exc_info.value.args[0] == "llama-index-readers-database package not found, install with 'pip install llama-index-readers-database'"
\ No newline at end of file
+    assert exc_info.value.args[0] == "llama-index-readers-database package not found, install with 'pip install llama-index-readers-database'"
+
+def _provider(mock_reader, **config_kwargs):
+    from importlib import reload
+    from unittest.mock import MagicMock, Mock, patch
+    from graphrag_toolkit.lexical_graph.indexing.load.readers.reader_provider_config import DatabaseReaderConfig
+
+    mock_module = MagicMock()
+    mock_module.DatabaseReader = Mock(__name__='DatabaseReader', return_value=mock_reader)
+    with patch.dict('sys.modules', {'llama_index.readers.database': MagicMock(), 'llama_index.readers.database.base': mock_module}):
+        import graphrag_toolkit.lexical_graph.indexing.load.readers.providers.database_reader_provider as mod
+        reload(mod)
+        return mod.DatabaseReaderProvider(DatabaseReaderConfig(connection_string='sqlite://', **config_kwargs))
+
+
+def test_read_reruns_query_when_caching_disabled():
+    from unittest.mock import Mock
+    from llama_index.core.schema import Document
+
+    reader = Mock()
+    reader.load_data.side_effect = lambda query: [Document(text='row')]
+    provider = _provider(reader)
+
+    provider.read('SELECT 1')
+    provider.read('SELECT 1')
+
+    assert reader.load_data.call_count == 2
+
+
+def test_read_serves_cached_copies_of_repeated_query():
+    from unittest.mock import Mock
+    from llama_index.core.schema import Document
+
+    reader = Mock()
+    reader.load_data.side_effect = lambda query: [Document(text=query)]
+    provider = _provider(reader, cache_size=1, metadata_fn=lambda query: {'query': query})
+
+    first = provider.read('SELECT 1')
+    first[0].metadata['mutated'] = True
+    second = provider.read('SELECT 1')
+
+    assert reader.load_data.call_count == 1
+    assert second[0].metadata == {'query': 'SELECT 1'}
+
+    provider.read('SELECT 2')
+    provider.read('SELECT 1')
+    assert reader.load_data.call_count == 3
+
+
+def test_read_reruns_query_after_cache_ttl():
+    from unittest.mock import Mock
+    from llama_index.core.schema import Document
+
+    reader = Mock()
+    reader.load_data.side_effect = lambda query: [Document(text='row')]
+    provider = _provider(reader, cache_size=4, cache_ttl=0)
+
+    provider.read('SELECT 1')
+    provider.read('SELECT 1')
+
+    assert reader.load_data.call_count == 2
@@ -0,0 +1,51 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+import types
+
+from graphrag_toolkit.lexical_graph.indexing.load.readers.providers.directory_reader_provider import DirectoryReaderProvider
+from graphrag_toolkit.lexical_graph.indexing.load.readers.reader_provider_config import DirectoryReaderConfig
+
+
+@pytest.fixture
+def input_dir(tmp_path):
+    (tmp_path / "a.txt").write_text("alpha")
+    (tmp_path / "b.txt").write_text("beta")
+    return tmp_path
+
+
+def test_iread_yields_documents_lazily(input_dir):
+    """iread() returns a generator over the same documents read() returns."""
+    provider = DirectoryReaderProvider(DirectoryReaderConfig(input_dir=str(input_dir)))
+
+    result = provider.iread()
+
+    assert isinstance(result, types.GeneratorType)
+    assert sorted(doc.text for doc in result) == ["alpha", "beta"]
+    assert sorted(doc.text for doc in provider.read(None)) == ["alpha", "beta"]
+
+
+def test_iread_applies_metadata_fn(input_dir):
+    """metadata_fn is computed once and applied to each lazily yielded document."""
+    calls = []
+
+    def metadata_fn(path):
+        calls.append(path)
+        return {"origin": path}
+
+    provider = DirectoryReaderProvider(DirectoryReaderConfig(input_dir=str(input_dir), metadata_fn=metadata_fn))
+
+    documents = list(provider.iread())
+
+    assert [doc.metadata["origin"] for doc in documents] == [str(input_dir)] * 2
+    assert calls == [str(input_dir)]
+
+
+def test_read_wraps_errors(input_dir):
+    """Errors raised while reading are surfaced as RuntimeError."""
+    provider = DirectoryReaderProvider(DirectoryReaderConfig(input_dir=str(input_dir)))
+    (input_dir / "a.txt").unlink()
+
+    with pytest.raises(RuntimeError, match="Failed to read directory"):
+        provider.read(None)
@@ -1,13 +1,63 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
 
+import concurrent.futures
 import pytest
+from unittest.mock import Mock, patch
+from llama_index.core.schema import Document
+
+from graphrag_toolkit.lexical_graph.indexing.load.readers import llama_index_reader_provider_base as base
+from graphrag_toolkit.lexical_graph.indexing.load.readers.providers import docx_reader_provider as mod
 
 def test_raises_exception_if_dependencies_not_installed():
     from graphrag_toolkit.lexical_graph.indexing.load.readers.providers import DocxReaderProvider
-    from graphrag_toolkit.lexical_graph.indexing.load.readers.reader_provider_config import DocxReaderConfig 
-       
-    with pytest.raises(ImportError) as exc_info:  
+    from graphrag_toolkit.lexical_graph.indexing.load.readers.reader_provider_config import DocxReaderConfig
+
+    with pytest.raises(ImportError) as exc_info:
          reader = DocxReaderProvider(DocxReaderConfig())
- 
-    assert exc_info.value.args[0] == "python-docx package not found, install with 'pip install python-docx'"
\ No newline at end of file
+
+    assert exc_info.value.args[0] == "python-docx package not found, install with 'pip install python-docx'"
+
+def _provider(tmp_path, num_workers):
+    paths = []
+    for name in ["a.docx", "b.docx", "c.docx"]:
+        path = tmp_path / name
+        path.write_bytes(b"")
+        paths.append(str(path))
+
+    provider = object.__new__(mod.DocxReaderProvider)
+    provider._reader = Mock()
+    provider._reader.load_data.side_effect = lambda file: [Document(text=file)]
+    provider.metadata_fn = lambda path: {"origin": path}
+    provider.num_workers = num_workers
+    return provider, paths
+
+def test_read_multiple_files_in_process_by_default(tmp_path):
+    """Without num_workers, every file in a list is parsed in the calling process, in order."""
+    provider, paths = _provider(tmp_path, num_workers=1)
+
+    with patch.object(base, "_get_worker_pool") as get_worker_pool:
+        documents = provider.read(paths)
+
+    get_worker_pool.assert_not_called()
+    assert [d.text for d in documents] == paths
+    assert [d.metadata["origin"] for d in documents] == paths
+
+def test_read_multiple_files_in_worker_pool(tmp_path):
+    """With num_workers, every file in a list is parsed in the worker pool, and results keep input order."""
+    provider, paths = _provider(tmp_path, num_workers=2)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as pool, \
+         patch.object(mod, "_load_docx", side_effect=lambda p: [Document(text=p)]), \
+         patch.object(base, "_get_worker_pool", return_value=pool):
+        documents = provider.read(paths)
+
+    assert [d.text for d in documents] == paths
+    assert [d.metadata["origin"] for d in documents] == paths
+    provider._reader.load_data.assert_not_called()
+
+def test_reader_accepts_a_source_list():
+    """read_many hands the whole list to read() rather than calling it from a thread per file."""
+    from graphrag_toolkit.lexical_graph.indexing.load.readers.providers import DocxReaderProvider
+
+    assert DocxReaderProvider.accepts_source_list is True
@@ -53,4 +53,142 @@ def test_read_returns_empty_list_when_token_none(caplog):
             result = provider.read("awslabs/graphrag-toolkit")
 
         assert result == []
-        assert "No GitHub token configured" in caplog.text
\ No newline at end of file
+        assert "No GitHub token configured" in caplog.text
+
+def _cached_provider(mock_github_module, cache_dir):
+    from importlib import reload
+    from graphrag_toolkit.lexical_graph.indexing.load.readers.reader_provider_config import GitHubReaderConfig
+    import graphrag_toolkit.lexical_graph.indexing.load.readers.providers.github_reader_provider as mod
+    reload(mod)
+    return mod.GitHubReaderProvider(GitHubReaderConfig(github_token="token", cache_dir=str(cache_dir)))
+
+
+def _set_tree_sha(mock_github_module, tree_sha):
+    from unittest.mock import AsyncMock
+    branch_data = MagicMock()
+    branch_data.commit.commit.tree.sha = tree_sha
+    mock_github_module.GithubClient.return_value.get_branch = AsyncMock(return_value=branch_data)
+
+
+def test_read_reuses_cached_documents_while_tree_unchanged(tmp_path):
+    """A second read of an unchanged branch is served from the cache."""
+    from llama_index.core.schema import Document
+
+    mock_github_module = MagicMock()
+    load_data = mock_github_module.GithubRepositoryReader.return_value.load_data
+    load_data.return_value = [Document(text="readme")]
+    _set_tree_sha(mock_github_module, "abc123")
+
+    with patch.dict('sys.modules', {'llama_index.readers.github': mock_github_module}):
+        provider = _cached_provider(mock_github_module, tmp_path)
+        first = provider.read("awslabs/graphrag-toolkit")
+        second = provider.read("awslabs/graphrag-toolkit")
+
+    assert [d.text for d in first] == ["readme"]
+    assert [d.text for d in second] == ["readme"]
+    load_data.assert_called_once_with(branch="main")
+
+
+def test_read_reloads_when_tree_changes(tmp_path):
+    """A new tree SHA invalidates the cached documents."""
+    from llama_index.core.schema import Document
+
+    mock_github_module = MagicMock()
+    load_data = mock_github_module.GithubRepositoryReader.return_value.load_data
+    load_data.side_effect = [[Document(text="v1")], [Document(text="v2")]]
+
+    with patch.dict('sys.modules', {'llama_index.readers.github': mock_github_module}):
+        provider = _cached_provider(mock_github_module, tmp_path)
+        _set_tree_sha(mock_github_module, "sha1")
+        provider.read("awslabs/graphrag-toolkit")
+        _set_tree_sha(mock_github_module, "sha2")
+        result = provider.read("awslabs/graphrag-toolkit")
+
+    assert [d.text for d in result] == ["v2"]
+    assert load_data.call_count == 2
+    assert len(list(tmp_path.glob("*.pkl"))) == 1
+
+
+def test_read_serves_stale_cache_when_branch_lookup_fails(tmp_path):
+    """If the branch cannot be resolved, the last cached documents are returned."""
+    from unittest.mock import AsyncMock
+    from llama_index.core.schema import Document
+
+    mock_github_module = MagicMock()
+    load_data = mock_github_module.GithubRepositoryReader.return_value.load_data
+    load_data.return_value = [Document(text="readme")]
+    _set_tree_sha(mock_github_module, "abc123")
+
+    with patch.dict('sys.modules', {'llama_index.readers.github': mock_github_module}):
+        provider = _cached_provider(mock_github_module, tmp_path)
+        provider.read("awslabs/graphrag-toolkit")
+        mock_github_module.GithubClient.return_value.get_branch = AsyncMock(side_effect=ConnectionError("offline"))
+        result = provider.read("awslabs/graphrag-toolkit")
+
+    assert [d.text for d in result] == ["readme"]
+    load_data.assert_called_once()
+
+
+def test_read_passes_concurrency_and_throttles_client():
+    """The reader gets the configured concurrency and the client's requests are throttled."""
+    from importlib import reload
+    from graphrag_toolkit.lexical_graph.indexing.load.readers.reader_provider_config import GitHubReaderConfig
+
+    mock_github_module = MagicMock()
+    client = mock_github_module.GithubClient.return_value
+    original_request = client.request
+    with patch.dict('sys.modules', {'llama_index.readers.github': mock_github_module}):
+        import graphrag_toolkit.lexical_graph.indexing.load.readers.providers.github_reader_provider as mod
+        reload(mod)
+        provider = mod.GitHubReaderProvider(GitHubReaderConfig(github_token="token", max_concurrency=3))
+        provider.read("awslabs/graphrag-toolkit")
+
+    kwargs = mock_github_module.GithubRepositoryReader.call_args.kwargs
+    assert kwargs['concurrent_requests'] == 3
+    assert kwargs['github_client'] is client
+    assert client.request is not original_request
+
+
+def test_throttle_requests_spaces_out_concurrent_calls():
+    """Concurrent requests through a throttled client start at least min_interval_ms apart."""
+    import asyncio
+    import time
+    from graphrag_toolkit.lexical_graph.indexing.load.readers.providers.github_reader_provider import _throttle_requests
+
+    started = []
+
+    class Client:
+        async def request(self, endpoint):
+            started.append(time.monotonic())
+            return endpoint
+
+    client = _throttle_requests(Client(), min_interval_ms=20)
+
+    async def run():
+        return await asyncio.gather(*(client.request(i) for i in range(4)))
+
+    assert asyncio.run(run()) == [0, 1, 2, 3]
+    gaps = [b - a for a, b in zip(started, started[1:])]
+    assert all(gap >= 0.015 for gap in gaps)
+
+
+def test_providers_share_one_client_per_token():
+    """Providers with the same token reuse a single throttled GithubClient, whatever their other settings."""
+    from importlib import reload
+    from graphrag_toolkit.lexical_graph.indexing.load.readers.reader_provider_config import GitHubReaderConfig
+
+    mock_github_module = MagicMock()
+    mock_github_module.GithubClient.side_effect = lambda **kwargs: MagicMock()
+    with patch.dict('sys.modules', {'llama_index.readers.github': mock_github_module}):
+        import graphrag_toolkit.lexical_graph.indexing.load.readers.providers.github_reader_provider as mod
+        reload(mod)
+        mod.GitHubReaderProvider(GitHubReaderConfig(github_token="token", min_interval_ms=50)).read("awslabs/graphrag-toolkit")
+        mod.GitHubReaderProvider(GitHubReaderConfig(github_token="token", verbose=True, min_interval_ms=200)).read("awslabs/other-repo")
+        mod.GitHubReaderProvider(GitHubReaderConfig(github_token="token", min_interval_ms=0)).read("awslabs/other-repo")
+        mod.GitHubReaderProvider(GitHubReaderConfig(github_token="other")).read("awslabs/graphrag-toolkit")
+
+    assert mock_github_module.GithubClient.call_count == 2
+    clients = [c.kwargs['github_client'] for c in mock_github_module.GithubRepositoryReader.call_args_list]
+    assert clients[0] is clients[1] is clients[2]
+    assert clients[3] is not clients[0]
+    assert clients[0]._request_throttle.min_interval_ms == 200
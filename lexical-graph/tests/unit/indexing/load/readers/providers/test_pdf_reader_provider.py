@@ -0,0 +1,52 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import concurrent.futures
+from unittest.mock import Mock, patch
+from llama_index.core.schema import Document
+
+from graphrag_toolkit.lexical_graph.indexing.load.readers import llama_index_reader_provider_base as base
+from graphrag_toolkit.lexical_graph.indexing.load.readers.providers import pdf_reader_provider as mod
+
+def _provider(tmp_path, num_workers, return_full_document=False):
+    paths = []
+    for name in ["a.pdf", "b.pdf"]:
+        path = tmp_path / name
+        path.write_bytes(b"")
+        paths.append(str(path))
+
+    provider = object.__new__(mod.PDFReaderProvider)
+    provider._reader = Mock()
+    provider._reader.load_data.side_effect = lambda file_path, **kwargs: [Document(text=file_path), Document(text=file_path)]
+    provider.return_full_document = return_full_document
+    provider.metadata_fn = lambda path: {"origin": path}
+    provider.num_workers = num_workers
+    return provider, paths
+
+def test_read_multiple_files_in_process_by_default(tmp_path):
+    """Without num_workers, each PDF is parsed in the calling process, in order, with its own metadata."""
+    provider, paths = _provider(tmp_path, num_workers=1, return_full_document=True)
+
+    with patch.object(base, "_get_worker_pool") as get_worker_pool:
+        documents = provider.read(paths)
+
+    get_worker_pool.assert_not_called()
+    assert [d.text for d in documents] == [paths[0], paths[0], paths[1], paths[1]]
+    assert [d.metadata["origin"] for d in documents] == [d.text for d in documents]
+    assert all(d.metadata["source"] == "local_file" for d in documents)
+    assert all(c.kwargs["return_full_document"] for c in provider._reader.load_data.call_args_list)
+
+def test_read_multiple_files_in_worker_pool(tmp_path):
+    """With num_workers, each PDF is parsed by _load_pdf in the worker pool, in order, with its own metadata."""
+    provider, paths = _provider(tmp_path, num_workers=2)
+    reader = Mock()
+    reader.load_data.side_effect = lambda file_path: [Document(text=file_path)]
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as pool, \
+         patch.object(mod, "_pdf_reader", return_value=reader), \
+         patch.object(base, "_get_worker_pool", return_value=pool):
+        documents = provider.read(paths)
+
+    assert [d.text for d in documents] == paths
+    assert [d.metadata["origin"] for d in documents] == paths
+    provider._reader.load_data.assert_not_called()
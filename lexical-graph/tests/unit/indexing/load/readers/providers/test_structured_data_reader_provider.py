@@ -0,0 +1,18 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+from graphrag_toolkit.lexical_graph.indexing.load.readers.providers.structured_data_reader_provider import StructuredDataReaderProvider
+from graphrag_toolkit.lexical_graph.indexing.load.readers.reader_provider_config import StructuredDataReaderConfig
+
+
+def test_read_joins_selected_columns_per_row(tmp_path):
+    """Multi-column selections are joined per row, keeping each column's own formatting."""
+    csv_file = tmp_path / "data.csv"
+    csv_file.write_text("id,score,name\n1,2.5,alpha\n2,3.0,beta\n")
+
+    config = StructuredDataReaderConfig(col_index=[0, 1, 2], col_joiner=" | ", metadata_fn=lambda path: {"origin": path})
+    documents = StructuredDataReaderProvider(config).read(str(csv_file))
+
+    assert [doc.text for doc in documents] == ["1 | 2.5 | alpha", "2 | 3.0 | beta"]
+    assert all(doc.metadata["file_type"] == "csv" for doc in documents)
+    assert all(doc.metadata["origin"] == str(csv_file) for doc in documents)
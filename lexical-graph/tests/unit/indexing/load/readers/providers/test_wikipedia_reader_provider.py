@@ -76,3 +76,46 @@ def test_read_raises_on_empty_input():
 
         with pytest.raises(ValueError, match="cannot be None or empty"):
             provider.read("")
+
+
+def test_read_fetches_pages_concurrently_and_preserves_order():
+    """Test that each page is loaded separately, results keep input order and metadata_fn runs once per page."""
+    from llama_index.core.schema import Document
+    from graphrag_toolkit.lexical_graph.indexing.load.readers.reader_provider_config import WikipediaReaderConfig
+
+    class PageError(Exception):
+        pass
+
+    class DisambiguationError(Exception):
+        pass
+
+    def page(title):
+        if title == 'Missing':
+            raise PageError(title)
+
+    mock_wikipedia = MagicMock()
+    mock_wikipedia.exceptions.PageError = PageError
+    mock_wikipedia.exceptions.DisambiguationError = DisambiguationError
+    mock_wikipedia.page.side_effect = page
+    mock_wikipedia.search.return_value = []
+
+    mock_reader = Mock()
+    mock_reader.load_data.side_effect = lambda pages: [Document(text=pages[0])]
+    mock_module = MagicMock()
+    mock_module.WikipediaReader.return_value = mock_reader
+
+    metadata_fn = Mock(side_effect=lambda page: {'source': 'wiki', 'title': page})
+
+    with patch.dict('sys.modules', {'llama_index.readers.wikipedia': mock_module, 'wikipedia': mock_wikipedia}):
+        from importlib import reload
+        import graphrag_toolkit.lexical_graph.indexing.load.readers.providers.wikipedia_reader_provider as mod
+        reload(mod)
+
+        provider = mod.WikipediaReaderProvider(WikipediaReaderConfig(metadata_fn=metadata_fn, max_concurrency=4))
+        docs = provider.read(['Alpha', 'Missing', 'Beta', 'Gamma'])
+
+    assert [d.text for d in docs] == ['Alpha', 'Beta', 'Gamma']
+    assert mock_reader.load_data.call_count == 3
+    assert all(d.metadata['source'] == 'wiki' for d in docs)
+    assert [d.metadata['title'] for d in docs] == ['Alpha', 'Beta', 'Gamma']
+    assert [c.args[0] for c in metadata_fn.call_args_list] == ['Alpha', 'Beta', 'Gamma']
@@ -126,6 +126,27 @@ class TestLlamaIndexReaderProviderBaseRead:
         assert len(result) == 2
         assert all(isinstance(doc, Document) for doc in result)
     
+    def test_iread_yields_documents_from_read(self):
+        """Verify iread() yields the documents returned by read()."""
+        config = ReaderProviderConfig()
+        
+        class MockReader(BaseReader):
+            def load_data(self, *args, **kwargs):
+                return [
+                    Document(text="doc1"),
+                    Document(text="doc2")
+                ]
+        
+        provider = LlamaIndexReaderProviderBase(
+            config=config,
+            reader_cls=MockReader
+        )
+        
+        result = provider.iread("input")
+        
+        assert not isinstance(result, list)
+        assert [doc.text for doc in result] == ["doc1", "doc2"]
+    
     def test_read_with_empty_result(self):
         """Verify read() handles empty result."""
         config = ReaderProviderConfig()
@@ -293,3 +314,108 @@ class TestLlamaIndexReaderProviderBaseIntegration:
         assert result[0].metadata["source"] == "complex_source"
         assert "nested" in result[0].metadata
         assert "list" in result[0].metadata
+
+
+class TestLlamaIndexReaderProviderBaseReadMany:
+    """Tests for read_many() method."""
+
+    def test_read_many_preserves_source_order(self):
+        """Verify read_many() flattens documents in source order."""
+        config = ReaderProviderConfig()
+
+        class MockReader(BaseReader):
+            def load_data(self, source):
+                return [Document(text=f"{source}-a"), Document(text=f"{source}-b")]
+
+        provider = LlamaIndexReaderProviderBase(config=config, reader_cls=MockReader)
+
+        result = provider.read_many(["s1", "s2", "s3"], max_workers=2)
+
+        assert [doc.text for doc in result] == ["s1-a", "s1-b", "s2-a", "s2-b", "s3-a", "s3-b"]
+
+    def test_read_many_with_no_sources(self):
+        """Verify read_many() returns an empty list for no sources."""
+        provider = LlamaIndexReaderProviderBase(config=ReaderProviderConfig(), reader_cls=Mock)
+
+        assert provider.read_many([]) == []
+
+    def test_read_many_calls_read_once_for_list_sources(self):
+        """Verify providers accepting a source list are read in one call."""
+        config = ReaderProviderConfig()
+
+        class MockReader(BaseReader):
+            def load_data(self, sources):
+                return [Document(text=source) for source in sources]
+
+        provider = LlamaIndexReaderProviderBase(config=config, reader_cls=MockReader)
+        provider.accepts_source_list = True
+        provider._reader.load_data = Mock(wraps=provider._reader.load_data)
+
+        result = provider.read_many(["u1", "u2"])
+
+        assert [doc.text for doc in result] == ["u1", "u2"]
+        provider._reader.load_data.assert_called_once_with(["u1", "u2"])
+
+    def test_read_many_propagates_read_errors(self):
+        """Verify errors from an individual read surface from read_many()."""
+        config = ReaderProviderConfig()
+
+        class FailingReader(BaseReader):
+            def load_data(self, source):
+                raise ValueError("Reader failed")
+
+        provider = LlamaIndexReaderProviderBase(config=config, reader_cls=FailingReader)
+
+        with pytest.raises(RuntimeError, match="Failed to read using FailingReader"):
+            provider.read_many(["a", "b"])
+
+
+class TestMapInWorkerProcesses:
+    """Tests for the process pools shared by reader providers."""
+
+    @pytest.fixture(autouse=True)
+    def worker_pools(self, monkeypatch):
+        from graphrag_toolkit.lexical_graph.indexing.load.readers import llama_index_reader_provider_base as base
+        monkeypatch.setattr(base, '_worker_pools', {})
+        yield base
+        base.shutdown_worker_pools()
+
+    def test_pool_is_created_once_per_worker_count_with_spawn_context(self, worker_pools):
+        """Verify one spawn-context pool is reused for each worker count."""
+        base = worker_pools
+
+        pool = base._get_worker_pool(2)
+
+        assert base._get_worker_pool(2) is pool
+        assert base._get_worker_pool(3) is not pool
+        assert pool._mp_context.get_start_method() == 'spawn'
+
+    def test_map_preserves_order(self, worker_pools):
+        """Verify results come back in input order."""
+        import concurrent.futures
+        base = worker_pools
+        base._worker_pools[2] = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+
+        assert base.map_in_worker_processes(str.upper, ['a', 'b', 'c'], max_workers=2) == ['A', 'B', 'C']
+
+    def test_broken_pool_is_discarded_and_work_done_in_process(self, worker_pools):
+        """Verify a broken pool is dropped and the work is done in the calling process."""
+        from concurrent.futures.process import BrokenProcessPool
+        base = worker_pools
+        broken = Mock()
+        broken.map.side_effect = BrokenProcessPool('worker died')
+        base._worker_pools[2] = broken
+
+        assert base.map_in_worker_processes(str.upper, ['a', 'b'], max_workers=2) == ['A', 'B']
+        assert base._worker_pools == {}
+
+    def test_shutdown_worker_pools(self, worker_pools):
+        """Verify shutdown_worker_pools shuts down and forgets every pool."""
+        base = worker_pools
+        pool = Mock()
+        base._worker_pools[2] = pool
+
+        base.shutdown_worker_pools()
+
+        pool.shutdown.assert_called_once_with()
+        assert base._worker_pools == {}
@@ -297,6 +297,17 @@ class TestS3DirectoryReaderConfig:
                 prefix="directory/"
             )
 
+    def test_boto3_session_cached_per_config(self):
+        """Verify a config reuses its boto3 session, but configs do not share one."""
+        first = S3DirectoryReaderConfig(bucket="test-bucket", key="a.txt", aws_region="us-west-2")
+        second = S3DirectoryReaderConfig(bucket="test-bucket", key="a.txt", aws_region="us-west-2")
+        other_region = S3DirectoryReaderConfig(bucket="test-bucket", key="a.txt", aws_region="eu-west-1")
+
+        assert first.get_boto3_session() is first.get_boto3_session()
+        assert first.get_boto3_session() is not second.get_boto3_session()
+        assert other_region.get_boto3_session().region_name == "eu-west-1"
+        assert first == second
+
 
 class TestStructuredDataReaderConfig:
     """Tests for StructuredDataReaderConfig."""
@@ -5,7 +5,7 @@ import pytest
 import tempfile
 import os
 from unittest.mock import Mock, patch, MagicMock
-from graphrag_toolkit.lexical_graph.indexing.load.readers.s3_file_mixin import S3FileMixin
+from graphrag_toolkit.lexical_graph.indexing.load.readers.s3_file_mixin import S3FileMixin, S3_TRANSFER_CONFIG
 
 
 class TestS3FileMixinPathDetection:
@@ -30,6 +30,74 @@ class TestS3FileMixinPathDetection:
 
 class TestS3FileMixinDownload:
     """Tests for S3 file download functionality."""
+
+    def test_download_s3_file_uses_transfer_config(self):
+        """Verify _download_s3_file() downloads with the bounded transfer config."""
+        mixin = S3FileMixin()
+        s3_client = Mock()
+
+        temp_path = mixin._download_s3_file("s3://bucket/docs/file.pdf", s3_client)
+
+        try:
+            s3_client.download_file.assert_called_once_with(
+                "bucket", "docs/file.pdf", temp_path, Config=S3_TRANSFER_CONFIG
+            )
+            assert temp_path.endswith(".pdf")
+        finally:
+            os.unlink(temp_path)
+
+    @patch('graphrag_toolkit.lexical_graph.config.GraphRAGConfig')
+    def test_process_file_paths_downloads_s3_files_with_shared_client(self, mock_config):
+        """Verify S3 paths are downloaded with one client and keep their order."""
+        mixin = S3FileMixin()
+        mixin._download_s3_file = Mock(side_effect=lambda path, client: f"/tmp/{path[-5:]}")
+
+        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
+            local_path = temp_file.name
+
+        try:
+            paths = ["s3://bucket/a.pdf", local_path, "s3://bucket/b.pdf", "s3://bucket/a.pdf"]
+            processed, temp_files, original = mixin._process_file_paths(paths)
+        finally:
+            os.unlink(local_path)
+
+        assert processed == ["/tmp/a.pdf", local_path, "/tmp/b.pdf", "/tmp/a.pdf"]
+        assert sorted(temp_files) == ["/tmp/a.pdf", "/tmp/b.pdf"]
+        assert original == paths
+        assert mixin._download_s3_file.call_count == 2
+        mock_config.session.client.assert_not_called()
+        s3_client = mock_config.s3
+        assert all(call.args[1] is s3_client for call in mixin._download_s3_file.call_args_list)
+
+    @patch('graphrag_toolkit.lexical_graph.config.GraphRAGConfig')
+    def test_process_file_paths_cleans_up_when_a_download_fails(self, mock_config):
+        """Verify completed downloads are cleaned up if another download fails."""
+        mixin = S3FileMixin()
+
+        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
+            downloaded_path = temp_file.name
+
+        def download(path, client):
+            if path.endswith("bad.pdf"):
+                raise RuntimeError("Failed to download S3 file: denied")
+            return downloaded_path
+
+        mixin._download_s3_file = Mock(side_effect=download)
+
+        with pytest.raises(RuntimeError, match="denied"):
+            mixin._process_file_paths(["s3://bucket/good.pdf", "s3://bucket/bad.pdf"])
+
+        assert not os.path.exists(downloaded_path)
+
+    def test_process_file_paths_checks_local_files_before_downloading(self):
+        """Verify a missing local file fails before any S3 download starts."""
+        mixin = S3FileMixin()
+        mixin._download_s3_file = Mock()
+
+        with pytest.raises(FileNotFoundError, match="File not found"):
+            mixin._process_file_paths(["s3://bucket/a.pdf", "/nonexistent/file.txt"])
+
+        mixin._download_s3_file.assert_not_called()
     
 
 class TestS3FileMixinProcessFilePaths:
@@ -183,3 +251,11 @@ class TestS3FileMixinIntegration:
         finally:
             if os.path.exists(temp_path):
                 os.unlink(temp_path)
+
+
+class TestS3TransferConfig:
+    """Tests for the S3 transfer configuration."""
+
+    def test_reads_response_bodies_in_large_chunks(self):
+        """Verify downloads read 1 MB at a time rather than boto3's 256 KB default."""
+        assert S3_TRANSFER_CONFIG.io_chunksize == 1024 * 1024
@@ -9,7 +9,8 @@ from graphrag_toolkit.lexical_graph.indexing.load.s3_based_docs import (
     S3DocDownloader,
     S3DocUploader,
     S3ChunkDownloader,
-    S3ChunkUploader
+    S3ChunkUploader,
+    list_keys_by_prefix
 )
 from graphrag_toolkit.lexical_graph.indexing.model import SourceDocument
 
@@ -425,3 +426,59 @@ class TestS3DownloaderCommonPrefixes:
             for obj in page.get('CommonPrefixes', [])
         ]
         assert source_doc_prefixes == ['p/c/doc1/']
+
+
+class TestListKeysByPrefix:
+    """Tests for the single-pass collection listing."""
+
+    def _s3_client(self, pages):
+        s3_client = MagicMock()
+        s3_client.get_paginator.return_value.paginate.return_value = pages
+        return s3_client
+
+    def test_groups_keys_by_source_document_prefix(self):
+        """Keys are grouped by first-level prefix, nested keys included, in listing order."""
+        s3_client = self._s3_client([
+            {'Contents': [{'Key': 'p/c/doc1/a.jsonl'}, {'Key': 'p/c/doc1/nested/b.jsonl'}]},
+            {'KeyCount': 0},
+            {'Contents': [{'Key': 'p/c/doc2/c.jsonl'}, {'Key': 'p/c/manifest.json'}]}
+        ])
+
+        result = list_keys_by_prefix(s3_client, 'test-bucket', 'p/c/')
+
+        assert result == {
+            'p/c/doc1/': ['p/c/doc1/a.jsonl', 'p/c/doc1/nested/b.jsonl'],
+            'p/c/doc2/': ['p/c/doc2/c.jsonl']
+        }
+        s3_client.get_paginator.return_value.paginate.assert_called_once_with(
+            Bucket='test-bucket', Prefix='p/c/'
+        )
+
+    @patch('graphrag_toolkit.lexical_graph.indexing.load.s3_based_docs.GraphRAGConfig')
+    def test_chunk_downloader_lists_collection_once(self, mock_config):
+        """S3ChunkDownloader downloads every chunk without re-listing each prefix."""
+        mock_s3 = self._s3_client([
+            {'Contents': [{'Key': 'p/c/doc1/1.json'}, {'Key': 'p/c/doc1/2.json'}, {'Key': 'p/c/doc2/3.json'}]}
+        ])
+        mock_config.s3 = mock_s3
+        mock_config.extraction_num_threads_per_worker = 2
+
+        def download_fileobj(bucket, key, stream):
+            stream.write(TextNode(text=key, id_=key).to_json().encode('UTF-8'))
+
+        mock_s3.download_fileobj.side_effect = download_fileobj
+
+        downloader = S3ChunkDownloader(
+            key_prefix='p',
+            collection_id='c',
+            bucket_name='test-bucket',
+            fn=lambda node: node
+        )
+
+        docs = list(downloader.download())
+
+        assert [[n.text for n in doc.nodes] for doc in docs] == [
+            ['p/c/doc1/1.json', 'p/c/doc1/2.json'],
+            ['p/c/doc2/3.json']
+        ]
+        mock_s3.get_paginator.return_value.paginate.assert_called_once()
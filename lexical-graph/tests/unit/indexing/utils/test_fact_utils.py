@@ -2,7 +2,8 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import pytest
-from graphrag_toolkit.lexical_graph.indexing.utils.fact_utils import string_complement_to_entity
+from llama_index.core.schema import TextNode
+from graphrag_toolkit.lexical_graph.indexing.utils.fact_utils import string_complement_to_entity, fact_from_metadata, facts_from_nodes, fact_from_node
 from graphrag_toolkit.lexical_graph.indexing.model import Fact, Entity, Relation
 from graphrag_toolkit.lexical_graph.indexing.constants import LOCAL_ENTITY_CLASSIFICATION
 
@@ -152,3 +153,44 @@ class TestStringComplementToEntity:
         assert isinstance(result.complement, Entity)
         assert result.complement.value == "99.99"
         assert result.complement.classification == LOCAL_ENTITY_CLASSIFICATION
+
+
+class TestFactFromMetadata:
+    """Tests for fact_from_metadata function."""
+
+    def _metadata(self):
+        return Fact(
+            subject=Entity(value="Subject", classification="Person"),
+            predicate=Relation(value="works at"),
+            complement="Company Name"
+        ).model_dump()
+
+    def test_validates_and_converts_string_complement(self):
+        """Verify metadata is validated and a string complement becomes an Entity."""
+        fact = fact_from_metadata(self._metadata())
+
+        assert isinstance(fact, Fact)
+        assert fact.subject.value == "Subject"
+        assert isinstance(fact.complement, Entity)
+        assert fact.complement.classification == LOCAL_ENTITY_CLASSIFICATION
+
+    def test_facts_from_nodes_keys_facts_by_node_id(self):
+        """Verify only nodes with fact metadata are validated, keyed by node id."""
+        nodes = [
+            TextNode(id_='f1', text='', metadata={'fact': self._metadata()}),
+            TextNode(id_='c1', text='', metadata={}),
+        ]
+
+        facts = facts_from_nodes(nodes)
+
+        assert list(facts) == ['f1']
+        assert facts['f1'].subject.value == "Subject"
+
+    def test_fact_from_node_prefers_prevalidated_fact(self):
+        """Verify a Fact passed in `facts` is used instead of revalidating the metadata."""
+        node = TextNode(id_='f1', text='', metadata={'fact': self._metadata()})
+        facts = facts_from_nodes([node])
+
+        assert fact_from_node(node, facts=facts) is facts['f1']
+        assert fact_from_node(node) is not facts['f1']
+        assert fact_from_node(node).subject.value == "Subject"
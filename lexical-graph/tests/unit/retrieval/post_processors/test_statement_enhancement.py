@@ -0,0 +1,119 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for StatementEnhancementPostProcessor.
+
+This module tests statement enhancement, including ordering, concurrency
+limits and fallback to the original node on failure.
+"""
+
+import asyncio
+from unittest.mock import Mock
+
+from llama_index.core.schema import NodeWithScore, TextNode
+
+from graphrag_toolkit.lexical_graph.retrieval.post_processors.statement_enhancement import StatementEnhancementPostProcessor
+from graphrag_toolkit.lexical_graph.utils import LLMCache
+
+
+def _node(statement, score=1.0):
+    return NodeWithScore(
+        node=TextNode(
+            text=statement,
+            metadata={
+                'statement': {'value': statement},
+                'chunk': {'value': f'context for {statement}'},
+                'source': {'sourceId': 's1'},
+                'search_type': 'semantic'
+            }
+        ),
+        score=score
+    )
+
+
+def _processor(apredict, max_concurrent=10):
+    llm = Mock(spec=LLMCache)
+    llm.apredict = apredict
+    return StatementEnhancementPostProcessor(llm=llm, max_concurrent=max_concurrent)
+
+
+class TestStatementEnhancementPostProcessor:
+    """Tests for StatementEnhancementPostProcessor."""
+
+    def test_postprocess_nodes_preserves_order(self):
+        """Verify enhanced nodes are returned in input order, whatever order responses arrive in."""
+        async def apredict(prompt, statement, context):
+            await asyncio.sleep(0.01 if statement == 'first' else 0)
+            return f'<modified_statement> {statement} enhanced </modified_statement>'
+
+        processor = _processor(apredict)
+
+        results = processor.postprocess_nodes([_node('first', 0.9), _node('second', 0.5)])
+
+        assert [r.node.text for r in results] == ['first enhanced', 'second enhanced']
+        assert [r.score for r in results] == [0.9, 0.5]
+        assert results[0].node.metadata['search_type'] == 'semantic'
+
+    def test_postprocess_nodes_limits_concurrent_requests(self):
+        """Verify no more than max_concurrent LLM requests are in flight at once."""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def apredict(prompt, statement, context):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return '<modified_statement>x</modified_statement>'
+
+        processor = _processor(apredict, max_concurrent=2)
+
+        results = processor.postprocess_nodes([_node(str(i)) for i in range(6)])
+
+        assert len(results) == 6
+        assert max_in_flight == 2
+
+    def test_postprocess_nodes_returns_original_node_on_failure_or_no_match(self):
+        """Verify a failed or unparseable enhancement leaves the node unchanged."""
+        async def apredict(prompt, statement, context):
+            if statement == 'fails':
+                raise RuntimeError('LLM unavailable')
+            return 'no tags here'
+
+        processor = _processor(apredict)
+        nodes = [_node('fails'), _node('unparsed')]
+
+        results = processor.postprocess_nodes(nodes)
+
+        assert results[0] is nodes[0]
+        assert results[1] is nodes[1]
+
+    def test_processors_with_the_same_prompts_share_a_template(self):
+        """Verify the enhancement template is built once per distinct prompt pair."""
+        async def apredict(prompt, statement, context):
+            return ''
+
+        default1 = _processor(apredict)
+        default2 = _processor(apredict)
+        custom = StatementEnhancementPostProcessor(llm=Mock(spec=LLMCache), system_prompt='system', user_prompt='{statement} {context}')
+
+        assert default1.enhance_template is default2.enhance_template
+        assert custom.enhance_template is not default1.enhance_template
+        assert custom.enhance_template.message_templates[0].content == 'system'
+
+    def test_postprocess_nodes_enhances_duplicate_statements_once(self):
+        """Verify nodes sharing a statement and context share a single LLM request."""
+        calls = []
+
+        async def apredict(prompt, statement, context):
+            calls.append(statement)
+            await asyncio.sleep(0)
+            return f'<modified_statement>{statement} enhanced</modified_statement>'
+
+        processor = _processor(apredict, max_concurrent=1)
+
+        results = processor.postprocess_nodes([_node('a', 0.9), _node('b', 0.8), _node('a', 0.1)])
+
+        assert sorted(calls) == ['a', 'b']
+        assert [(r.node.text, r.score) for r in results] == [('a enhanced', 0.9), ('b enhanced', 0.8), ('a enhanced', 0.1)]
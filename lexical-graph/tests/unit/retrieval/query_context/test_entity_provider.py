@@ -3,11 +3,13 @@
 
 """Tests for retrieval/query_context/entity_provider."""
 
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
+import pytest
 from llama_index.core.schema import QueryBundle
 
 from graphrag_toolkit.lexical_graph.retrieval.processors import ProcessorArgs
+from graphrag_toolkit.lexical_graph.retrieval.query_context import entity_provider
 from graphrag_toolkit.lexical_graph.retrieval.query_context.entity_provider import (
     EntityProvider,
 )
@@ -15,40 +17,49 @@ from graphrag_toolkit.lexical_graph.storage.graph.dummy_graph_store import Dummy
 from graphrag_toolkit.lexical_graph.storage.graph.graph_store import NodeId
 
 
-def _entity_row(entity_id, value, classification, score):
+def _entity_row(entity_id, value, classification, score, index=0):
     return {
         'result': {
             'entity': {'entityId': entity_id, 'value': value, 'classification': classification},
             'score': score,
-        }
+        },
+        'keywordIndex': index,
     }
 
 
-def _provider(execute_responses):
+def _provider(execute_responses, **kwargs):
     graph_store = MagicMock(spec=DummyGraphStore)
     graph_store.node_id.side_effect = lambda s: NodeId('id', s, is_property_based=False)
     graph_store.execute_query.side_effect = execute_responses
     return EntityProvider(
         graph_store=graph_store,
-        args=ProcessorArgs(num_workers=1, ec_max_entities=10),
+        args=ProcessorArgs(num_workers=1, ec_max_entities=10, **kwargs),
     ), graph_store
 
 
+@pytest.fixture(autouse=True)
+def clear_entity_cache():
+    entity_provider._entity_cache.clear()
+    yield
+    entity_provider._entity_cache.clear()
+
+
 class TestGetEntitiesForKeyword:
     def test_simple_keyword_runs_exact_match_query(self):
         provider, store = _provider([[_entity_row('e1', 'apple', 'fruit', 5)]])
         entities = provider._get_entities_for_keyword('apple')
         assert len(entities) == 1
         cypher, params = store.execute_query.call_args.args
-        assert 'entity.search_str = $keyword' in cypher
+        assert 'UNWIND $keywords AS keyword' in cypher
+        assert 'entity.search_str = keyword.keyword' in cypher
         assert 'class <> ' in cypher
-        assert params == {'keyword': 'apple'}
+        assert params == {'keywords': [{'keywordIndex': 0, 'keyword': 'apple', 'classification': None}]}
 
     def test_classified_keyword_filters_by_class(self):
         provider, store = _provider([[_entity_row('e1', 'apple', 'fruit', 5)]])
         provider._get_entities_for_keyword('apple|fruit')
         _, params = store.execute_query.call_args.args
-        assert params == {'keyword': 'apple', 'classification': 'fruit'}
+        assert params == {'keywords': [{'keywordIndex': 0, 'keyword': 'apple', 'classification': 'fruit'}]}
 
     def test_zero_score_results_dropped(self):
         # Both the exact and STARTS WITH fallback return only zero-score rows.
@@ -69,13 +80,44 @@ class TestGetEntitiesForKeyword:
         assert 'STARTS WITH' in cypher2
 
 
+class TestGetEntitiesForKeywords:
+    def test_all_keywords_share_one_exact_match_query(self):
+        provider, store = _provider([[
+            _entity_row('e1', 'apple', 'fruit', 5, index=0),
+            _entity_row('e2', 'orange', 'fruit', 2, index=1),
+        ]])
+        entities = provider._get_entities_for_keywords(['apple', 'orange|fruit'])
+        assert [[e.entity.entityId for e in es] for es in entities] == [['e1'], ['e2']]
+        assert store.execute_query.call_count == 1
+        _, params = store.execute_query.call_args.args
+        assert params == {'keywords': [
+            {'keywordIndex': 0, 'keyword': 'apple', 'classification': None},
+            {'keywordIndex': 1, 'keyword': 'orange', 'classification': 'fruit'},
+        ]}
+
+    def test_falls_back_only_for_unmatched_keywords(self):
+        provider, store = _provider([
+            [_entity_row('e1', 'apple', 'fruit', 5, index=0)],
+            [_entity_row('e3', 'orange-juice', 'drink', 4, index=1)],
+        ])
+        entities = provider._get_entities_for_keywords(['apple', 'orange'])
+        assert [[e.entity.entityId for e in es] for es in entities] == [['e1'], ['e3']]
+        assert store.execute_query.call_count == 2
+        cypher2, params2 = store.execute_query.call_args_list[1].args
+        assert 'STARTS WITH' in cypher2
+        assert params2 == {'keywords': [{'keywordIndex': 1, 'keyword': 'orange', 'classification': None}]}
+
+
 class TestGetEntities:
     def test_dedups_and_sums_scores_across_keywords(self):
         # Both keyword lookups return entity e1 with scores 3 and 5;
         # provider should sum to 8 and rank above any other.
         provider, _ = _provider([
-            [_entity_row('e1', 'apple', 'fruit', 3)],
-            [_entity_row('e1', 'apple', 'fruit', 5), _entity_row('e2', 'orange', 'fruit', 2)],
+            [
+                _entity_row('e1', 'apple', 'fruit', 3, index=0),
+                _entity_row('e1', 'apple', 'fruit', 5, index=1),
+                _entity_row('e2', 'orange', 'fruit', 2, index=1),
+            ],
         ])
         result = provider._get_entities(['apple', 'apple'], QueryBundle('q'))
         ids_scores = [(r.entity.entityId, r.score) for r in result]
@@ -88,3 +130,57 @@ class TestGetEntities:
         ])
         result = provider._get_entities(['a'], QueryBundle('q'))
         assert [r.entity.entityId for r in result] == ['e2', 'e1']
+
+    def test_returns_at_most_ec_max_entities(self):
+        provider, _ = _provider([
+            [_entity_row(f'e{i}', f'v{i}', 'x', i) for i in range(1, 15)],
+        ])
+        result = provider._get_entities(['v'], QueryBundle('q'))
+        assert [r.entity.entityId for r in result] == [f'e{i}' for i in range(14, 4, -1)]
+
+
+class TestEntityCache:
+    def test_cache_disabled_by_default(self):
+        provider, store = _provider([
+            [_entity_row('e1', 'apple', 'fruit', 5)],
+            [_entity_row('e1', 'apple', 'fruit', 5)],
+        ])
+        provider._get_entities(['apple'], QueryBundle('q'))
+        provider._get_entities(['apple'], QueryBundle('q'))
+        assert store.execute_query.call_count == 2
+
+    def test_cached_keywords_are_not_requeried(self):
+        provider, store = _provider([
+            [_entity_row('e1', 'apple', 'fruit', 5)],
+            [_entity_row('e2', 'orange', 'fruit', 2)],
+        ], ec_entity_cache_ttl=60)
+        provider._get_entities(['apple'], QueryBundle('q'))
+        result = provider._get_entities(['apple', 'orange', 'apple'], QueryBundle('q'))
+
+        assert [(r.entity.entityId, r.score) for r in result] == [('e1', 10), ('e2', 2)]
+        # Summing scores across keywords must not leak into the cached entities
+        result = provider._get_entities(['apple'], QueryBundle('q'))
+        assert [(r.entity.entityId, r.score) for r in result] == [('e1', 5)]
+        assert store.execute_query.call_count == 2
+        _, params = store.execute_query.call_args.args
+        assert params == {'keywords': [{'keywordIndex': 0, 'keyword': 'orange', 'classification': None}]}
+
+    def test_cache_is_per_graph_store(self):
+        provider1, _ = _provider([[_entity_row('e1', 'apple', 'fruit', 5)]], ec_entity_cache_ttl=60)
+        provider2, store2 = _provider([[_entity_row('e9', 'apple', 'fruit', 1)]], ec_entity_cache_ttl=60)
+        provider1._get_entities(['apple'], QueryBundle('q'))
+        result = provider2._get_entities(['apple'], QueryBundle('q'))
+        assert [r.entity.entityId for r in result] == ['e9']
+        assert store2.execute_query.call_count == 1
+
+    def test_expired_entries_are_requeried(self):
+        provider, store = _provider([
+            [_entity_row('e1', 'apple', 'fruit', 5)],
+            [_entity_row('e1', 'apple', 'fruit', 7)],
+        ], ec_entity_cache_ttl=60)
+        with patch.object(entity_provider.time, 'monotonic', return_value=1000.0):
+            provider._get_entities(['apple'], QueryBundle('q'))
+        with patch.object(entity_provider.time, 'monotonic', return_value=1061.0):
+            result = provider._get_entities(['apple'], QueryBundle('q'))
+        assert [r.score for r in result] == [7]
+        assert store.execute_query.call_count == 2
@@ -204,13 +204,8 @@ class TestNeo4jDatabaseClientExecuteQuery:
         mock_session = MagicMock()
         mock_record = MagicMock()
         mock_record.data.return_value = {"key": "value"}
-        mock_result = MagicMock()
-        mock_result.__iter__ = MagicMock(return_value=iter([mock_record]))
-        mock_session.run.return_value = mock_result
-        mock_session.__enter__ = MagicMock(return_value=mock_session)
-        mock_session.__exit__ = MagicMock(return_value=False)
         mock_driver.session.return_value = mock_session
-        mock_driver.execute_query.return_value = MagicMock()
+        mock_driver.execute_query.return_value = MagicMock(records=[mock_record])
 
         # Pre-set _client so the property doesn't try to import neo4j
         client._client = mock_driver
@@ -229,7 +224,15 @@ class TestNeo4jDatabaseClientExecuteQuery:
         mock_neo4j = MagicMock()
         with patch.dict("sys.modules", {"neo4j": mock_neo4j}):
             results = client._execute_query("MATCH (n) RETURN n", {})
-        mock_driver.execute_query.assert_called()
+        mock_driver.execute_query.assert_called_once_with("MATCH (n) RETURN n", {}, database_="neo4j")
+
+    def test_execute_query_runs_query_once_without_session(self):
+        client, mock_driver, mock_session = self._make_client_with_mock_driver()
+        mock_neo4j = MagicMock()
+        with patch.dict("sys.modules", {"neo4j": mock_neo4j}):
+            client._execute_query("MERGE (n:`__Entity__`) RETURN n", {"params": []})
+        mock_driver.execute_query.assert_called_once()
+        mock_driver.session.assert_not_called()
 
     def test_execute_query_default_empty_params(self):
         client, mock_driver, mock_session = self._make_client_with_mock_driver()
@@ -10,7 +10,7 @@ from llama_index.core.llms.mock import MockLLM
 from llama_index.llms.bedrock_converse import BedrockConverse
 
 from graphrag_toolkit.lexical_graph import ExtractionConfig
-from graphrag_toolkit.lexical_graph.lexical_graph_index import LexicalGraphIndex
+from graphrag_toolkit.lexical_graph.lexical_graph_index import LexicalGraphIndex, IndexingConfig
 from graphrag_toolkit.lexical_graph.utils.llm_cache import LLMCache
 
 class TestExtractionConfig:
@@ -46,6 +46,28 @@ class TestExtractionConfig:
 
         assert extraction_config.extraction_llm == llm_cache
 
+class TestIndexingConfig:
+
+    def test_default_chunking_is_not_shared_between_instances(self):
+        first = IndexingConfig()
+        second = IndexingConfig()
+
+        assert len(first.chunking) == 1
+        assert len(second.chunking) == 1
+        assert first.chunking is not second.chunking
+        assert first.chunking[0] is not second.chunking[0]
+
+    def test_empty_chunking_list_is_not_modified(self):
+        chunking = []
+
+        config = IndexingConfig(chunking=chunking)
+
+        assert chunking == []
+        assert len(config.chunking) == 1
+
+    def test_none_chunking_disables_chunking(self):
+        assert IndexingConfig(chunking=None).chunking is None
+
 class TestLexicalGraphIndex:
 
     def test_init_invokes_graph_store_init_hook(self):
@@ -103,3 +125,40 @@ class TestLexicalGraphIndex:
                 LexicalGraphIndex(graph_store='dummy://', vector_store='dummy://')
 
         graph_store.init.assert_called_once_with()
+
+    def test_build_components_are_created_once_per_index(self):
+        graph_store = Mock()
+        vector_store = Mock()
+
+        with (
+            patch(
+                'graphrag_toolkit.lexical_graph.lexical_graph_index.GraphStoreFactory.for_graph_store',
+                return_value=graph_store,
+            ),
+            patch(
+                'graphrag_toolkit.lexical_graph.lexical_graph_index.MultiTenantGraphStore.wrap',
+                return_value=graph_store,
+            ),
+            patch(
+                'graphrag_toolkit.lexical_graph.lexical_graph_index.VectorStoreFactory.for_vector_store',
+                return_value=vector_store,
+            ),
+            patch(
+                'graphrag_toolkit.lexical_graph.lexical_graph_index.MultiTenantVectorStore.wrap',
+                return_value=vector_store,
+            ),
+            patch.object(LexicalGraphIndex, '_configure_extraction_pipeline', return_value=([], [])),
+        ):
+            index = LexicalGraphIndex(graph_store='dummy://', vector_store='dummy://')
+
+        with (
+            patch('graphrag_toolkit.lexical_graph.lexical_graph_index.GraphConstruction.for_graph_store') as graph_construction,
+            patch('graphrag_toolkit.lexical_graph.lexical_graph_index.VectorIndexing.for_vector_store') as vector_indexing,
+        ):
+            first = index._get_build_components(False)
+            first[-1] = Mock()
+            second = index._get_build_components(False)
+
+        graph_construction.assert_called_once_with(graph_store)
+        vector_indexing.assert_called_once_with(vector_store)
+        assert second == [graph_construction.return_value, vector_indexing.return_value]
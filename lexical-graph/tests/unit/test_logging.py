@@ -20,6 +20,17 @@ from graphrag_toolkit.lexical_graph.logging import (
     set_advanced_logging_config,
     _is_valid_logging_level
 )
+import graphrag_toolkit.lexical_graph.logging as lexical_graph_logging
+
+
+@pytest.fixture(autouse=True)
+def reset_last_logging_config():
+    """Forget the last applied config so each test sees dictConfig called afresh."""
+    lexical_graph_logging._last_logging_config = None
+    lexical_graph_logging._last_logging_state = None
+    yield
+    lexical_graph_logging._last_logging_config = None
+    lexical_graph_logging._last_logging_state = None
 
 
 class TestLoggerInitialization:
@@ -170,6 +181,72 @@ class TestLoggerLevelConfiguration:
         mock_warn.assert_called_once()
         assert 'Unknown logging level' in str(mock_warn.call_args[0][0])
 
+    @patch('logging.config.dictConfig')
+    def test_set_logging_config_repeat_call_skips_dict_config(self, mock_dict_config):
+        """Verify an identical repeat call does not rebuild handlers."""
+        set_logging_config('INFO', debug_include_modules=['graphrag_toolkit'])
+        set_logging_config('INFO', debug_include_modules=['graphrag_toolkit'])
+
+        mock_dict_config.assert_called_once()
+
+    @patch('logging.config.dictConfig')
+    def test_set_logging_config_changed_call_reapplies_dict_config(self, mock_dict_config):
+        """Verify a call with a different config is applied."""
+        set_logging_config('INFO')
+        set_logging_config('DEBUG')
+
+        assert mock_dict_config.call_count == 2
+        assert mock_dict_config.call_args[0][0]['loggers']['']['level'] == 'DEBUG'
+
+    @patch('logging.config.dictConfig')
+    def test_set_logging_config_reapplies_after_external_reconfiguration(self, mock_dict_config):
+        """Verify the config is reapplied if the root handlers changed in between."""
+        root = logging.getLogger()
+        handler = logging.NullHandler()
+
+        set_logging_config('INFO')
+        root.addHandler(handler)
+        try:
+            set_logging_config('INFO')
+        finally:
+            root.removeHandler(handler)
+
+        assert mock_dict_config.call_count == 2
+
+    def test_set_logging_config_reapplies_after_external_set_level(self):
+        """Verify a repeat call restores the root level if it was changed in between."""
+        root = logging.getLogger()
+        original_level = root.level
+        original_handlers = list(root.handlers)
+        try:
+            set_logging_config('DEBUG')
+            root.setLevel(logging.WARNING)
+            with patch('logging.config.dictConfig', wraps=logging.config.dictConfig) as dict_config:
+                set_logging_config('DEBUG')
+
+            dict_config.assert_called_once()
+            assert root.level == logging.DEBUG
+        finally:
+            for handler in list(root.handlers):
+                root.removeHandler(handler)
+            for handler in original_handlers:
+                root.addHandler(handler)
+            root.setLevel(original_level)
+
+    @patch('logging.config.dictConfig')
+    def test_set_logging_config_reapplies_after_logger_disabled(self, mock_dict_config):
+        """Verify a repeat call is applied if another config disabled a logger in between."""
+        other = logging.getLogger('graphrag_toolkit.test_disabled_logger')
+
+        set_logging_config('INFO')
+        other.disabled = True
+        try:
+            set_logging_config('INFO')
+        finally:
+            other.disabled = False
+
+        assert mock_dict_config.call_count == 2
+
 
 class TestLogMessageFormatting:
     """Tests for log message formatting.
@@ -198,6 +275,13 @@ class TestLogMessageFormatting:
         assert result.endswith('.final_module')
         assert result == 'a.b.c.d.e.final_module'
     
+    def test_compact_formatter_shorten_record_name_is_cached(self):
+        """Verify _shorten_record_name reuses the result for a repeated logger name."""
+        first = CompactFormatter._shorten_record_name('graphrag_toolkit.lexical_graph.cached')
+        second = CompactFormatter._shorten_record_name('graphrag_toolkit.lexical_graph.cached')
+        assert first == 'g.l.cached'
+        assert first is second
+    
     def test_compact_formatter_format_shortens_name(self):
         """Verify CompactFormatter.format shortens record name."""
         formatter = CompactFormatter(fmt='%(name)s:%(message)s')
@@ -303,6 +387,18 @@ class TestLogOutputDestinations:
         assert 'file_handler' in config['loggers']['']['handlers']
         assert config['handlers']['file_handler']['filename'] == 'test.log'
     
+    @patch('logging.config.dictConfig')
+    def test_set_logging_config_does_not_mutate_base_config(self, mock_dict_config):
+        """Verify repeated set_logging_config calls leave BASE_LOGGING_CONFIG untouched."""
+        set_advanced_logging_config('DEBUG', excluded_modules={logging.ERROR: ['noisy_module']}, filename='first.log')
+        set_logging_config('INFO')
+        
+        config = mock_dict_config.call_args[0][0]
+        assert config['loggers']['']['handlers'] == ['stdout']
+        assert logging.ERROR not in config['filters']['moduleFilter']['excluded_modules']
+        assert BASE_LOGGING_CONFIG['loggers']['']['handlers'] == ['stdout']
+        assert BASE_LOGGING_CONFIG['loggers']['']['level'] == logging.INFO
+    
     @patch('logging.config.dictConfig')
     def test_set_advanced_logging_config_with_custom_filename(self, mock_dict_config):
         """Verify set_advanced_logging_config sets custom filename."""
@@ -589,3 +685,70 @@ class TestStructuredLogging:
         
         # No matching include rule, should return False
         assert result is False
+    
+    def test_module_filter_filter_matches_any_of_several_prefixes(self):
+        """Verify ModuleFilter matches a record against every prefix configured for its level."""
+        filter_obj = ModuleFilter(
+            included_modules={logging.INFO: '*'},
+            excluded_modules={logging.INFO: ['boto', 'urllib3', 'opensearch']}
+        )
+        
+        def record_for(name):
+            return logging.LogRecord(
+                name=name,
+                level=logging.INFO,
+                pathname='test.py',
+                lineno=1,
+                msg='Test message',
+                args=(),
+                exc_info=None
+            )
+        
+        assert filter_obj.filter(record_for('urllib3.connectionpool')) is False
+        assert filter_obj.filter(record_for('opensearchpy.transport')) is False
+        assert filter_obj.filter(record_for('graphrag_toolkit.lexical_graph')) is True
+    
+    def test_module_filter_filter_skips_message_formatting_without_message_rules(self):
+        """Verify ModuleFilter does not format the message when the level has no message rules."""
+        filter_obj = ModuleFilter(
+            included_modules={logging.DEBUG: ['graphrag_toolkit']},
+            excluded_messages={logging.WARNING: ['Removing unpickleable']}
+        )
+        record = logging.LogRecord(
+            name='graphrag_toolkit.lexical_graph',
+            level=logging.DEBUG,
+            pathname='test.py',
+            lineno=1,
+            msg='Test message',
+            args=(),
+            exc_info=None
+        )
+        record.getMessage = Mock(side_effect=AssertionError('message should not be formatted'))
+        
+        assert filter_obj.filter(record) is True
+    
+    def test_module_filter_filter_reuses_module_verdict(self):
+        """Verify ModuleFilter evaluates module rules once per level and logger name."""
+        filter_obj = ModuleFilter(
+            included_modules={logging.INFO: ['graphrag_toolkit']},
+            excluded_modules={logging.INFO: ['boto']}
+        )
+        
+        def record_for(name, level=logging.INFO):
+            return logging.LogRecord(
+                name=name,
+                level=level,
+                pathname='test.py',
+                lineno=1,
+                msg='Test message',
+                args=(),
+                exc_info=None
+            )
+        
+        with patch.object(filter_obj, '_filter_module', wraps=filter_obj._filter_module) as filter_module:
+            assert filter_obj.filter(record_for('graphrag_toolkit.lexical_graph')) is True
+            assert filter_obj.filter(record_for('graphrag_toolkit.lexical_graph')) is True
+            assert filter_obj.filter(record_for('botocore.client')) is False
+            assert filter_obj.filter(record_for('graphrag_toolkit.lexical_graph', logging.DEBUG)) is False
+        
+        assert filter_module.call_count == 3
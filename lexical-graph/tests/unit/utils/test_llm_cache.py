@@ -2,7 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 from graphrag_toolkit.lexical_graph.utils.llm_cache import LLMCache
 from graphrag_toolkit.lexical_graph import ModelError
 from llama_index.llms.bedrock_converse import BedrockConverse
@@ -248,3 +248,173 @@ class TestStream:
         cache = LLMCache(llm=llm, enable_cache=False)
         with pytest.raises(ModelError, match='stream failure'):
             cache.stream(PromptTemplate('Q: {q}'), q='x')
+
+
+class TestAPredict:
+    async def test_awaits_llm_apredict_and_returns_response(self):
+        from llama_index.core.prompts import PromptTemplate
+        llm = _llm_with_spy()
+        object.__setattr__(llm, 'apredict', AsyncMock(return_value='async answer'))
+        cache = LLMCache(llm=llm, enable_cache=False)
+        result = await cache.apredict(PromptTemplate('Q: {q}'), q='ping')
+        assert result == 'async answer'
+        llm.apredict.assert_awaited_once()
+        llm.predict.assert_not_called()
+
+    async def test_llm_exception_wrapped_in_model_error(self):
+        from llama_index.core.prompts import PromptTemplate
+        llm = _llm_with_spy()
+        object.__setattr__(llm, 'apredict', AsyncMock(side_effect=RuntimeError('upstream gone')))
+        cache = LLMCache(llm=llm, enable_cache=False)
+        with pytest.raises(ModelError, match='upstream gone'):
+            await cache.apredict(PromptTemplate('q: {q}'), q='x')
+
+    async def test_shares_cache_with_predict(self, tmp_path, monkeypatch):
+        from llama_index.core.prompts import PromptTemplate
+        monkeypatch.chdir(tmp_path)
+        llm = _llm_with_spy('fresh')
+        object.__setattr__(llm, 'apredict', AsyncMock(return_value='unused'))
+        cache = LLMCache(llm=llm, enable_cache=True)
+
+        cache.predict(PromptTemplate('Q: {q}'), q='ping')
+        result = await cache.apredict(PromptTemplate('Q: {q}'), q='ping')
+
+        assert result == 'fresh'
+        llm.apredict.assert_not_awaited()
+
+    async def test_concurrent_identical_prompts_issue_one_call(self):
+        import asyncio
+        from llama_index.core.prompts import PromptTemplate
+        release = asyncio.Event()
+
+        async def slow_apredict(prompt, **kwargs):
+            await release.wait()
+            return f"answer to {kwargs['q']}"
+
+        llm = _llm_with_spy()
+        object.__setattr__(llm, 'apredict', AsyncMock(side_effect=slow_apredict))
+        cache = LLMCache(llm=llm, enable_cache=False)
+        prompt = PromptTemplate('Q: {q}')
+
+        pending = asyncio.gather(
+            cache.apredict(prompt, q='dup'),
+            cache.apredict(prompt, q='dup'),
+            cache.apredict(prompt, q='other'),
+        )
+        await asyncio.sleep(0)
+        release.set()
+        results = await pending
+
+        assert results == ['answer to dup', 'answer to dup', 'answer to other']
+        assert llm.apredict.await_count == 2
+        assert cache._inflight == {}
+
+    async def test_excluded_cache_keys_do_not_merge_uncached_requests(self):
+        import asyncio
+        from llama_index.core.prompts import PromptTemplate
+        release = asyncio.Event()
+
+        async def slow_apredict(prompt, **kwargs):
+            await release.wait()
+            return f"answer to {kwargs['q']}"
+
+        llm = _llm_with_spy()
+        object.__setattr__(llm, 'apredict', AsyncMock(side_effect=slow_apredict))
+        cache = LLMCache(llm=llm, enable_cache=False)
+        prompt = PromptTemplate('Q: {q}')
+
+        pending = asyncio.gather(
+            cache.apredict(prompt, q='first', exclude_cache_keys=['q']),
+            cache.apredict(prompt, q='second', exclude_cache_keys=['q']),
+        )
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await pending == ['answer to first', 'answer to second']
+        assert llm.apredict.await_count == 2
+
+    def test_identical_prompts_on_different_loops_do_not_share_a_task(self):
+        import asyncio
+        import threading
+        from llama_index.core.prompts import PromptTemplate
+        both_started = threading.Barrier(2)
+
+        async def slow_apredict(prompt, **kwargs):
+            await asyncio.to_thread(both_started.wait, 5)
+            return f"answer to {kwargs['q']}"
+
+        llm = _llm_with_spy()
+        object.__setattr__(llm, 'apredict', AsyncMock(side_effect=slow_apredict))
+        cache = LLMCache(llm=llm, enable_cache=False)
+        results, errors = [], []
+
+        def run():
+            try:
+                results.append(asyncio.run(cache.apredict(PromptTemplate('Q: {q}'), q='same')))
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=run) for _ in range(2)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert errors == []
+        assert results == ['answer to same', 'answer to same']
+        assert cache._inflight == {}
+
+
+class TestAStream:
+    async def test_astream_awaits_llm_astream_and_returns_response(self):
+        from llama_index.core.prompts import PromptTemplate
+
+        async def tokens():
+            for token in ['tok1', 'tok2']:
+                yield token
+
+        llm = _llm_with_spy()
+        object.__setattr__(llm, 'astream', AsyncMock(return_value=tokens()))
+        cache = LLMCache(llm=llm, enable_cache=False)
+        result = await cache.astream(PromptTemplate('Q: {q}'), q='x')
+        assert [t async for t in result] == ['tok1', 'tok2']
+
+    async def test_astream_exception_wrapped_in_model_error(self):
+        from llama_index.core.prompts import PromptTemplate
+        llm = _llm_with_spy()
+        object.__setattr__(llm, 'astream', AsyncMock(side_effect=RuntimeError('stream failure')))
+        cache = LLMCache(llm=llm, enable_cache=False)
+        with pytest.raises(ModelError, match='stream failure'):
+            await cache.astream(PromptTemplate('Q: {q}'), q='x')
+
+    async def test_astream_exception_during_iteration_wrapped_in_model_error(self):
+        from llama_index.core.prompts import PromptTemplate
+
+        async def tokens():
+            yield 'tok1'
+            raise RuntimeError('throttled mid-stream')
+
+        llm = _llm_with_spy()
+        object.__setattr__(llm, 'astream', AsyncMock(return_value=tokens()))
+        cache = LLMCache(llm=llm, enable_cache=False)
+        received = []
+        with pytest.raises(ModelError, match='throttled mid-stream'):
+            async for token in await cache.astream(PromptTemplate('Q: {q}'), q='x'):
+                received.append(token)
+        assert received == ['tok1']
+
+    async def test_astream_logs_assembled_response_when_verbose(self, caplog):
+        import logging
+        from llama_index.core.prompts import PromptTemplate
+
+        async def tokens():
+            for token in ['hello ', 'world']:
+                yield token
+
+        llm = _llm_with_spy()
+        object.__setattr__(llm, 'astream', AsyncMock(return_value=tokens()))
+        cache = LLMCache(llm=llm, enable_cache=False, verbose_response=True)
+        with caplog.at_level(logging.INFO, logger='graphrag_toolkit.lexical_graph.utils.llm_cache'):
+            result = [t async for t in await cache.astream(PromptTemplate('Q: {q}'), q='x')]
+        assert result == ['hello ', 'world']
+        assert any('hello world' in r.getMessage() for r in caplog.records)